@@ -126,13 +126,13 @@ class EcorpSettings(BaseSettings):
     # Timing (anti-detection)
     min_delay: float = Field(
         default=2.0,
-        description="Minimum delay between requests (seconds)",
+        description="Unused: search results are awaited instead (kept for existing configs)",
         ge=0.5,
         le=30.0,
     )
     max_delay: float = Field(
         default=5.0,
-        description="Maximum delay between requests (seconds)",
+        description="Longest wait for search results after submitting (seconds)",
         ge=1.0,
         le=60.0,
     )
@@ -144,7 +144,7 @@ class EcorpSettings(BaseSettings):
     )
     selector_retry_timeout: int = Field(
         default=5,
-        description="Timeout per selector in fallback chain (seconds)",
+        description="Timeout shared by a whole selector fallback chain (seconds)",
         ge=1,
         le=30,
     )
@@ -166,6 +166,25 @@ class EcorpSettings(BaseSettings):
         default=False,
         description="Use legacy scraper instead of new implementation",
     )
+    selector_stats_path: Path = Field(
+        default=Path.home() / ".adhs" / "selector_stats.json",
+        description="Per-selector hit counts used to reorder fallback chains",
+    )
+    max_workers: int = Field(
+        default=1,
+        description="Parallel Chrome sessions for ACC lookups (1 = sequential)",
+        ge=1,
+        le=8,
+    )
+    cache_path: Path = Field(
+        default=Path("Ecorp") / ".acc_cache.sqlite",
+        description="SQLite file holding ACC lookup results across runs",
+    )
+    cache_ttl_days: float = Field(
+        default=30.0,
+        description="Days before a cached ACC lookup is searched again",
+        ge=0,
+    )
     checkpoint_interval: int = Field(
         default=50,
         description="Save checkpoint every N records",
@@ -202,6 +221,18 @@ class EcorpSettings(BaseSettings):
         default=None,
         description="Custom user agent string (None = browser default)",
     )
+    chromedriver_path: Optional[str] = Field(
+        default=None,
+        description="Path to a chromedriver binary (None = resolve via webdriver-manager)",
+    )
+    profile_dir: Optional[Path] = Field(
+        default=None,
+        description="Base directory for per-worker Chrome profiles that keep logins between runs (None = throwaway profiles)",
+    )
+    block_resources: bool = Field(
+        default=True,
+        description="Skip image, font and analytics downloads (disable if a page needs images)",
+    )
 
 
 def get_ecorp_settings(**kwargs) -> EcorpSettings:
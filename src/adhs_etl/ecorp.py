@@ -9,7 +9,8 @@ Features:
 - Generate Ecorp Upload files from MCAO Complete data
 - Automated ACC entity lookup via Selenium
 - Progress checkpointing for interruption recovery
-- In-memory caching to avoid duplicate lookups
+- Lookup caching (SQLite, survives restarts) to avoid duplicate lookups
+- Optional parallel lookups over several Chrome sessions (AccPool)
 - Graceful handling of blank/missing owner names
 - Sequential record indexing (ECORP_INDEX_#)
 - Entity URL capture for reference tracking
@@ -19,16 +20,49 @@ Output Files:
 - Ecorp Complete: 93 columns (4 Upload + 1 Index + 1 Owner Type + 87 ACC + 1 URL)
   * ECORP_INDEX_# - Sequential record number (1, 2, 3...)
   * ECORP_URL - ACC entity detail page URL from ecorp.azcc.gov
+
+Waiting:
+- setup_driver sets implicitly_wait(0), so a missed lookup returns at once
+- All waits are explicit polls against a monotonic deadline
+  (find_element_with_fallback, wait_until); a fallback chain shares one
+  timeout instead of waiting once per selector
 """
 
+import re
+import os
+import sys
+import json
 import time
-import pickle
+import atexit
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from urllib.parse import urljoin, urlparse
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
-from bs4 import BeautifulSoup
+import requests
+import xlsxwriter
+from lxml import etree
+from lxml import html as lxml_html
+from rapidfuzz import fuzz, process
 
 # Import timestamp utilities for standardized naming
 try:
@@ -57,8 +91,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote.webelement import WebElement
 from webdriver_manager.chrome import ChromeDriverManager
 
 # Import monitoring and configuration
@@ -82,6 +115,22 @@ except ImportError:
     alert_rate_limited = None
     alert_consecutive_failures = None
 
+try:
+    # Optional: RE2 matches the indicator unions in linear time without
+    # backtracking; the stdlib engine is used when it is not installed
+    import re2 as indicator_re
+except ImportError:
+    indicator_re = re
+
+try:
+    # Optional: Arrow-backed strings run the bulk classifier's upper/contains
+    # in C++ kernels instead of a Python loop over object values
+    import pyarrow  # noqa: F401
+
+    ARROW_STRINGS = True
+except ImportError:
+    ARROW_STRINGS = False
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -111,7 +160,6 @@ SELECTORS = {
     "results_rows": [
         # New platform - standard HTML table
         (By.CSS_SELECTOR, "table tbody tr"),
-        (By.CSS_SELECTOR, "tbody tr"),
         # Angular Material fallbacks
         (By.CSS_SELECTOR, "mat-row"),
         (By.CSS_SELECTOR, ".mat-mdc-row"),
@@ -122,7 +170,6 @@ SELECTORS = {
     "table_cells": [
         # Standard HTML table cells
         (By.TAG_NAME, "td"),
-        (By.CSS_SELECTOR, "td"),
         # Angular Material fallbacks
         (By.CSS_SELECTOR, "mat-cell"),
         (By.CSS_SELECTOR, ".mat-mdc-cell"),
@@ -168,50 +215,477 @@ SELECTORS = {
     ],
     # Principal table (for manager/member extraction)
     "principal_table": [
-        (By.CSS_SELECTOR, "mat-table#grid_principalList"),
+        # ID lookup first - resolved from the browser's ID map, no tree walk
         (By.ID, "grid_principalList"),
+        (By.CSS_SELECTOR, "mat-table#grid_principalList"),
         (By.CSS_SELECTOR, "[id*='principal']"),
         (By.CSS_SELECTOR, "mat-table"),
         # Legacy fallback
         (By.CSS_SELECTOR, "table#grid_principalList"),
     ],
-    # Statutory agent section
+    # Statutory agent section (Material panel titles are matched by text in
+    # find_statutory_agent_section - CSS has no text selector)
     "statutory_agent": [
         (By.XPATH, "//*[contains(text(),'Statutory Agent')]"),
         (By.CSS_SELECTOR, "[class*='statutory']"),
-        (
-            By.CSS_SELECTOR,
-            "mat-expansion-panel:has(mat-panel-title:contains('Statutory'))",
-        ),
+    ],
+    # Routed content area holding the entity detail cards (DETAIL_HTML_JS
+    # falls back to <body> if none of these wraps the detail page)
+    "detail_container": [
+        (By.CSS_SELECTOR, "main"),
+        (By.CSS_SELECTOR, "[role='main']"),
+        (By.CSS_SELECTOR, "mat-sidenav-content"),
+        (By.CSS_SELECTOR, ".mat-drawer-content"),
+    ],
+    # Two-step login form (email first, then password on the next view)
+    "login_email": [
+        (By.CSS_SELECTOR, "input[type='email']"),
+        (By.CSS_SELECTOR, "input[formcontrolname='email']"),
+        (By.CSS_SELECTOR, "input[name='email']"),
+        (By.CSS_SELECTOR, "input[placeholder*='Email']"),
+        (By.CSS_SELECTOR, ".mat-mdc-form-field-infix input"),
+    ],
+    "login_password": [
+        (By.CSS_SELECTOR, "input[type='password']"),
+        (By.CSS_SELECTOR, "input[formcontrolname='password']"),
+        (By.CSS_SELECTOR, "input[name='password']"),
     ],
 }
 
-# CAPTCHA detection indicators (future-proofing)
-CAPTCHA_INDICATORS = [
-    "captcha",
-    "verify you're human",
-    "security check",
-    "recaptcha",
-    "hcaptcha",
-    "prove you're not a robot",
-    "challenge",
-    "i'm not a robot",
+
+class SelectorStats:
+    """Persisted hit counts for each fallback selector.
+
+    Successful lookups are counted per selector key and written to a small
+    JSON file every ``flush_every`` hits (and at exit). On the next import the
+    counts reorder each SELECTORS list so the variant the site actually serves
+    is probed first. Ties keep the shipped order.
+
+    Parameters
+    ----------
+    path : Path
+        JSON file holding ``{selector_key: {"<by>::<selector>": hits}}``
+    flush_every : int
+        Number of recorded hits between writes
+    """
+
+    def __init__(self, path: Path, flush_every: int = 100) -> None:
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self._hits: Dict[str, Dict[str, int]] = {}
+        self._pending = 0
+        # AccPool workers record hits concurrently
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _selector_id(selector: Tuple[str, str]) -> str:
+        return f"{selector[0]}::{selector[1]}"
+
+    def load(self) -> None:
+        """Read saved counts; a missing or unreadable file is ignored."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._hits = {
+                key: {sel: int(n) for sel, n in counts.items()}
+                for key, counts in data.items()
+                if isinstance(counts, dict)
+            }
+
+    def record(self, selector_key: Hashable, selector: Tuple[str, str]) -> None:
+        """Count a successful lookup, flushing every ``flush_every`` hits."""
+        if not isinstance(selector_key, str):
+            return
+        with self._lock:
+            counts = self._hits.setdefault(selector_key, {})
+            sel_id = self._selector_id(selector)
+            counts[sel_id] = counts.get(sel_id, 0) + 1
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write counts to disk if any hits were recorded since the last write."""
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._hits, f, indent=2, sort_keys=True)
+                tmp_path.replace(self.path)
+                self._pending = 0
+            except OSError as e:
+                logger.debug(f"Could not save selector stats to {self.path}: {e}")
+
+    def reorder(self, selectors: Dict[str, List[Tuple[str, str]]]) -> None:
+        """Sort each selector list in place by descending hit count."""
+        for key, chain in selectors.items():
+            counts = self._hits.get(key)
+            if counts:
+                chain.sort(key=lambda sel: -counts.get(self._selector_id(sel), 0))
+
+    def reset(self) -> None:
+        """Drop in-memory counts without touching the file."""
+        self._hits.clear()
+        self._pending = 0
+
+
+def _selector_stats_path() -> Path:
+    """Return the configured selector stats file (ADHS_ECORP_SELECTOR_STATS_PATH)."""
+    if get_ecorp_settings is not None:
+        try:
+            return get_ecorp_settings().selector_stats_path
+        except Exception as e:
+            logger.debug(f"Using default selector stats path: {e}")
+    return Path.home() / ".adhs" / "selector_stats.json"
+
+
+# Reorder the fallback chains by past hits before they are frozen below
+selector_stats = SelectorStats(_selector_stats_path())
+selector_stats.load()
+selector_stats.reorder(SELECTORS)
+atexit.register(selector_stats.flush)
+
+# Finds the dialog dismiss button in one round-trip: dialog action buttons
+# first, then any OK/Close button by trimmed text, then generic close buttons.
+# The text compare runs natively in the browser instead of via XPath probes.
+DISMISS_JS = """
+const inDialog = document.querySelector(
+    'mat-dialog-actions button, .mat-mdc-dialog-actions button');
+if (inDialog) return inDialog;
+const byText = [...document.querySelectorAll('button')]
+    .find(b => ['OK', 'Close'].includes(b.textContent.trim()));
+return byText
+    || document.querySelector('button.mat-mdc-button, button[class*="close"]')
+    || null;
+"""
+
+# Snapshots the results table in one round-trip. arguments[0] is the list of
+# row selectors in priority order; the first one with matches is used. Each
+# row becomes {cells, link, has_link}, where link is the absolute href or the
+# Angular routerlink of the first anchor in the name cell (or the row).
+SCRAPE_JS = """
+const rowSelectors = arguments[0];
+for (const selector of rowSelectors) {
+    const rows = [...document.querySelectorAll(selector)];
+    if (!rows.length) continue;
+    return JSON.stringify({
+        selector: selector,
+        rows: rows.map(tr => {
+            const cells = [...tr.querySelectorAll('td, mat-cell, .mat-mdc-cell')];
+            const link = (cells.length && cells[0].querySelector('a'))
+                || tr.querySelector('a');
+            return {
+                cells: cells.map(c => c.innerText.trim()),
+                link: link ? (link.href || link.getAttribute('routerlink')) : null,
+                has_link: !!link,
+            };
+        }),
+    });
+}
+return JSON.stringify({selector: null, rows: []});
+"""
+
+# Rendered-and-visible test shared by the scripts below (approximates
+# WebElement.is_displayed without a WebDriver call per element)
+_SHOWN_JS = """
+const shown = (el) => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0
+        && getComputedStyle(el).visibility !== 'hidden';
+};
+"""
+
+# Returns the first visible, enabled element matched by a selector chain whose
+# text contains none of the excluded words, or null.
+# arguments: [[kind, selector], ...], [lowercase excluded words].
+CLICKABLE_JS = (
+    _SHOWN_JS
+    + """
+const [selectors, exclude] = arguments;
+for (const [kind, selector] of selectors) {
+    let found = [];
+    try {
+        if (kind === 'xpath') {
+            const result = document.evaluate(selector, document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let j = 0; j < result.snapshotLength; j++) {
+                found.push(result.snapshotItem(j));
+            }
+        } else {
+            found = document.querySelectorAll(
+                kind === 'id' ? '#' + CSS.escape(selector) : selector);
+        }
+    } catch (e) {
+        continue;
+    }
+    for (const el of found) {
+        if (el.disabled || !shown(el)) continue;
+        const text = (el.innerText || '').toLowerCase();
+        if (!exclude.some(word => text.includes(word))) return el;
+    }
+}
+return null;
+"""
+)
+
+# Returns the visible elements matching a CSS selector, optionally limited to
+# inputs whose type is in arguments[1].
+VISIBLE_JS = (
+    _SHOWN_JS
+    + """
+const [selector, types] = arguments;
+return [...document.querySelectorAll(selector)]
+    .filter(el => shown(el) && (!types || types.includes(el.type)));
+"""
+)
+
+SelectorChain = Tuple[Tuple[str, str], ...]
+
+# Frozen copies of each fallback chain, bound once at import. Scrape loops pass
+# these tuples straight to the fallback helpers instead of indexing SELECTORS.
+_SELECTOR_CHAINS: Dict[str, SelectorChain] = {
+    key: tuple(chain) for key, chain in SELECTORS.items()
+}
+
+# The legacy eCorp inputs never render on Arizona Business Connect, so each
+# host gets a search_input chain without the other platform's selectors
+ABC_HOST = "arizonabusinesscenter.azcc.gov"
+_LEGACY_SEARCH_INPUT = frozenset(
+    {
+        (By.CSS_SELECTOR, "input[placeholder*='Entity']"),
+        (By.CSS_SELECTOR, "input[placeholder*='Search for an Entity Name']"),
+    }
+)
+_host_chains = {
+    "search_input_abc": [
+        sel for sel in SELECTORS["search_input"] if sel not in _LEGACY_SEARCH_INPUT
+    ],
+    "search_input_legacy": [
+        sel for sel in SELECTORS["search_input"] if sel in _LEGACY_SEARCH_INPUT
+    ],
+}
+selector_stats.reorder(_host_chains)
+_SELECTOR_CHAINS.update((key, tuple(chain)) for key, chain in _host_chains.items())
+del _host_chains
+
+_SEL_SEARCH_INPUT = _SELECTOR_CHAINS["search_input"]
+_SEL_SEARCH_INPUT_ABC = _SELECTOR_CHAINS["search_input_abc"]
+_SEL_SEARCH_INPUT_LEGACY = _SELECTOR_CHAINS["search_input_legacy"]
+_SEL_RESULTS_ROWS = _SELECTOR_CHAINS["results_rows"]
+_SEL_TABLE_CELLS = _SELECTOR_CHAINS["table_cells"]
+_SEL_ENTITY_LINK = _SELECTOR_CHAINS["entity_link"]
+_SEL_NO_RESULTS = _SELECTOR_CHAINS["no_results"]
+_SEL_DIALOG_DISMISS = _SELECTOR_CHAINS["dialog_dismiss"]
+_SEL_DETAIL_LOADED = _SELECTOR_CHAINS["detail_loaded"]
+_SEL_PRINCIPAL_TABLE = _SELECTOR_CHAINS["principal_table"]
+_SEL_STATUTORY_AGENT = _SELECTOR_CHAINS["statutory_agent"]
+_SEL_DETAIL_CONTAINER = _SELECTOR_CHAINS["detail_container"]
+_SEL_LOGIN_EMAIL = _SELECTOR_CHAINS["login_email"]
+_SEL_LOGIN_PASSWORD = _SELECTOR_CHAINS["login_password"]
+
+# Row selectors handed to SCRAPE_JS, in chain priority order
+_RESULTS_ROW_CSS = [
+    selector for by_type, selector in _SEL_RESULTS_ROWS if by_type == By.CSS_SELECTOR
 ]
 
+# "Business Search" submit button candidates, tried in order
+_SEARCH_BUTTON_SELECTORS = (
+    (By.XPATH, "//button[normalize-space()='Business Search']"),
+    (By.XPATH, "//button[contains(text(), 'Business Search')]"),
+    (By.XPATH, "//button[contains(text(), 'Search')]"),
+    (By.CSS_SELECTOR, "button[type='submit']"),
+    (By.CSS_SELECTOR, "button.mat-mdc-raised-button"),
+)
+
+# Next/Continue button on the email step of the two-step login
+_NEXT_BUTTON_SELECTORS = (
+    (By.XPATH, "//button[normalize-space()='Next']"),
+    (By.XPATH, "//button[contains(text(), 'Next')]"),
+    (By.XPATH, "//button[contains(text(), 'Continue')]"),
+    (By.CSS_SELECTOR, "button.mat-mdc-raised-button"),
+    (By.CSS_SELECTOR, "button[type='submit']"),
+    (By.CSS_SELECTOR, "button[color='primary']"),
+)
+
+# Authenticate/Submit button on the 2FA page
+_AUTH_BUTTON_SELECTORS = (
+    (By.XPATH, "//button[normalize-space()='Authenticate']"),
+    (By.XPATH, "//button[contains(text(), 'Authenticate')]"),
+    (By.XPATH, "//button[contains(text(), 'Verify')]"),
+    (By.XPATH, "//button[contains(text(), 'Submit')]"),
+    (By.CSS_SELECTOR, "button[type='submit']"),
+    (By.CSS_SELECTOR, "button.mat-mdc-raised-button"),
+)
+
+# Frozen chains keep their key name for logging and selector learning
+_CHAIN_KEYS: Dict[int, str] = {
+    id(chain): key for key, chain in _SELECTOR_CHAINS.items()
+}
+
+
+# XPath fallbacks compiled once for checks against an already-fetched
+# page_source, so repeated detection passes only pay for matching.
+_XPATH_CACHE: Dict[str, etree.XPath] = {
+    selector: etree.XPath(selector)
+    for chain in _SELECTOR_CHAINS.values()
+    for by_type, selector in chain
+    if by_type == By.XPATH
+}
+
+
+# Comma-joined CSS fallbacks per key, used when a chain has to be probed
+# through WebDriver instead of FIND_JS. One querySelectorAll over the union
+# tells whether any CSS fallback can match, so misses cost a single round-trip
+# instead of one per selector. Keys with fewer than two CSS selectors gain
+# nothing.
+def _css_union(chain: SelectorChain) -> Optional[str]:
+    """Return the comma-joined CSS selectors in ``chain``, if worth combining."""
+    css = [selector for by_type, selector in chain if by_type == By.CSS_SELECTOR]
+    return ", ".join(css) if len(css) > 1 else None
+
+
+_CSS_UNIONS: Dict[str, str] = {
+    key: _css_union(chain)
+    for key, chain in _SELECTOR_CHAINS.items()
+    if _css_union(chain)
+}
+
+# Indicator phrases are lowercased and interned once at import. Callers doing
+# plain substring checks must lowercase the haystack once; the compiled
+# CAPTCHA_RE / RATE_LIMIT_RE below are case-insensitive and need no lowering.
+
+# CAPTCHA detection indicators (future-proofing)
+CAPTCHA_INDICATORS = tuple(
+    sys.intern(phrase.lower())
+    for phrase in (
+        "captcha",
+        "verify you're human",
+        "security check",
+        "recaptcha",
+        "hcaptcha",
+        "prove you're not a robot",
+        "challenge",
+        "i'm not a robot",
+    )
+)
+
 # Rate limit / blocking indicators - context-aware patterns
 # These should appear in visible error messages, not just anywhere in page source
-RATE_LIMIT_INDICATORS = [
-    "too many requests",
-    "rate limit exceeded",
-    "you have been temporarily blocked",
-    "access denied",
-    "request blocked",
-    "please try again later",
-    "http error 429",
-    "http error 503",
-    "service unavailable",
-    "temporarily unavailable",
-]
+RATE_LIMIT_INDICATORS = tuple(
+    sys.intern(phrase.lower())
+    for phrase in (
+        "too many requests",
+        "rate limit exceeded",
+        "you have been temporarily blocked",
+        "access denied",
+        "request blocked",
+        "please try again later",
+        "http error 429",
+        "http error 503",
+        "service unavailable",
+        "temporarily unavailable",
+    )
+)
+
+
+def _prefix_trie_pattern(phrases: Sequence[str], lowercase: bool = True) -> str:
+    """Build a prefix-factored alternation that detects any of ``phrases``.
+
+    Phrases sharing a prefix share one branch (``http error (?:429|503)``), so
+    the regex engine rejects most text positions on the first character
+    instead of trying every phrase. Only presence matters, so phrases that
+    contain another phrase are dropped and branches stop at the shortest
+    complete phrase. Phrases are lowercased unless ``lowercase`` is False,
+    in which case they are matched exactly as given.
+    """
+    unique = {phrase.lower() if lowercase else phrase for phrase in phrases}
+    phrases = [
+        phrase
+        for phrase in unique
+        if not any(other != phrase and other in phrase for other in unique)
+    ]
+
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        if "" in node:
+            return ""
+        branches = [
+            indicator_re.escape(char) + build(node[char]) for char in sorted(node)
+        ]
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+def _compile_indicator_union(indicators: Sequence[str]):
+    """Compile indicator phrases into one case-insensitive alternation."""
+    return indicator_re.compile("(?i)" + _prefix_trie_pattern(indicators))
+
+
+# Page title words that mean the request was refused (matched lowercased)
+_ERROR_TITLE_WORDS = ("error", "blocked", "denied", "unavailable")
+
+# Login page indicators
+LOGIN_INDICATORS = tuple(
+    sys.intern(phrase.lower())
+    for phrase in (
+        "online services login",
+        "email address",
+        "password",
+        "register here",
+        "don't have an account",
+        "sign in",
+        "log in to your account",
+    )
+)
+
+# Search page indicators (if present, we're NOT on login)
+SEARCH_PAGE_INDICATORS = tuple(
+    sys.intern(phrase.lower())
+    for phrase in (
+        "entity search",
+        "search for",
+        "entity name",
+        "business search",
+        "corporation search",
+    )
+)
+
+# Two-factor authentication page indicators
+TFA_INDICATORS = tuple(
+    sys.intern(phrase.lower())
+    for phrase in (
+        "two-factor authentication",
+        "verification code",
+        "code has been sent",
+        "enter the code",
+        "authenticate",
+        "otp",
+    )
+)
+
+# Precompiled once at import; a single C-level scan replaces the per-phrase
+# Python loop and avoids lowercasing multi-MB page sources
+CAPTCHA_RE = _compile_indicator_union(CAPTCHA_INDICATORS)
+RATE_LIMIT_RE = _compile_indicator_union(RATE_LIMIT_INDICATORS)
+LOGIN_RE = _compile_indicator_union(LOGIN_INDICATORS)
+SEARCH_PAGE_RE = _compile_indicator_union(SEARCH_PAGE_INDICATORS)
+TFA_RE = _compile_indicator_union(TFA_INDICATORS)
+ERROR_TITLE_RE = _compile_indicator_union(_ERROR_TITLE_WORDS)
 
 
 # ============================================================================
@@ -219,25 +693,302 @@ RATE_LIMIT_INDICATORS = [
 # ============================================================================
 
 
+class SelectorResolver:
+    """Remember which fallback selector last matched for each selector key.
+
+    A scraping run targets a single site whose layout is stable, so once a
+    fallback index has matched it is tried first on later lookups instead of
+    re-probing every selector that is known to miss.
+    """
+
+    def __init__(self) -> None:
+        self._last_success: Dict[Hashable, int] = {}
+
+    def ordered(
+        self, selector_key: Hashable, selectors: Sequence[Tuple[str, str]]
+    ) -> List[Tuple[int, Tuple[str, str]]]:
+        """Return ``(index, selector)`` pairs with the last-good index first."""
+        last_idx = self._last_success.get(selector_key)
+        if last_idx is None or last_idx >= len(selectors):
+            return list(enumerate(selectors))
+        return [(last_idx, selectors[last_idx])] + [
+            (idx, selector) for idx, selector in enumerate(selectors) if idx != last_idx
+        ]
+
+    def learned(self, selector_key: Hashable) -> Optional[int]:
+        """Return the last-good index for ``selector_key``, if any."""
+        return self._last_success.get(selector_key)
+
+    def record_success(self, selector_key: Hashable, idx: int) -> None:
+        """Mark ``idx`` as the selector that matched for ``selector_key``."""
+        self._last_success[selector_key] = idx
+
+    def reset(self) -> None:
+        """Forget all learned selector indexes."""
+        self._last_success.clear()
+
+
+# Shared resolver used by the fallback helpers below
+selector_resolver = SelectorResolver()
+
+
+def _resolve_selector_chain(
+    selector_key: Union[str, SelectorChain],
+) -> Tuple[Hashable, SelectorChain]:
+    """Return ``(key, chain)`` for a SELECTORS key or a selector tuple."""
+    if isinstance(selector_key, tuple):
+        return _CHAIN_KEYS.get(id(selector_key), selector_key), selector_key
+    return selector_key, _SELECTOR_CHAINS.get(selector_key, ())
+
+
+def _probe_order(
+    search_context, selector_key: Hashable, selectors: SelectorChain
+) -> Iterator[Tuple[int, Tuple[str, str]]]:
+    """Yield the ``(index, selector)`` pairs worth probing, in priority order.
+
+    Before the first CSS probe (other than a learned last-good selector) the
+    key's CSS union is checked once; if nothing matches it, every CSS fallback
+    is skipped and only the non-CSS locators are tried. Priority order is kept
+    either way, so first-match semantics are unchanged.
+    """
+    css_union = _CSS_UNIONS.get(selector_key)
+    learned = selector_resolver.learned(selector_key) is not None
+    skip_css = False
+
+    for pos, (idx, selector) in enumerate(
+        selector_resolver.ordered(selector_key, selectors)
+    ):
+        if selector[0] == By.CSS_SELECTOR:
+            if css_union and not (learned and pos == 0):
+                try:
+                    skip_css = not search_context.find_elements(
+                        By.CSS_SELECTOR, css_union
+                    )
+                except Exception:
+                    skip_css = False
+                css_union = None
+            if skip_css:
+                continue
+        yield idx, selector
+
+
+def page_source_matches(
+    page_source: str, selector_key: Union[str, SelectorChain]
+) -> bool:
+    """Check a chain's XPath selectors against serialized page HTML.
+
+    Runs locally on ``page_source`` with the precompiled expressions in
+    ``_XPATH_CACHE``; no WebDriver calls are made. CSS selectors in the chain
+    are ignored.
+
+    Parameters
+    ----------
+    page_source : str
+        HTML from ``driver.page_source``
+    selector_key : str or tuple
+        Key in SELECTORS dict, or a frozen selector chain
+
+    Returns
+    -------
+    bool
+        True if any XPath selector in the chain matches
+    """
+    _, selectors = _resolve_selector_chain(selector_key)
+    if not page_source:
+        return False
+    try:
+        tree = lxml_html.fromstring(page_source)
+    except (etree.ParserError, ValueError):
+        return False
+
+    for by_type, selector in selectors:
+        if by_type != By.XPATH:
+            continue
+        xpath = _XPATH_CACHE.get(selector)
+        if xpath is None:
+            xpath = _XPATH_CACHE[selector] = etree.XPath(selector)
+        if xpath(tree):
+            return True
+    return False
+
+
+def search_input_chain(url: str) -> SelectorChain:
+    """Return the search_input chain specialized for the host of ``url``.
+
+    Arizona Business Connect skips the legacy eCorp selectors, the legacy
+    eCorp host only tries those, and any other host gets the full chain.
+    """
+    host = (urlparse(url).hostname or "").lower()
+    if host == ABC_HOST or host.endswith("." + ABC_HOST):
+        return _SEL_SEARCH_INPUT_ABC
+    if host == "ecorp.azcc.gov":
+        return _SEL_SEARCH_INPUT_LEGACY
+    return _SEL_SEARCH_INPUT
+
+
+# Seconds between polls while waiting for a selector chain
+SELECTOR_POLL_INTERVAL = 0.25
+
+
+def wait_until(condition: Callable[[], Any], timeout: float) -> Any:
+    """Poll ``condition`` until it returns a truthy value or time runs out.
+
+    Parameters
+    ----------
+    condition : Callable[[], Any]
+        Zero-argument check, called at least once
+    timeout : float
+        Maximum seconds to keep polling
+
+    Returns
+    -------
+    Any
+        The first truthy result, or None on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = condition()
+        remaining = deadline - time.monotonic()
+        if result or remaining <= 0:
+            return result or None
+        # Never sleep past the deadline
+        time.sleep(min(SELECTOR_POLL_INTERVAL, remaining))
+
+
+# Evaluates a whole fallback chain in the browser and returns
+# [position, elements] for the first selector with matches ([-1, []] on a
+# miss). arguments: [[kind, selector], ...], optional root element, findAll.
+FIND_JS = """
+const [selectors, root, findAll] = arguments;
+const scope = root || document;
+for (let i = 0; i < selectors.length; i++) {
+    const [kind, selector] = selectors[i];
+    let found = [];
+    try {
+        if (kind === 'xpath') {
+            if (findAll) {
+                const result = document.evaluate(selector, scope, null,
+                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (let j = 0; j < result.snapshotLength; j++) {
+                    found.push(result.snapshotItem(j));
+                }
+            } else {
+                const node = document.evaluate(selector, scope, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                if (node) found = [node];
+            }
+        } else if (kind === 'id' && !root) {
+            const node = document.getElementById(selector);
+            if (node) found = [node];
+        } else {
+            const css = kind === 'id' ? '#' + CSS.escape(selector) : selector;
+            found = findAll
+                ? [...scope.querySelectorAll(css)]
+                : [scope.querySelector(css)].filter(Boolean);
+        }
+    } catch (e) {
+        continue;
+    }
+    if (found.length) return [i, found];
+}
+return [-1, []];
+"""
+
+# How each locator type is evaluated by FIND_JS (others use WebDriver lookups)
+_FIND_JS_KINDS = {
+    By.CSS_SELECTOR: "css",
+    By.TAG_NAME: "css",
+    By.XPATH: "xpath",
+    By.ID: "id",
+}
+
+
+def _find_in_browser(
+    driver,
+    selector_key: Hashable,
+    selectors: SelectorChain,
+    root: Optional[WebElement] = None,
+    find_all: bool = False,
+) -> Optional[Tuple[int, List[WebElement]]]:
+    """Evaluate a fallback chain with a single FIND_JS call.
+
+    Returns ``(index, elements)`` for the first matching selector, with an
+    index of -1 and no elements on a miss, or None if the chain cannot be
+    run as a script (no driver, unsupported locator, script error).
+    """
+    ordered = selector_resolver.ordered(selector_key, selectors)
+    try:
+        spec = [
+            [_FIND_JS_KINDS[by_type], selector] for _, (by_type, selector) in ordered
+        ]
+    except KeyError:
+        return None
+
+    # Lookups never change the page, so bypass CachedDriver's invalidation
+    if isinstance(driver, CachedDriver):
+        driver = driver.wrapped_driver
+    try:
+        result = driver.execute_script(FIND_JS, spec, root, find_all)
+        pos, elements = result
+    except Exception:
+        return None
+    if pos < 0 or not elements:
+        return -1, []
+    return ordered[pos][0], list(elements)
+
+
+def _first_match(
+    driver,
+    search_context,
+    selector_key: Hashable,
+    selectors: SelectorChain,
+    find_all: bool = False,
+) -> Optional[Tuple[int, List[WebElement]]]:
+    """Return ``(index, elements)`` for the first selector with matches.
+
+    The chain is evaluated in one FIND_JS round-trip when possible; otherwise
+    each selector is probed through WebDriver in priority order.
+    """
+    root = None if search_context is driver else search_context
+    found = _find_in_browser(driver, selector_key, selectors, root, find_all)
+    if found is not None:
+        return found if found[1] else None
+
+    for idx, (by_type, selector) in _probe_order(
+        search_context, selector_key, selectors
+    ):
+        try:
+            elements = search_context.find_elements(by_type, selector)
+        except Exception:
+            continue
+        if elements:
+            return idx, elements
+    return None
+
+
 def find_element_with_fallback(
     driver: webdriver.Chrome,
-    selector_key: str,
+    selector_key: Union[str, SelectorChain],
     timeout: int = 5,
     raise_on_failure: bool = True,
-    parent=None,
-) -> Optional[any]:
+    parent: Optional[WebElement] = None,
+) -> Optional[WebElement]:
     """Find element using fallback selector chain.
 
-    Tries each selector in SELECTORS[selector_key] until one succeeds.
+    Tries each selector in SELECTORS[selector_key] until one succeeds. The
+    whole chain is evaluated in the browser with one script call per poll;
+    if that is not possible the selectors are probed one by one. The
+    selector that matched most recently for this key is tried first.
 
     Parameters
     ----------
     driver : webdriver.Chrome
         Selenium WebDriver instance
-    selector_key : str
-        Key in SELECTORS dict (e.g., "search_input", "results_rows")
+    selector_key : str or tuple
+        Key in SELECTORS dict (e.g., "search_input", "results_rows"), or a
+        frozen selector chain such as ``_SEL_SEARCH_INPUT``
     timeout : int
-        Timeout per selector attempt (seconds)
+        Total time to wait for any selector in the chain (seconds)
     raise_on_failure : bool
         If True, raise exception when all selectors fail
     parent : WebElement, optional
@@ -253,30 +1004,44 @@ def find_element_with_fallback(
     Exception
         If raise_on_failure=True and no selector succeeds
     """
-    selectors = SELECTORS.get(selector_key, [])
+    selector_key, selectors = _resolve_selector_chain(selector_key)
     if not selectors:
         raise ValueError(f"Unknown selector key: {selector_key}")
 
-    _search_context = parent if parent else driver  # noqa: F841 - kept for debugging
     last_error = None
 
-    for idx, (by_type, selector) in enumerate(selectors):
-        try:
-            if parent:
-                # Direct find from parent element
-                element = parent.find_element(by_type, selector)
-            else:
-                # Use WebDriverWait for driver-level search
-                element = WebDriverWait(driver, timeout).until(
-                    EC.presence_of_element_located((by_type, selector))
-                )
+    if parent:
+        # Direct find from parent element - no waiting
+        match = _first_match(driver, parent, selector_key, selectors)
+    else:
+        # Driver-level search: one deadline shares the timeout across the
+        # whole chain, testing every selector on each poll.
+        match = None
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                match = _first_match(driver, driver, selector_key, selectors)
+            except Exception as e:
+                last_error = e
+            remaining = deadline - time.monotonic()
+            if match or remaining <= 0:
+                break
+            # Never sleep past the deadline
+            time.sleep(min(SELECTOR_POLL_INTERVAL, remaining))
+        if not match and last_error is None:
+            last_error = f"timed out after {timeout}s"
+
+    if match:
+        idx, elements = match
+        selector_resolver.record_success(selector_key, idx)
+        selector_stats.record(selector_key, selectors[idx])
+        # Guarded so the hot path skips building the message when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Found '{selector_key}' using selector {idx + 1}/{len(selectors)}: {selector}"
+                f"Found '{selector_key}' using selector {idx + 1}/{len(selectors)}: "
+                f"{selectors[idx][1]}"
             )
-            return element
-        except Exception as e:
-            last_error = e
-            continue
+        return elements[0]
 
     if raise_on_failure:
         raise Exception(
@@ -288,17 +1053,17 @@ def find_element_with_fallback(
 
 def find_elements_with_fallback(
     driver: webdriver.Chrome,
-    selector_key: str,
-    parent=None,
-) -> List[any]:
+    selector_key: Union[str, SelectorChain],
+    parent: Optional[WebElement] = None,
+) -> List[WebElement]:
     """Find multiple elements using fallback selector chain.
 
     Parameters
     ----------
     driver : webdriver.Chrome
         Selenium WebDriver instance
-    selector_key : str
-        Key in SELECTORS dict
+    selector_key : str or tuple
+        Key in SELECTORS dict, or a frozen selector chain
     parent : WebElement, optional
         Parent element to search within (uses driver if None)
 
@@ -307,28 +1072,476 @@ def find_elements_with_fallback(
     List[WebElement]
         List of found elements (may be empty)
     """
-    selectors = SELECTORS.get(selector_key, [])
+    selector_key, selectors = _resolve_selector_chain(selector_key)
     search_context = parent if parent else driver
 
-    for idx, (by_type, selector) in enumerate(selectors):
+    match = _first_match(driver, search_context, selector_key, selectors, find_all=True)
+    if not match:
+        return []
+
+    idx, elements = match
+    selector_resolver.record_success(selector_key, idx)
+    selector_stats.record(selector_key, selectors[idx])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Found {len(elements)} '{selector_key}' elements using "
+            f"selector {idx + 1}/{len(selectors)}: {selectors[idx][1]}"
+        )
+    return elements
+
+
+def find_statutory_agent_section(
+    driver: webdriver.Chrome, timeout: int = 2
+) -> Optional[WebElement]:
+    """Find the Statutory Agent section on an entity detail page.
+
+    Angular Material renders each detail section as an expansion panel, so the
+    panel titles are fetched with a simple selector and filtered by text
+    locally. The generic ``statutory_agent`` chain is used if no panel matches.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance
+    timeout : int
+        Timeout for the fallback selector chain (seconds)
+
+    Returns
+    -------
+    Optional[WebElement]
+        Section title element, or None if not found
+    """
+    try:
+        titles = driver.find_elements(
+            By.CSS_SELECTOR, "mat-expansion-panel mat-panel-title"
+        )
+    except Exception:
+        titles = []
+
+    for title in titles:
+        if title.text.strip().startswith("Statutory"):
+            return title
+
+    return find_element_with_fallback(
+        driver, _SEL_STATUTORY_AGENT, timeout=timeout, raise_on_failure=False
+    )
+
+
+def snapshot_results_rows(
+    driver: webdriver.Chrome,
+) -> Tuple[Optional[str], List[Dict[str, object]]]:
+    """Read the whole results table with a single script call.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance
+
+    Returns
+    -------
+    Tuple[Optional[str], List[Dict[str, object]]]
+        The row selector that matched (None if no rows) and one dict per row
+        with ``cells`` (stripped cell texts), ``link`` (href or routerlink of
+        the entity link, or None) and ``has_link``. Falls back to the Selenium
+        selector helpers if the script cannot run.
+    """
+    try:
+        snapshot = json.loads(driver.execute_script(SCRAPE_JS, _RESULTS_ROW_CSS))
+        row_selector = snapshot["selector"]
+        rows = snapshot["rows"]
+    except Exception as e:
+        logger.debug(f"Results snapshot script failed, using selectors: {e}")
+    else:
+        if row_selector is not None:
+            idx = _SEL_RESULTS_ROWS.index((By.CSS_SELECTOR, row_selector))
+            selector_resolver.record_success("results_rows", idx)
+            selector_stats.record("results_rows", _SEL_RESULTS_ROWS[idx])
+        return row_selector, rows
+
+    rows = []
+    for row in find_elements_with_fallback(driver, _SEL_RESULTS_ROWS):
+        cols = find_elements_with_fallback(driver, _SEL_TABLE_CELLS, parent=row)
+        link = None
+        if cols:
+            link = find_element_with_fallback(
+                driver, _SEL_ENTITY_LINK, parent=cols[0], raise_on_failure=False
+            )
+        if not link:
+            link = find_element_with_fallback(
+                driver, _SEL_ENTITY_LINK, parent=row, raise_on_failure=False
+            )
+        rows.append(
+            {
+                "cells": [col.text.strip() for col in cols],
+                "link": (
+                    link.get_attribute("href") or link.get_attribute("routerlink")
+                    if link
+                    else None
+                ),
+                "has_link": link is not None,
+            }
+        )
+
+    learned = selector_resolver.learned("results_rows")
+    row_selector = (
+        _SEL_RESULTS_ROWS[learned][1] if rows and learned is not None else None
+    )
+    return row_selector, rows
+
+
+def find_result_link(
+    driver: webdriver.Chrome, row_selector: str, row_idx: int
+) -> Optional[WebElement]:
+    """Return the entity link element of a snapshotted results row.
+
+    Only needed for Angular router links, which must be clicked rather than
+    opened by URL.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance
+    row_selector : str
+        CSS selector returned by ``snapshot_results_rows``
+    row_idx : int
+        Index of the row in the snapshot
+
+    Returns
+    -------
+    Optional[WebElement]
+        Link element, or None if the row is gone
+    """
+    rows = driver.find_elements(By.CSS_SELECTOR, row_selector)
+    if row_idx >= len(rows):
+        return None
+    row = rows[row_idx]
+    cols = find_elements_with_fallback(driver, _SEL_TABLE_CELLS, parent=row)
+    link = None
+    if cols:
+        link = find_element_with_fallback(
+            driver, _SEL_ENTITY_LINK, parent=cols[0], raise_on_failure=False
+        )
+    return link or find_element_with_fallback(
+        driver, _SEL_ENTITY_LINK, parent=row, raise_on_failure=False
+    )
+
+
+def dismiss_dialog(driver: webdriver.Chrome, timeout: int = 2) -> bool:
+    """Click the dismiss button of an open Material dialog.
+
+    Runs DISMISS_JS to locate the button with a single script call and only
+    falls back to the ``dialog_dismiss`` selector chain (with its wait) when
+    the script finds nothing.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance
+    timeout : int
+        Timeout for the fallback selector chain (seconds)
+
+    Returns
+    -------
+    bool
+        True if a dismiss button was clicked
+    """
+    try:
+        button = driver.execute_script(DISMISS_JS)
+    except Exception as e:
+        logger.debug(f"Dismiss script failed: {e}")
+        button = None
+
+    if not button:
+        button = find_element_with_fallback(
+            driver, _SEL_DIALOG_DISMISS, timeout=timeout, raise_on_failure=False
+        )
+    if not button:
+        return False
+
+    button.click()
+    if isinstance(driver, CachedDriver):
+        driver.invalidate()
+    return True
+
+
+def find_clickable(
+    driver: webdriver.Chrome,
+    selectors: Sequence[Tuple[str, str]],
+    exclude: Sequence[str] = (),
+) -> Optional[WebElement]:
+    """Find the first visible, enabled element matched by ``selectors``.
+
+    The whole chain is checked with one CLICKABLE_JS call instead of an
+    ``is_displayed``/``is_enabled`` round-trip per candidate. WebDriver
+    probing is used only if the script cannot run.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance
+    selectors : Sequence[Tuple[str, str]]
+        ``(By, selector)`` pairs in priority order
+    exclude : Sequence[str]
+        Lowercase words; candidates whose text contains one are skipped
+
+    Returns
+    -------
+    Optional[WebElement]
+        Matching element, or None if nothing is clickable
+    """
+    spec = [[_FIND_JS_KINDS.get(by_type), selector] for by_type, selector in selectors]
+    if all(kind for kind, _ in spec):
+        script_driver = (
+            driver.wrapped_driver if isinstance(driver, CachedDriver) else driver
+        )
         try:
-            elements = search_context.find_elements(by_type, selector)
-            if elements:
-                logger.debug(
-                    f"Found {len(elements)} '{selector_key}' elements using "
-                    f"selector {idx + 1}/{len(selectors)}: {selector}"
-                )
-                return elements
+            return script_driver.execute_script(CLICKABLE_JS, spec, list(exclude))
+        except Exception as e:
+            logger.debug(f"Clickable script failed: {e}")
+
+    for by_type, selector in selectors:
+        try:
+            for element in driver.find_elements(by_type, selector):
+                if element.is_displayed() and element.is_enabled():
+                    text = element.text.lower()
+                    if not any(word in text for word in exclude):
+                        return element
         except Exception:
             continue
+    return None
+
+
+def find_visible(
+    driver: webdriver.Chrome, css: str, types: Optional[Sequence[str]] = None
+) -> List[WebElement]:
+    """Return the visible elements matching ``css`` with one VISIBLE_JS call.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance
+    css : str
+        CSS selector
+    types : Optional[Sequence[str]]
+        If given, only inputs whose ``type`` is listed are returned
+
+    Returns
+    -------
+    List[WebElement]
+        Visible matches in document order
+    """
+    script_driver = (
+        driver.wrapped_driver if isinstance(driver, CachedDriver) else driver
+    )
+    try:
+        return list(
+            script_driver.execute_script(
+                VISIBLE_JS, css, list(types) if types is not None else None
+            )
+            or []
+        )
+    except Exception as e:
+        logger.debug(f"Visibility script failed: {e}")
+
+    try:
+        elements = driver.find_elements(By.CSS_SELECTOR, css)
+    except Exception:
+        return []
+    return [
+        element
+        for element in elements
+        if element.is_displayed()
+        and (types is None or element.get_attribute("type") in types)
+    ]
+
+
+class CachedDriver:
+    """WebDriver proxy that serializes ``page_source`` once per page.
+
+    ``driver.page_source`` ships the whole DOM over the WebDriver wire, so the
+    detection and parsing helpers share one copy until the page changes.
+    Navigation, script execution and window switches made through the proxy
+    drop the cached copy automatically; element clicks bypass the proxy, so
+    callers must call ``invalidate()`` after clicking. Everything else is
+    forwarded to the wrapped driver.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance to wrap
+    """
+
+    def __init__(self, driver: webdriver.Chrome) -> None:
+        self._driver = driver
+        self._page_source: Optional[str] = None
+        self._lowered_body: Optional[Tuple[float, str]] = None
+
+    @property
+    def wrapped_driver(self) -> webdriver.Chrome:
+        """The underlying Selenium driver."""
+        return self._driver
+
+    @property
+    def page_source(self) -> str:
+        if self._page_source is None:
+            self._page_source = self._driver.page_source
+        return self._page_source
+
+    @property
+    def switch_to(self):
+        self.invalidate()
+        return self._driver.switch_to
+
+    def invalidate(self) -> None:
+        """Forget the cached page source and body text (call after clicks)."""
+        self._page_source = None
+        self._lowered_body = None
+
+    def prime(self, page_source: str) -> None:
+        """Seed the cache with page HTML fetched by another call."""
+        self._page_source = page_source
+
+    def get(self, url: str) -> None:
+        self.invalidate()
+        self._driver.get(url)
+
+    def back(self) -> None:
+        self.invalidate()
+        self._driver.back()
+
+    def forward(self) -> None:
+        self.invalidate()
+        self._driver.forward()
+
+    def refresh(self) -> None:
+        self.invalidate()
+        self._driver.refresh()
+
+    def close(self) -> None:
+        self.invalidate()
+        self._driver.close()
+
+    def execute_script(self, script: str, *args):
+        self.invalidate()
+        return self._driver.execute_script(script, *args)
+
+    def execute_async_script(self, script: str, *args):
+        self.invalidate()
+        return self._driver.execute_async_script(script, *args)
+
+    def __getattr__(self, name: str):
+        return getattr(self._driver, name)
+
+
+# Visible body text, lowercased in the browser so only one string crosses the
+# WebDriver wire
+BODY_TEXT_JS = "return document.body ? document.body.innerText.toLowerCase() : '';"
+
+# Seconds a lowered body text stays fresh for back-to-back detectors
+BODY_TEXT_TTL = 0.2
+
+
+def _remember_body_text(driver, body_text: str) -> None:
+    """Cache lowered body text on ``driver`` for the next BODY_TEXT_TTL."""
+    try:
+        driver._lowered_body = (time.monotonic(), body_text)
+    except AttributeError:
+        pass
+
+
+def lowered_body_text(driver: webdriver.Chrome) -> str:
+    """Return the page's visible text, lowercased, shared across detectors.
+
+    The text is fetched with one BODY_TEXT_JS call and reused for
+    BODY_TEXT_TTL seconds (or, on a CachedDriver, until it is invalidated),
+    so running several detectors in a row costs one round-trip.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance
 
-    return []
+    Returns
+    -------
+    str
+        Lowercased ``document.body.innerText``
+    """
+    cached = getattr(driver, "_lowered_body", None)
+    if cached and time.monotonic() - cached[0] < BODY_TEXT_TTL:
+        return cached[1]
+
+    # Reading text never changes the page, so bypass CachedDriver invalidation
+    script_driver = (
+        driver.wrapped_driver if isinstance(driver, CachedDriver) else driver
+    )
+    try:
+        body_text = script_driver.execute_script(BODY_TEXT_JS)
+        if not isinstance(body_text, str):
+            raise TypeError("body text script returned no text")
+    except Exception:
+        body = driver.find_element(By.TAG_NAME, "body")
+        body_text = (body.text if body else "").lower()
+
+    _remember_body_text(driver, body_text)
+    return body_text
+
+
+# Installed on every new document by setup_driver. A MutationObserver
+# re-checks the page (debounced) whenever it changes and publishes the
+# result as window.__adhsSafety, so detectors read a flag instead of
+# pulling the page over WebDriver on every poll.
+SAFETY_OBSERVER_JS = """
+(() => {
+    const captcha = %s;
+    const rateLimit = %s;
+    let pending = false;
+    const check = () => {
+        pending = false;
+        const html = document.documentElement.outerHTML.toLowerCase();
+        const text = document.body ? document.body.innerText.toLowerCase() : '';
+        window.__adhsSafety = {
+            captcha: captcha.some(s => html.includes(s)),
+            rateLimited: rateLimit.some(s => text.includes(s)),
+        };
+    };
+    const schedule = () => {
+        if (!pending) {
+            pending = true;
+            setTimeout(check, 50);
+        }
+    };
+    document.addEventListener('DOMContentLoaded', () => {
+        check();
+        new MutationObserver(schedule).observe(document.documentElement,
+            {childList: true, subtree: true, characterData: true});
+    });
+})();
+""" % (
+    json.dumps(list(CAPTCHA_INDICATORS)),
+    json.dumps(list(RATE_LIMIT_INDICATORS)),
+)
+
+SAFETY_FLAGS_JS = "return window.__adhsSafety || null;"
+
+
+def _safety_flags(driver: webdriver.Chrome) -> Optional[Dict[str, bool]]:
+    """Return the observer's ``{captcha, rateLimited}`` flags, if installed."""
+    script_driver = (
+        driver.wrapped_driver if isinstance(driver, CachedDriver) else driver
+    )
+    try:
+        flags = script_driver.execute_script(SAFETY_FLAGS_JS)
+    except Exception:
+        return None
+    return flags if isinstance(flags, dict) else None
 
 
 def detect_captcha(driver: webdriver.Chrome) -> bool:
     """Detect if CAPTCHA challenge is present.
 
-    Checks page source for common CAPTCHA indicators.
+    Reads the SAFETY_OBSERVER_JS flag when the observer is installed (see
+    setup_driver); otherwise checks page source for common CAPTCHA
+    indicators.
 
     Parameters
     ----------
@@ -340,18 +1553,50 @@ def detect_captcha(driver: webdriver.Chrome) -> bool:
     bool
         True if CAPTCHA detected, False otherwise
     """
+    flags = _safety_flags(driver)
+    if flags is not None:
+        return bool(flags.get("captcha"))
+
     try:
-        page_source = driver.page_source.lower()
-        return any(indicator in page_source for indicator in CAPTCHA_INDICATORS)
+        return CAPTCHA_RE.search(driver.page_source) is not None
     except Exception:
         return False
 
 
+# HTTP statuses of the main document that mean we are blocked or throttled
+BLOCKING_STATUSES = frozenset({403, 429, 503})
+
+# Main-document HTTP status (Navigation Timing; 0 if unknown) and page title
+RESPONSE_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+return [(nav && nav.responseStatus) || 0, document.title || ''];
+"""
+
+
+def _response_summary(driver: webdriver.Chrome) -> Tuple[int, str]:
+    """Return ``(status, title)`` for the current page in one script call.
+
+    The status is 0 when the browser does not report it; the title is then
+    read through WebDriver if the script cannot run at all.
+    """
+    script_driver = (
+        driver.wrapped_driver if isinstance(driver, CachedDriver) else driver
+    )
+    try:
+        status, title = script_driver.execute_script(RESPONSE_JS)
+        return int(status or 0), title or ""
+    except Exception:
+        return 0, driver.title or ""
+
+
 def detect_rate_limit(driver: webdriver.Chrome) -> bool:
     """Detect if rate limiting or blocking is active.
 
-    Checks visible page text (not scripts/CSS) for rate limit indicators.
-    Also checks for HTTP error status in title or body.
+    The main document's HTTP status and the page title are checked first,
+    with one script call; a 403/429/503 or an error title answers without
+    transferring the page text. Otherwise visible page text (not
+    scripts/CSS) is checked for rate limit indicators, through the
+    SAFETY_OBSERVER_JS flag when the observer is installed.
 
     Parameters
     ----------
@@ -364,21 +1609,96 @@ def detect_rate_limit(driver: webdriver.Chrome) -> bool:
         True if rate limit/block detected, False otherwise
     """
     try:
-        # Check page title for error indicators
-        title = driver.title.lower() if driver.title else ""
-        if any(x in title for x in ["error", "blocked", "denied", "unavailable"]):
+        # Check HTTP status and page title for error indicators
+        status, title = _response_summary(driver)
+        if status in BLOCKING_STATUSES or _is_error_title(title):
             return True
 
-        # Get visible body text (excludes scripts and styles)
-        body_element = driver.find_element(By.TAG_NAME, "body")
-        visible_text = body_element.text.lower() if body_element else ""
-
-        # Check visible text for rate limit indicators
-        return any(indicator in visible_text for indicator in RATE_LIMIT_INDICATORS)
+        # Check visible text (excludes scripts and styles) for indicators,
+        # using the observer's flag when it is installed
+        flags = _safety_flags(driver)
+        if flags is not None:
+            return bool(flags.get("rateLimited"))
+        return RATE_LIMIT_RE.search(lowered_body_text(driver)) is not None
     except Exception:
         return False
 
 
+def _is_error_title(title: str) -> bool:
+    """Return True if a page title reads like an error or block page."""
+    return ERROR_TITLE_RE.search(title) is not None
+
+
+def _is_login_text(body_text: str) -> bool:
+    """Return True if visible page text looks like the login page."""
+    has_login_indicators = LOGIN_RE.search(body_text) is not None
+    has_search_indicators = SEARCH_PAGE_RE.search(body_text) is not None
+
+    # If we have search indicators, we're good
+    if has_search_indicators and not has_login_indicators:
+        return False
+
+    # If we have login indicators but no search, we're on login page
+    return has_login_indicators
+
+
+# Reads everything the page detectors need in a single round-trip
+PAGE_STATE_JS = """
+return [
+    document.title || '',
+    document.body ? document.body.innerText.toLowerCase() : '',
+    document.documentElement ? document.documentElement.outerHTML : '',
+    (performance.getEntriesByType('navigation')[0] || {}).responseStatus || 0,
+];
+"""
+
+
+class PageState(NamedTuple):
+    """Outcome of every page detector, from one scan_page_state call."""
+
+    captcha: bool
+    rate_limited: bool
+    login: bool
+    tfa: bool
+
+
+def scan_page_state(driver: webdriver.Chrome) -> PageState:
+    """Run the CAPTCHA, rate limit, login and 2FA detectors in one pass.
+
+    The title, visible body text and page HTML are fetched with a single
+    script call instead of one WebDriver round-trip per detector. A
+    CachedDriver is primed with the HTML so later page_source reads are free.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance
+
+    Returns
+    -------
+    PageState
+        Detector results; all False if the page could not be read
+    """
+    try:
+        title, body_text, page_source, status = driver.execute_script(PAGE_STATE_JS)
+    except Exception as e:
+        logger.debug(f"Page state scan failed: {e}")
+        return PageState(False, False, False, False)
+
+    if isinstance(driver, CachedDriver):
+        driver.prime(page_source)
+    _remember_body_text(driver, body_text)
+
+    return PageState(
+        captcha=CAPTCHA_RE.search(page_source) is not None,
+        rate_limited=status in BLOCKING_STATUSES
+        or _is_error_title(title)
+        or RATE_LIMIT_RE.search(body_text) is not None,
+        login=_is_login_text(body_text),
+        tfa=TFA_RE.search(body_text) is not None,
+    )
+
+
 def get_random_delay(min_delay: float = 2.0, max_delay: float = 5.0) -> float:
     """Get randomized delay to avoid detection patterns.
 
@@ -399,9 +1719,114 @@ def get_random_delay(min_delay: float = 2.0, max_delay: float = 5.0) -> float:
     return random.uniform(min_delay, max_delay)
 
 
+# Entity keywords for classify_name_type. Any keyword appearing anywhere in
+# the uppercased name (substring match) marks it as an Entity.
+ENTITY_KEYWORDS = (
+    "LLC",
+    "CORP",
+    "INC",
+    "SCHOOL",
+    "DISTRICT",
+    "TRUST",
+    "FOUNDATION",
+    "COMPANY",
+    "CO.",
+    "ASSOCIATION",
+    "CHURCH",
+    "PROPERTIES",
+    "LP",
+    "LTD",
+    "PARTNERSHIP",
+    "FUND",
+    "HOLDINGS",
+    "INVESTMENTS",
+    "VENTURES",
+    "GROUP",
+    "ENTERPRISE",
+    "BORROWER",
+    "ACADEMY",
+    "COLLEGE",
+    "UNIVERSITY",
+    "MEDICAL",
+    "HEALTH",
+    "CARE",
+    "SOBER",
+    "LEARNING",
+    "PRESCHOOL",
+    # Additional business/organization keywords
+    "CENTERS",
+    "CENTER",
+    "HOSPICE",
+    "HOSPITAL",
+    "CLINIC",
+    "STATE OF",
+    "CITY OF",
+    "COUNTY OF",
+    "TOWN OF",
+    "UNITED STATES",
+    "GOVERNMENT",
+    "FEDERAL",
+    "MUNICIPAL",
+    "ARMY",
+    "NAVY",
+    "AIR FORCE",
+    "MILITARY",
+    "SALVATION",
+    "ARC",
+    "HOUSE",
+    "HOME",
+    "HOMES",
+    "LIVING",
+    "SENIOR",
+    "FACILITY",
+    "FACILITIES",
+    "SERVICES",
+    "SERVICE",
+    "UNITED",
+    "METHODIST",
+    "LUTHERAN",
+    "EVANGELICAL",
+    "BAPTIST",
+    "CATHOLIC",
+    "CHRISTIAN",
+    "CONGREGATION",
+    "PRESBYTERY",
+    "ASSEMBLY",
+    "LEAGUE",
+    "ASSOCIATES",
+    "JOINT VENTURE",
+    "DST",
+    "LIMITED",
+    "PARTNERS",
+    "SETTLEMENT",
+    "HABILITATION",
+)
+
+# One prefix-factored scan over the uppercased name replaces a substring test
+# per keyword. Matching is case-sensitive against uppercase keywords, which
+# the stdlib engine runs several times faster than an (?i) pattern.
+ENTITY_KEYWORD_RE = indicator_re.compile(
+    _prefix_trie_pattern(
+        tuple(keyword.upper() for keyword in ENTITY_KEYWORDS), lowercase=False
+    )
+)
+
+# Words that keep a short 2-4 word name from being treated as a person
+_PROPERTY_WORDS = frozenset({"PROPERTY", "REAL", "ESTATE", "DEVELOPMENT", "RENTAL"})
+
+# Whole-word property test for the Arrow classifier (RE2 syntax)
+_PROPERTY_WORD_PATTERN = (
+    r"(?:^|\s)(?:" + "|".join(sorted(_PROPERTY_WORDS)) + r")(?:\s|$)"
+)
+
+
+@lru_cache(maxsize=131072)
 def classify_name_type(name: str) -> str:
     """Classify a name as Entity or Individual(s) based on keywords and patterns.
 
+    Results are memoized: owner lists repeat the same trusts and LLCs across
+    many parcels, so repeat lookups are a dictionary hit.
+
     Parameters
     ----------
     name : str
@@ -415,108 +1840,20 @@ def classify_name_type(name: str) -> str:
     if not name:
         return ""
 
-    name_upper = str(name).upper()
-
-    # Entity keywords
-    entity_keywords = [
-        "LLC",
-        "CORP",
-        "INC",
-        "SCHOOL",
-        "DISTRICT",
-        "TRUST",
-        "FOUNDATION",
-        "COMPANY",
-        "CO.",
-        "ASSOCIATION",
-        "CHURCH",
-        "PROPERTIES",
-        "LP",
-        "LTD",
-        "PARTNERSHIP",
-        "FUND",
-        "HOLDINGS",
-        "INVESTMENTS",
-        "VENTURES",
-        "GROUP",
-        "ENTERPRISE",
-        "BORROWER",
-        "ACADEMY",
-        "COLLEGE",
-        "UNIVERSITY",
-        "MEDICAL",
-        "HEALTH",
-        "CARE",
-        "SOBER",
-        "LEARNING",
-        "PRESCHOOL",
-        # Additional business/organization keywords
-        "CENTERS",
-        "CENTER",
-        "HOSPICE",
-        "HOSPITAL",
-        "CLINIC",
-        "STATE OF",
-        "CITY OF",
-        "COUNTY OF",
-        "TOWN OF",
-        "UNITED STATES",
-        "GOVERNMENT",
-        "FEDERAL",
-        "MUNICIPAL",
-        "ARMY",
-        "NAVY",
-        "AIR FORCE",
-        "MILITARY",
-        "SALVATION",
-        "ARC",
-        "HOUSE",
-        "HOME",
-        "HOMES",
-        "LIVING",
-        "SENIOR",
-        "FACILITY",
-        "FACILITIES",
-        "SERVICES",
-        "SERVICE",
-        "UNITED",
-        "METHODIST",
-        "LUTHERAN",
-        "EVANGELICAL",
-        "BAPTIST",
-        "CATHOLIC",
-        "CHRISTIAN",
-        "CONGREGATION",
-        "PRESBYTERY",
-        "ASSEMBLY",
-        "LEAGUE",
-        "ASSOCIATES",
-        "JOINT VENTURE",
-        "DST",
-        "LIMITED",
-        "PARTNERS",
-        "SETTLEMENT",
-        "HABILITATION",
-    ]
+    upper = str(name).upper()
+
+    # Only simple name patterns (2-4 words without entity-like words) can be
+    # person names; anything else is an Entity whether or not a keyword
+    # matches, so the keyword scan is skipped for it
+    words = upper.split()
+    if not (2 <= len(words) <= 4 and _PROPERTY_WORDS.isdisjoint(words)):
+        return "Entity"
 
     # Check for entity keywords
-    for keyword in entity_keywords:
-        if keyword in name_upper:
-            return "Entity"
-
-    # Check for individual patterns
-    # Simple name patterns (2-4 words, likely person names)
-    words = name.strip().split()
-    if len(words) >= 2 and len(words) <= 4:
-        # Additional check: if it doesn't contain entity-like words
-        if not any(
-            word.upper() in ["PROPERTY", "REAL", "ESTATE", "DEVELOPMENT", "RENTAL"]
-            for word in words
-        ):
-            return "Individual(s)"
+    if ENTITY_KEYWORD_RE.search(upper):
+        return "Entity"
 
-    # Default to Entity for unclear cases
-    return "Entity"
+    return "Individual(s)"
 
 
 def classify_owner_type(name: str) -> str:
@@ -535,10 +1872,84 @@ def classify_owner_type(name: str) -> str:
     if pd.isna(name) or str(name).strip() == "":
         return ""
 
-    result = classify_name_type(name)
+    # str() keeps the cache key hashable whatever the column held
+    result = classify_name_type(str(name))
     return "BUSINESS" if result == "Entity" else "INDIVIDUAL"
 
 
+def _classify_owner_type_arrow(names: pd.Series) -> pd.Series:
+    """classify_owner_type_series on ``string[pyarrow]``; same rules and output."""
+    text = names.astype("string[pyarrow]").str.strip()
+    upper = text.str.upper()
+    person = (
+        upper.str.count(r"\S+").between(2, 4)
+        & ~upper.str.contains(_PROPERTY_WORD_PATTERN, regex=True)
+        & ~upper.str.contains(ENTITY_KEYWORD_RE.pattern, regex=True)
+    ).fillna(False)
+
+    owner_types = pd.Series("BUSINESS", index=names.index, dtype=object)
+    owner_types[person.to_numpy(dtype=bool)] = "INDIVIDUAL"
+    owner_types[text.fillna("").eq("").to_numpy(dtype=bool)] = ""
+    return owner_types
+
+
+def classify_owner_type_series(names: pd.Series) -> pd.Series:
+    """Classify a whole owner column; bulk equivalent of classify_owner_type.
+
+    Applies the classify_name_type rules (the 2-4 word person-name check,
+    then the keyword substring match) in one pass over the column values with the
+    precompiled keyword pattern. pandas ``.str`` methods on object columns
+    loop in Python once per method, so a single fused pass is faster than
+    chaining them and avoids a ``Series.apply`` call per row. When pyarrow is
+    installed the column is converted to Arrow strings instead, whose
+    ``.str`` methods are vectorized C++ kernels.
+
+    Parameters
+    ----------
+    names : pd.Series
+        Owner names
+
+    Returns
+    -------
+    pd.Series
+        "BUSINESS", "INDIVIDUAL", or "" for blank names, on the same index
+    """
+    if ARROW_STRINGS:
+        return _classify_owner_type_arrow(names)
+
+    keyword_search = ENTITY_KEYWORD_RE.search
+    owner_types = []
+    for name, missing in zip(names.tolist(), names.isna().tolist()):
+        text = "" if missing else str(name).strip()
+        if not text:
+            owner_types.append("")
+            continue
+        upper = text.upper()
+        words = upper.split()
+        owner_types.append(
+            "INDIVIDUAL"
+            if 2 <= len(words) <= 4
+            and _PROPERTY_WORDS.isdisjoint(words)
+            and not keyword_search(upper)
+            else "BUSINESS"
+        )
+    return pd.Series(owner_types, index=names.index, dtype=object)
+
+
+# Trailing ownership suffixes that aren't part of a person's name, e.g.
+# "BARATTI JAMES J/DEBORAH F TR". Stacked suffixes ("EST TR") are all removed.
+_NAME_SUFFIX_RE = re.compile(
+    r"(?:\s+(?:TRUSTEE|TRUST|TR|ET AL|JT TEN|JTRS|JT|ESTATE|EST))+$"
+)
+
+
+def _clean(text: str) -> str:
+    """Collapse runs of whitespace to single spaces and strip the ends."""
+    # str.split() with no arguments already drops leading/trailing
+    # whitespace, and is faster than a regex substitution on short strings
+    return " ".join(text.split())
+
+
 def parse_individual_names(name_str: str) -> List[str]:
     """Parse concatenated individual names into separate formatted names.
 
@@ -565,20 +1976,7 @@ def parse_individual_names(name_str: str) -> List[str]:
     name_str = str(name_str).strip()
 
     # Remove common suffixes that aren't part of the name
-    suffixes_to_remove = [
-        "TR",
-        "TRUST",
-        "TRUSTEE",
-        "ET AL",
-        "JT TEN",
-        "JTRS",
-        "JT",
-        "EST",
-        "ESTATE",
-    ]
-    for suffix in suffixes_to_remove:
-        if name_str.endswith(" " + suffix):
-            name_str = name_str[: -(len(suffix) + 1)].strip()
+    name_str = _NAME_SUFFIX_RE.sub("", name_str)
 
     # Split by forward slash to get individual components
     parts = [p.strip() for p in name_str.split("/") if p.strip()]
@@ -653,14 +2051,90 @@ def parse_individual_names(name_str: str) -> List[str]:
     cleaned_names = []
     for name in names[:4]:  # Limit to 4 names
         # Remove extra spaces
-        name = " ".join(name.split())
+        name = _clean(name)
         # Keep uppercase as provided (these are typically already uppercase)
         cleaned_names.append(name)
 
     return cleaned_names
 
 
-def setup_driver(headless: bool = True) -> webdriver.Chrome:
+def parse_individual_names_series(names: pd.Series) -> pd.Series:
+    """Parse a whole owner column; bulk equivalent of parse_individual_names.
+
+    MCAO owner names repeat across parcels, so each distinct name is parsed
+    once and the result is shared by every row carrying it. Rows with the
+    same name share one list object; callers must not mutate it.
+
+    Parameters
+    ----------
+    names : pd.Series
+        Owner name strings (missing values yield empty lists)
+
+    Returns
+    -------
+    pd.Series
+        List of up to 4 parsed names per row, on the same index
+    """
+    parsed = {name: parse_individual_names(name) for name in names.dropna().unique()}
+    empty: List[str] = []
+    return pd.Series(
+        [
+            empty if missing else parsed[name]
+            for name, missing in zip(names.tolist(), names.isna().tolist())
+        ],
+        index=names.index,
+        dtype=object,
+    )
+
+
+# Resolved chromedriver binary, looked up once per process
+_CHROMEDRIVER_PATH: Optional[str] = None
+
+
+def _get_chromedriver_path() -> str:
+    """Return the chromedriver path, resolving it on first use only.
+
+    ``ADHS_ECORP_CHROMEDRIVER_PATH`` skips webdriver-manager entirely;
+    otherwise ``ChromeDriverManager().install()`` (which checks the network
+    for driver updates) runs once and its result is reused by every later
+    setup_driver call.
+    """
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        configured = None
+        if get_ecorp_settings is not None:
+            try:
+                configured = get_ecorp_settings().chromedriver_path
+            except Exception as e:
+                logger.debug(f"Could not read chromedriver_path setting: {e}")
+        _CHROMEDRIVER_PATH = configured or ChromeDriverManager().install()
+    return _CHROMEDRIVER_PATH
+
+
+# Subresources the scraper never reads (it only needs DOM text and forms);
+# blocked through CDP when resource blocking is on
+BLOCKED_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*.woff2",
+    "*.woff",
+    "*.ttf",
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.ico",
+    "*.mp4",
+)
+
+
+def setup_driver(
+    headless: bool = True,
+    block_resources: Optional[bool] = None,
+    profile_dir: Optional[Path] = None,
+) -> webdriver.Chrome:
     """Configure and return a Selenium Chrome WebDriver with anti-detection.
 
     Includes measures to avoid bot detection:
@@ -669,10 +2143,20 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     - Excludes automation-related Chrome switches
     - Disables automation extensions
 
+    Images, web fonts and analytics scripts are not downloaded unless
+    resource blocking is turned off, which speeds up every page load.
+
     Parameters
     ----------
     headless : bool
         Whether to run Chrome in headless mode.
+    block_resources : Optional[bool]
+        Skip images, fonts and analytics. None uses the ``block_resources``
+        setting (``ADHS_ECORP_BLOCK_RESOURCES``); pass False for pages that
+        need images, such as an image CAPTCHA.
+    profile_dir : Optional[Path]
+        Chrome user data directory to keep cookies (and so the login) between
+        runs. None uses a throwaway profile.
 
     Returns
     -------
@@ -688,9 +2172,14 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
         )  # New headless mode (more realistic)
         chrome_options.add_argument("--disable-gpu")
 
+    if profile_dir is not None:
+        Path(profile_dir).mkdir(parents=True, exist_ok=True)
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+
     # Standard stability options
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--disable-web-security")
     chrome_options.add_argument("--disable-features=VizDisplayCompositor")
     chrome_options.add_argument("--disable-backgrounding-occluded-windows")
@@ -709,9 +2198,41 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     )
     chrome_options.add_argument(f"--user-agent={user_agent}")
 
-    service = Service(ChromeDriverManager().install())
+    # driver.get() returns at DOMContentLoaded instead of the full load event;
+    # callers then poll for the element they need (wait_for_search_page,
+    # find_element_with_fallback), so nothing waits on late subresources
+    chrome_options.page_load_strategy = "eager"
+
+    if block_resources is None:
+        block_resources = True
+        if get_ecorp_settings is not None:
+            try:
+                block_resources = get_ecorp_settings().block_resources
+            except Exception as e:
+                logger.debug(f"Could not read block_resources setting: {e}")
+
+    if block_resources:
+        # Never fetch or decode images
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
+    service = Service(_get_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
 
+    if block_resources:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)}
+            )
+        except Exception as e:
+            logger.debug(f"Could not block subresources: {e}")
+
+    # All waits are explicit polls; an implicit wait would stall
+    # every missed selector in the fallback chains
+    driver.implicitly_wait(0)
+
     # Execute CDP command to hide webdriver flag
     driver.execute_cdp_cmd(
         "Page.addScriptToEvaluateOnNewDocument",
@@ -724,9 +2245,98 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
         },
     )
 
+    # Keep CAPTCHA / rate-limit flags current in the page itself
+    driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument", {"source": SAFETY_OBSERVER_JS}
+    )
+
     return driver
 
 
+# Warm Chrome session shared by driver_session() for the life of the process
+_DRIVER: Optional[webdriver.Chrome] = None
+_DRIVER_HEADLESS: Optional[bool] = None
+_DRIVER_PROFILE: Optional[Path] = None
+_DRIVER_LOCK = threading.Lock()
+
+# Clears per-origin storage so the next session starts clean
+CLEAR_STORAGE_JS = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+def _driver_alive(driver: webdriver.Chrome) -> bool:
+    """Return True if the browser behind ``driver`` still answers."""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def _quit_shared_driver() -> None:
+    """Shut down the shared Chrome session, if one was started."""
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting shared driver: {e}")
+        _DRIVER = None
+
+
+atexit.register(_quit_shared_driver)
+
+
+@contextmanager
+def driver_session(
+    headless: bool = True, reset: bool = True, profile_dir: Optional[Path] = None
+):
+    """Yield a Chrome driver that is reused across calls in this process.
+
+    setup_driver (Chrome startup, CDP setup) runs only for the first session,
+    or again if the browser died or ``headless`` or ``profile_dir`` changed.
+    Sessions are serialized by a lock and are not reentrant. The browser is
+    quit at exit.
+
+    Parameters
+    ----------
+    headless : bool
+        Whether to run Chrome in headless mode
+    reset : bool
+        Clear cookies and web storage when the session ends. Pass False to
+        keep a logged-in session for the next caller.
+    profile_dir : Optional[Path]
+        Persistent Chrome profile directory (see setup_driver); None uses a
+        throwaway profile
+
+    Yields
+    ------
+    webdriver.Chrome
+        The shared Selenium WebDriver instance
+    """
+    global _DRIVER, _DRIVER_HEADLESS, _DRIVER_PROFILE
+    with _DRIVER_LOCK:
+        if _DRIVER is not None and (
+            _DRIVER_HEADLESS != headless
+            or _DRIVER_PROFILE != profile_dir
+            or not _driver_alive(_DRIVER)
+        ):
+            _quit_shared_driver()
+        if _DRIVER is None:
+            _DRIVER = setup_driver(headless, profile_dir=profile_dir)
+            _DRIVER_HEADLESS = headless
+            _DRIVER_PROFILE = profile_dir
+
+        try:
+            yield _DRIVER
+        finally:
+            if reset:
+                try:
+                    _DRIVER.delete_all_cookies()
+                    _DRIVER.execute_script(CLEAR_STORAGE_JS)
+                except Exception as e:
+                    logger.debug(f"Could not reset shared driver: {e}")
+
+
 def detect_login_page(driver: webdriver.Chrome) -> bool:
     """Detect if the browser is on a login/authentication page.
 
@@ -741,50 +2351,142 @@ def detect_login_page(driver: webdriver.Chrome) -> bool:
         True if on login page, False if on search page
     """
     try:
-        body = driver.find_element(By.TAG_NAME, "body")
-        body_text = body.text.lower() if body else ""
-
-        # Login page indicators
-        login_indicators = [
-            "online services login",
-            "email address",
-            "password",
-            "register here",
-            "don't have an account",
-            "sign in",
-            "log in to your account",
-        ]
+        return _is_login_text(lowered_body_text(driver))
+    except Exception:
+        return False
 
-        # Search page indicators (if present, we're NOT on login)
-        search_indicators = [
-            "entity search",
-            "search for",
-            "entity name",
-            "business search",
-            "corporation search",
-        ]
 
-        # Check for login indicators
-        has_login_indicators = any(
-            indicator in body_text for indicator in login_indicators
-        )
+def _login_settled(driver: webdriver.Chrome, login_url: str) -> bool:
+    """Return True once a submitted login has left the credentials form.
 
-        # Check for search indicators
-        has_search_indicators = any(
-            indicator in body_text for indicator in search_indicators
-        )
+    The 2FA prompt counts as settled. Otherwise the browser must have
+    navigated away from ``login_url``, so the blank frame Angular renders
+    mid-transition is not mistaken for the signed-in app.
+    """
+    state = scan_page_state(driver)
+    if state.tfa:
+        return True
+    return not state.login and driver.current_url.rstrip("/") != login_url.rstrip("/")
 
-        # If we have search indicators, we're good
-        if has_search_indicators and not has_login_indicators:
-            return False
 
-        # If we have login indicators but no search, we're on login page
-        if has_login_indicators:
-            return True
+def wait_for_search_page(
+    driver: webdriver.Chrome, search_chain: SelectorChain, timeout: float
+) -> Optional[str]:
+    """Wait for the Angular SPA to render a login form or the search input.
 
-        return False
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance, just navigated to a search URL
+    search_chain : SelectorChain
+        Search input chain for the URL (see ``search_input_chain``)
+    timeout : float
+        Maximum seconds to wait
+
+    Returns
+    -------
+    Optional[str]
+        "login" or "search" for whichever rendered first, None on timeout
+    """
+
+    def landed() -> Optional[str]:
+        if detect_login_page(driver):
+            return "login"
+        if find_element_with_fallback(
+            driver, search_chain, timeout=0, raise_on_failure=False
+        ):
+            return "search"
+        return None
+
+    return wait_until(landed, timeout)
+
+
+# Short pause after search results render so requests are not evenly spaced
+SEARCH_JITTER = (0.3, 1.0)
+
+# Everything the post-search wait checks, in one round-trip: whether the
+# results rows and the no-results dialog chains match anything, and the
+# SAFETY_OBSERVER_JS flags (null when the observer is not installed)
+SEARCH_STATE_JS = """
+const has = (spec) => spec.some(([kind, selector]) => {
+    try {
+        if (kind === 'xpath') {
+            return document.evaluate(selector, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+        }
+        if (kind === 'id') return document.getElementById(selector) !== null;
+        return document.querySelector(selector) !== null;
+    } catch (e) {
+        return false;
+    }
+});
+const [resultsSpec, noResultsSpec] = arguments;
+const flags = window.__adhsSafety || null;
+return [has(resultsSpec), has(noResultsSpec),
+        flags && flags.captcha, flags && flags.rateLimited];
+"""
+
+
+def _js_spec(chain: SelectorChain) -> List[List[str]]:
+    """Convert a selector chain to the ``[kind, selector]`` pairs scripts take."""
+    return [[_FIND_JS_KINDS[by_type], selector] for by_type, selector in chain]
+
+
+_SEARCH_STATE_ARGS = (_js_spec(_SEL_RESULTS_ROWS), _js_spec(_SEL_NO_RESULTS))
+
+
+def _search_outcome(driver: webdriver.Chrome) -> Optional[str]:
+    """Classify the page after a search from one SEARCH_STATE_JS call.
+
+    Falls back to separate chain lookups if the script cannot run.
+    """
+    script_driver = (
+        driver.wrapped_driver if isinstance(driver, CachedDriver) else driver
+    )
+    try:
+        results, no_results, captcha, rate_limited = script_driver.execute_script(
+            SEARCH_STATE_JS, *_SEARCH_STATE_ARGS
+        )
     except Exception:
-        return False
+        results = find_element_with_fallback(
+            driver, _SEL_RESULTS_ROWS, timeout=0, raise_on_failure=False
+        )
+        no_results = not results and find_element_with_fallback(
+            driver, _SEL_NO_RESULTS, timeout=0, raise_on_failure=False
+        )
+        flags = _safety_flags(driver) or {}
+        captcha, rate_limited = flags.get("captcha"), flags.get("rateLimited")
+
+    # The no-results dialog wins, as in search_entities
+    if no_results:
+        return "no_results"
+    if results:
+        return "results"
+    if captcha or rate_limited:
+        return "blocked"
+    return None
+
+
+def wait_for_search_results(driver: webdriver.Chrome, timeout: float) -> Optional[str]:
+    """Wait for a submitted search to show results, the no-results dialog or a block.
+
+    Each poll is a single SEARCH_STATE_JS round-trip.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance, just after submitting a search
+    timeout : float
+        Maximum seconds to wait
+
+    Returns
+    -------
+    Optional[str]
+        "no_results", "results" or "blocked" (CAPTCHA / rate limit flagged by
+        SAFETY_OBSERVER_JS) for whichever appeared first, None on timeout.
+        "results" means the no-results dialog was not showing.
+    """
+    return wait_until(lambda: _search_outcome(driver), timeout)
 
 
 def perform_login(driver: webdriver.Chrome, settings) -> bool:
@@ -819,25 +2521,12 @@ def perform_login(driver: webdriver.Chrome, settings) -> bool:
     try:
         logger.info(f"Navigating to login page: {login_url}")
         driver.get(login_url)
-        time.sleep(3)  # Wait for Angular
-
-        # Find and fill email field
-        email_selectors = [
-            (By.CSS_SELECTOR, "input[type='email']"),
-            (By.CSS_SELECTOR, "input[formcontrolname='email']"),
-            (By.CSS_SELECTOR, "input[name='email']"),
-            (By.CSS_SELECTOR, "input[placeholder*='Email']"),
-            (By.CSS_SELECTOR, ".mat-mdc-form-field-infix input"),
-        ]
+        page_timeout = getattr(settings, "page_load_timeout", 10)
 
-        email_input = None
-        for by_type, selector in email_selectors:
-            try:
-                email_input = driver.find_element(by_type, selector)
-                if email_input:
-                    break
-            except Exception:
-                continue
+        # Wait for Angular to render the email field
+        email_input = find_element_with_fallback(
+            driver, _SEL_LOGIN_EMAIL, timeout=page_timeout, raise_on_failure=False
+        )
 
         if not email_input:
             logger.error("Could not find email input field on login page")
@@ -848,53 +2537,19 @@ def perform_login(driver: webdriver.Chrome, settings) -> bool:
         time.sleep(1)
 
         # Click Next/Continue button - this is a two-step login
-        next_button_selectors = [
-            (By.XPATH, "//button[normalize-space()='Next']"),
-            (By.XPATH, "//button[contains(text(), 'Next')]"),
-            (By.XPATH, "//button[contains(text(), 'Continue')]"),
-            (By.CSS_SELECTOR, "button.mat-mdc-raised-button"),
-            (By.CSS_SELECTOR, "button[type='submit']"),
-            (By.CSS_SELECTOR, "button[color='primary']"),
-        ]
-
-        next_button = None
-        for by_type, selector in next_button_selectors:
-            try:
-                buttons = driver.find_elements(by_type, selector)
-                for btn in buttons:
-                    if btn.is_displayed() and btn.is_enabled():
-                        next_button = btn
-                        logger.debug(f"Found Next button with selector: {selector}")
-                        break
-                if next_button:
-                    break
-            except Exception:
-                continue
+        next_button = find_clickable(driver, _NEXT_BUTTON_SELECTORS)
 
         if next_button:
             logger.info("Clicking Next button...")
             next_button.click()
-            time.sleep(3)  # Wait for password field to load
         else:
             logger.warning("Could not find Next button, trying Enter key...")
             email_input.send_keys(Keys.RETURN)
-            time.sleep(3)
 
-        # Find and fill password field
-        password_selectors = [
-            (By.CSS_SELECTOR, "input[type='password']"),
-            (By.CSS_SELECTOR, "input[formcontrolname='password']"),
-            (By.CSS_SELECTOR, "input[name='password']"),
-        ]
-
-        password_input = None
-        for by_type, selector in password_selectors:
-            try:
-                password_input = driver.find_element(by_type, selector)
-                if password_input:
-                    break
-            except Exception:
-                continue
+        # Wait for the password step to render, then fill it
+        password_input = find_element_with_fallback(
+            driver, _SEL_LOGIN_PASSWORD, timeout=page_timeout, raise_on_failure=False
+        )
 
         if password_input:
             password_input.clear()
@@ -903,7 +2558,9 @@ def perform_login(driver: webdriver.Chrome, settings) -> bool:
 
             # Submit login
             password_input.send_keys(Keys.RETURN)
-            time.sleep(3)  # Wait for login to process
+            # Wait for login to process: the form gives way to either the
+            # 2FA prompt or the signed-in app
+            wait_until(lambda: _login_settled(driver, login_url), page_timeout)
 
         # Check if we hit 2FA page
         if detect_2fa_page(driver):
@@ -913,7 +2570,8 @@ def perform_login(driver: webdriver.Chrome, settings) -> bool:
                 return False
 
         # Verify login success by checking we're not on login page
-        if not detect_login_page(driver) and not detect_2fa_page(driver):
+        page_state = scan_page_state(driver)
+        if not page_state.login and not page_state.tfa:
             logger.info("Login successful!")
             return True
         else:
@@ -939,23 +2597,15 @@ def detect_2fa_page(driver: webdriver.Chrome) -> bool:
         True if on 2FA page, False otherwise
     """
     try:
-        body = driver.find_element(By.TAG_NAME, "body")
-        body_text = body.text.lower() if body else ""
-
-        tfa_indicators = [
-            "two-factor authentication",
-            "verification code",
-            "code has been sent",
-            "enter the code",
-            "authenticate",
-            "otp",
-        ]
-
-        return any(indicator in body_text for indicator in tfa_indicators)
+        return TFA_RE.search(lowered_body_text(driver)) is not None
     except Exception:
         return False
 
 
+# Input types that can hold an OTP digit (None/"" = no type attribute)
+_OTP_INPUT_TYPES = frozenset({"text", "number", "tel", None, ""})
+
+
 def handle_2fa_prompt(driver: webdriver.Chrome, timeout: int = 300) -> bool:
     """Handle Two-Factor Authentication by prompting user for code.
 
@@ -1000,13 +2650,7 @@ def handle_2fa_prompt(driver: webdriver.Chrome, timeout: int = 300) -> bool:
         is_split_input = False
 
         # First, try to find 6 separate OTP input boxes (most common for this site)
-        all_inputs = driver.find_elements(By.TAG_NAME, "input")
-        visible_text_inputs = [
-            inp
-            for inp in all_inputs
-            if inp.is_displayed()
-            and inp.get_attribute("type") in ["text", "number", "tel", None, ""]
-        ]
+        visible_text_inputs = find_visible(driver, "input", _OTP_INPUT_TYPES)
 
         # Check if we have exactly 6 single-character inputs (split OTP)
         if len(visible_text_inputs) >= 6:
@@ -1019,27 +2663,23 @@ def handle_2fa_prompt(driver: webdriver.Chrome, timeout: int = 300) -> bool:
         # Fallback: try specific selectors
         if not otp_input:
             otp_selectors = [
-                (By.CSS_SELECTOR, "input[maxlength='1']"),
-                (By.CSS_SELECTOR, "input[type='text'][maxlength='6']"),
-                (By.CSS_SELECTOR, "input[formcontrolname*='otp']"),
-                (By.CSS_SELECTOR, "input[formcontrolname*='code']"),
+                "input[maxlength='1']",
+                "input[type='text'][maxlength='6']",
+                "input[formcontrolname*='otp']",
+                "input[formcontrolname*='code']",
             ]
 
-            for by_type, selector in otp_selectors:
-                try:
-                    inputs = driver.find_elements(by_type, selector)
-                    visible_inputs = [i for i in inputs if i.is_displayed()]
-                    if len(visible_inputs) >= 6:
-                        is_split_input = True
-                        otp_input = visible_inputs[:6]
-                        print(f"Found OTP inputs with selector: {selector}")
-                        break
-                    elif len(visible_inputs) == 1:
-                        otp_input = visible_inputs[0]
-                        is_split_input = False
-                        break
-                except Exception:
-                    continue
+            for selector in otp_selectors:
+                visible_inputs = find_visible(driver, selector)
+                if len(visible_inputs) >= 6:
+                    is_split_input = True
+                    otp_input = visible_inputs[:6]
+                    print(f"Found OTP inputs with selector: {selector}")
+                    break
+                elif len(visible_inputs) == 1:
+                    otp_input = visible_inputs[0]
+                    is_split_input = False
+                    break
 
         if not otp_input:
             print("Could not find OTP input fields. Trying first visible input...")
@@ -1064,29 +2704,9 @@ def handle_2fa_prompt(driver: webdriver.Chrome, timeout: int = 300) -> bool:
             time.sleep(0.5)
 
             # Click Authenticate/Submit button
-            auth_button_selectors = [
-                (By.XPATH, "//button[normalize-space()='Authenticate']"),
-                (By.XPATH, "//button[contains(text(), 'Authenticate')]"),
-                (By.XPATH, "//button[contains(text(), 'Verify')]"),
-                (By.XPATH, "//button[contains(text(), 'Submit')]"),
-                (By.CSS_SELECTOR, "button[type='submit']"),
-                (By.CSS_SELECTOR, "button.mat-mdc-raised-button"),
-            ]
-
-            auth_button = None
-            for by_type, selector in auth_button_selectors:
-                try:
-                    buttons = driver.find_elements(by_type, selector)
-                    for btn in buttons:
-                        if btn.is_displayed() and btn.is_enabled():
-                            btn_text = btn.text.lower()
-                            if "cancel" not in btn_text:
-                                auth_button = btn
-                                break
-                    if auth_button:
-                        break
-                except Exception:
-                    continue
+            auth_button = find_clickable(
+                driver, _AUTH_BUTTON_SELECTORS, exclude=("cancel",)
+            )
 
             if auth_button:
                 print("Clicking Authenticate button...")
@@ -1156,26 +2776,25 @@ def find_working_search_url(driver: webdriver.Chrome, settings=None) -> str:
         "https://ecorp.azcc.gov/EntitySearch/Index",
     ]
 
-    _page_timeout = (
-        settings.page_load_timeout if settings else 10
-    )  # noqa: F841 - reserved for future use
+    page_timeout = settings.page_load_timeout if settings else 10
+
+    # Navigation through the proxy drops body text cached for the last URL
+    if not isinstance(driver, CachedDriver):
+        driver = CachedDriver(driver)
 
     for url in candidate_urls:
         try:
             logger.debug(f"Trying URL: {url}")
             driver.get(url)
-            time.sleep(3)  # Wait for Angular SPA to initialize
+            # Wait for Angular SPA to render the login form or search input
+            landed = wait_for_search_page(driver, search_input_chain(url), page_timeout)
 
             # Check if we landed on a login page
-            if detect_login_page(driver):
+            if landed == "login":
                 logger.debug(f"  → Login page detected at {url}")
                 continue
 
-            # Check if we can find a search input
-            search_input = find_element_with_fallback(
-                driver, "search_input", timeout=5, raise_on_failure=False
-            )
-            if search_input:
+            if landed == "search":
                 logger.info(f"Found working search page at: {url}")
                 return url
 
@@ -1192,6 +2811,436 @@ def find_working_search_url(driver: webdriver.Chrome, settings=None) -> str:
     )
 
 
+# Text nodes a reader sees: script/style contents are skipped like bs4 does
+_VISIBLE_TEXT = etree.XPath("//text()[not(parent::script or parent::style)]")
+_ELEMENT_TEXT = etree.XPath(".//text()[not(parent::script or parent::style)]")
+# First element after a text node in document order (bs4 ``find_next()``)
+_NEXT_AFTER_TEXT = etree.XPath("(descendant::* | following::*)[1]")
+_NEXT_AFTER_TAIL = etree.XPath("following::*[1]")
+
+
+def _element_text(element) -> str:
+    """Return an element's stripped text pieces joined (``get_text(strip=True)``)."""
+    return "".join(piece.strip() for piece in _ELEMENT_TEXT(element))
+
+
+# Labelled fields read from every entity detail page
+DETAIL_LABELS = (
+    "Entity Type:",
+    "Entity Status:",
+    "Formation Date:",
+    "Business Type:",
+    "Domicile State:",
+    "County:",
+)
+
+
+def get_detail_fields(text_nodes: Sequence, labels: Sequence[str]) -> Dict[str, str]:
+    """Return the value shown after each label, from one pass over the page.
+
+    Parameters
+    ----------
+    text_nodes : Sequence
+        The page's visible text nodes in document order (``_VISIBLE_TEXT``)
+    labels : Sequence[str]
+        Field labels, e.g. ("Entity Type:", "County:")
+
+    Returns
+    -------
+    Dict[str, str]
+        Text of the first element following each label's first occurrence,
+        "" for labels not on the page
+    """
+    fields = dict.fromkeys(labels, "")
+    remaining = list(fields)
+    for node in text_nodes:
+        if not remaining:
+            break
+        found = [label for label in remaining if label in node]
+        if not found:
+            continue
+        owner = node.getparent()
+        following = (_NEXT_AFTER_TEXT if node.is_text else _NEXT_AFTER_TAIL)(owner)
+        value = _element_text(following[0]) if following else ""
+        for label in found:
+            fields[label] = value
+            remaining.remove(label)
+    return fields
+
+
+def get_detail_field(text_nodes: Sequence, label: str) -> str:
+    """Return the value shown after ``label`` on an entity detail page.
+
+    Parameters
+    ----------
+    text_nodes : Sequence
+        The page's visible text nodes in document order (``_VISIBLE_TEXT``)
+    label : str
+        Field label, e.g. "Entity Type:"
+
+    Returns
+    -------
+    str
+        Text of the first element following the label, or ""
+    """
+    return get_detail_fields(text_nodes, (label,))[label]
+
+
+# Statutory Agent section of the detail page text: the name on the line
+# after "Name:", the same-line fallback, and the address after "Address:"
+_STAT_AGENT_HEADING_RE = re.compile(r"Statutory Agent Information", re.IGNORECASE)
+_STAT_AGENT_NAME_RE = re.compile(
+    r"Statutory Agent Information.*?Name:\s*\n\s*([^\n\r]+?)(?:\s*\n|\s*Appointed)",
+    re.DOTALL | re.IGNORECASE,
+)
+_STAT_AGENT_NAME_ALT_RE = re.compile(
+    r"Statutory Agent Information.*?Name:\s*([^\n\r]+?)(?:\s+Attention:|Appointed|$)",
+    re.DOTALL | re.IGNORECASE,
+)
+_STAT_AGENT_ADDR_RE = re.compile(
+    r"Statutory Agent Information.*?Address:\s*\n?\s*([^\n\r]+?)"
+    r"(?:\s*\n|\s*Agent Last|E-mail:|County:|Mailing)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def get_statutory_agent_info(page_text: str) -> List[Dict[str, str]]:
+    """Extract Statutory Agent information using simple text parsing."""
+    agents = []
+
+    # Every pattern starts at the section heading, and only its first
+    # occurrence can match, so find it once and anchor the patterns there
+    heading = _STAT_AGENT_HEADING_RE.search(page_text)
+    if heading is None:
+        return agents
+    start = heading.start()
+
+    try:
+        # Look for the statutory agent section and extract Name
+        # Pattern: Find "Name:" then capture the next non-empty line
+        stat_agent_section = _STAT_AGENT_NAME_RE.match(page_text, start)
+
+        agent_name = ""
+        agent_addr = ""
+
+        if stat_agent_section:
+            # Clean up - remove extra spaces
+            agent_name = _clean(stat_agent_section.group(1))
+        else:
+            # Try alternative pattern where name might be on same line
+            alt_pattern = _STAT_AGENT_NAME_ALT_RE.match(page_text, start)
+            if alt_pattern:
+                agent_name = _clean(alt_pattern.group(1))
+
+        # Look for Address in the same section
+        addr_section = _STAT_AGENT_ADDR_RE.match(page_text, start)
+
+        if addr_section:
+            agent_addr = _clean(addr_section.group(1))
+
+        # If we found name or address, add to agents list
+        if agent_name or agent_addr:
+            agents.append(
+                {
+                    "Name": agent_name,
+                    "Address": agent_addr,
+                    "Phone": "",
+                    "Mail": "",
+                }
+            )
+
+    except Exception:
+        # Silent fail - return empty list
+        pass
+
+    return agents
+
+
+def extract_principal_info(tree) -> Dict[str, List[Dict[str, str]]]:
+    """Extract Principal Information from the table/grid section and categorize by role."""
+    categorized_principals = {
+        "Manager": [],
+        "Member": [],
+        "Manager/Member": [],
+    }
+
+    try:
+        # Look for the principal information table by id
+        principal_table = tree.find(".//table[@id='grid_principalList']")
+        if principal_table is not None:
+            # Find all data rows (skip header)
+            tbody = principal_table.find(".//tbody")
+            if tbody is not None:
+                for row in tbody.iter("tr"):
+                    cells = list(row.iter("td"))
+                    if len(cells) >= 4:  # Title, Name, Attention, Address
+                        title_text = _element_text(cells[0])
+                        name_text = _element_text(cells[1])
+                        # Skip attention field (cells[2])
+                        addr_text = _element_text(cells[3])
+
+                        # Look for phone/email if present (conservative approach)
+                        phone_text = ""
+                        mail_text = ""
+                        if len(cells) > 4:
+                            # Check if additional cells might contain phone/email
+                            for cell in cells[4:]:
+                                cell_text = _element_text(cell)
+                                if "@" in cell_text:
+                                    mail_text = cell_text
+                                elif (
+                                    any(char.isdigit() for char in cell_text)
+                                    and len(cell_text) >= 7
+                                ):
+                                    phone_text = cell_text
+
+                        # Categorize based on title
+                        title_upper = title_text.upper()
+                        principal_data = {
+                            "Name": name_text,
+                            "Address": addr_text,
+                            "Phone": phone_text,
+                            "Mail": mail_text,
+                        }
+
+                        if "MANAGER" in title_upper and "MEMBER" in title_upper:
+                            if len(categorized_principals["Manager/Member"]) < 5:
+                                categorized_principals["Manager/Member"].append(
+                                    principal_data
+                                )
+                        elif "MANAGER" in title_upper:
+                            if len(categorized_principals["Manager"]) < 5:
+                                categorized_principals["Manager"].append(principal_data)
+                        elif "MEMBER" in title_upper:
+                            if len(categorized_principals["Member"]) < 5:
+                                categorized_principals["Member"].append(principal_data)
+                        else:
+                            # Default to Manager if title unclear
+                            if len(categorized_principals["Manager"]) < 5:
+                                categorized_principals["Manager"].append(principal_data)
+
+    except Exception:
+        pass
+
+    return categorized_principals
+
+
+# HTML of the first detail_container that wraps the entity detail (principal
+# grid or detail headings), else <body>: the <head> (styles, Angular runtime)
+# and app chrome outside the container are never serialized
+DETAIL_HTML_JS = """
+const selectors = arguments[0];
+const isDetail = (el) => el.querySelector('#grid_principalList') !== null
+    || /Entity (Information|Details)|Statutory Agent/i.test(el.textContent);
+for (const selector of selectors) {
+    let el = null;
+    try {
+        el = document.querySelector(selector);
+    } catch (e) {
+        continue;
+    }
+    if (el && isDetail(el)) return el.outerHTML;
+}
+return document.body ? document.body.outerHTML : document.documentElement.outerHTML;
+"""
+
+_DETAIL_CONTAINER_CSS = [
+    selector
+    for by_type, selector in _SEL_DETAIL_CONTAINER
+    if by_type == By.CSS_SELECTOR
+]
+
+
+def detail_page_html(driver: webdriver.Chrome) -> str:
+    """Return the HTML of the entity detail content on the current page.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance showing an entity detail page
+
+    Returns
+    -------
+    str
+        The detail container's outerHTML, or the full page source if the
+        script cannot run
+    """
+    script_driver = (
+        driver.wrapped_driver if isinstance(driver, CachedDriver) else driver
+    )
+    try:
+        html = script_driver.execute_script(DETAIL_HTML_JS, _DETAIL_CONTAINER_CSS)
+    except Exception as e:
+        logger.debug(f"Detail container script failed: {e}")
+        html = None
+    return html if isinstance(html, str) and html else driver.page_source
+
+
+# Text that only a rendered entity detail page carries (not the login page
+# or the Angular shell served before the app boots)
+_DETAIL_PAGE_RE = re.compile(
+    r"Entity (?:Information|Details)|Statutory Agent", re.IGNORECASE
+)
+
+# Concurrent HTTP fetches of the detail pages from one results table
+DETAIL_FETCH_WORKERS = 8
+
+
+def http_session_from_driver(driver: webdriver.Chrome) -> requests.Session:
+    """Return a requests session carrying the browser's cookies and user agent.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Selenium WebDriver instance (logged in, if the site needs it)
+
+    Returns
+    -------
+    requests.Session
+        Session that the site sees as the same browser
+    """
+    session = requests.Session()
+    for cookie in driver.get_cookies():
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+        )
+    try:
+        session.headers["User-Agent"] = driver.execute_script(
+            "return navigator.userAgent;"
+        )
+    except Exception as e:
+        logger.debug(f"Could not read browser user agent: {e}")
+    return session
+
+
+def fetch_detail_pages(
+    session: requests.Session,
+    urls: Sequence[str],
+    timeout: float,
+    is_detail_page: Optional[Callable[[str], bool]] = None,
+) -> Dict[str, Optional[str]]:
+    """Fetch entity detail pages over HTTP, several at a time.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session from http_session_from_driver
+    urls : Sequence[str]
+        Detail page URLs
+    timeout : float
+        Per-request timeout in seconds
+    is_detail_page : Callable[[str], bool], optional
+        Returns True for HTML that is a rendered detail page; defaults to
+        looking for the Arizona Business Connect detail headings
+
+    Returns
+    -------
+    Dict[str, Optional[str]]
+        HTML per URL, or None where the page has to be opened in Chrome
+        (request failed, redirected to login, or not a rendered detail page)
+    """
+
+    if is_detail_page is None:
+        is_detail_page = _DETAIL_PAGE_RE.search
+
+    def fetch(url: str) -> Optional[str]:
+        try:
+            response = session.get(url, timeout=timeout)
+        except requests.RequestException as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+        if (
+            response.status_code != 200
+            or "login" in urlparse(response.url).path.lower()
+            or not is_detail_page(response.text)
+        ):
+            return None
+        return response.text
+
+    unique_urls = list(dict.fromkeys(urls))
+    with ThreadPoolExecutor(
+        max_workers=min(DETAIL_FETCH_WORKERS, len(unique_urls))
+    ) as pool:
+        return dict(zip(unique_urls, pool.map(fetch, unique_urls)))
+
+
+def build_entity_record(
+    search_name: str,
+    entity_name: str,
+    entity_id: str,
+    page_html: str,
+    url: str,
+    ecorp_type: Optional[str] = None,
+) -> Dict[str, str]:
+    """Build one ACC record from an entity detail page.
+
+    Parameters
+    ----------
+    search_name : str
+        The owner name that was searched
+    entity_name : str
+        Business name from the results table
+    entity_id : str
+        Business ID from the results table
+    page_html : str
+        HTML of the entity detail page
+    url : str
+        Detail page URL (stored as ECORP_URL)
+    ecorp_type : str, optional
+        classify_name_type(search_name), if the caller already has it
+
+    Returns
+    -------
+    Dict[str, str]
+        Record with every ACC column, in output order
+    """
+    # Parse the page once with lxml (C parser); the field lookups and
+    # the statutory agent regexes share its visible text nodes
+    tree = lxml_html.fromstring(page_html)
+    text_nodes = _VISIBLE_TEXT(tree)
+
+    fields = get_detail_fields(text_nodes, DETAIL_LABELS)
+    entity_type = fields["Entity Type:"]
+    status = fields["Entity Status:"]
+    formation_date = fields["Formation Date:"]
+    business_type = fields["Business Type:"]
+    domicile_state = fields["Domicile State:"]
+    county = fields["County:"]
+    statutory_agents = get_statutory_agent_info("".join(text_nodes))
+    principal_info = extract_principal_info(tree)
+
+    # Start from the blank template (every column, in output order) and fill
+    # what we found
+    record = get_blank_acc_record()
+    record.update(
+        {
+            "ECORP_SEARCH_NAME": search_name,
+            "ECORP_TYPE": ecorp_type or classify_name_type(search_name),
+            "ECORP_NAME_S": entity_name if entity_name else "",
+            "ECORP_ENTITY_ID_S": entity_id if entity_id else "",
+            "ECORP_ENTITY_TYPE": entity_type if entity_type else "",
+            "ECORP_STATUS": status if status else "",
+            "ECORP_FORMATION_DATE": formation_date if formation_date else "",
+            "ECORP_BUSINESS_TYPE": business_type if business_type else "",
+            "ECORP_STATE": domicile_state if domicile_state else "",
+            "ECORP_COUNTY": county if county else "",
+        }
+    )
+
+    # Statutory agents, then Manager, Manager/Member and Member principals,
+    # each capped at its slot count; IndividualName fields stay empty - they
+    # are populated later for INDIVIDUAL types
+    _fill_people(record, "StatutoryAgent", statutory_agents)
+    for prefix in ("Manager", "Manager/Member", "Member"):
+        _fill_people(record, prefix, principal_info.get(prefix, ()))
+
+    record["ECORP_URL"] = url
+    return record
+
+
 def search_entities(
     driver: webdriver.Chrome, name: str, settings=None
 ) -> List[Dict[str, str]]:
@@ -1200,7 +3249,9 @@ def search_entities(
     This function navigates to the Arizona Business Connect search page
     (formerly eCorp), enters ``name`` into the search bar, parses any
     results table that appears, and retrieves detailed fields for each
-    entity by opening the detail page in a new tab.
+    entity from its detail page. Detail pages with a plain URL are fetched
+    over HTTP with the browser's cookies; Angular router links (and pages
+    the HTTP fetch cannot read) are opened in Chrome.
 
     The function automatically discovers the working public search URL,
     handling the transition from the old eCorp site to the new Arizona
@@ -1229,21 +3280,26 @@ def search_entities(
     # Use configured URL or default to new Arizona Business Connect
     if settings:
         base_url = settings.base_url
-        min_delay = settings.min_delay
         max_delay = settings.max_delay
         page_timeout = settings.page_load_timeout
     else:
         # Fallback defaults
         base_url = "https://arizonabusinesscenter.azcc.gov/businesssearch"
-        min_delay = 2.0
         max_delay = 5.0
         page_timeout = 10
 
+    # Share one page_source serialization between the detection helpers and
+    # the detail parser until the page changes
+    if not isinstance(driver, CachedDriver):
+        driver = CachedDriver(driver)
+
+    search_chain = search_input_chain(base_url)
     driver.get(base_url)
-    time.sleep(3)  # Wait for Angular SPA to initialize
+    # Wait for Angular SPA to render the login form or search input
+    landed = wait_for_search_page(driver, search_chain, page_timeout)
 
     # Check if we landed on a login page
-    if detect_login_page(driver):
+    if landed == "login" or (landed is None and detect_login_page(driver)):
         logger.warning(f"Login page detected at {base_url}")
 
         # Try to authenticate if credentials are available
@@ -1252,7 +3308,7 @@ def search_entities(
             if perform_login(driver, settings):
                 # Navigate to search page after successful login
                 driver.get(base_url)
-                time.sleep(3)
+                landed = wait_for_search_page(driver, search_chain, page_timeout)
             else:
                 blank = get_blank_acc_record()
                 blank["ECORP_COMMENTS"] = "Authentication failed - check credentials"
@@ -1271,8 +3327,9 @@ def search_entities(
             )
             return [blank]
 
-    # Verify we're now on a search page
-    if detect_login_page(driver):
+    # Verify we're now on a search page (already known if the search input
+    # rendered without a login prompt)
+    if landed != "search" and detect_login_page(driver):
         blank = get_blank_acc_record()
         blank["ECORP_COMMENTS"] = "Still on login page after authentication attempt"
         return [blank]
@@ -1280,47 +3337,33 @@ def search_entities(
     try:
         # Wait for search bar using fallback selectors
         search_input = find_element_with_fallback(
-            driver, "search_input", timeout=page_timeout
+            driver, search_chain, timeout=page_timeout
         )
         # Clear and enter search term
         search_input.clear()
         search_input.send_keys(name)
 
         # Click "Business Search" button instead of pressing Enter
-        search_button_selectors = [
-            (By.XPATH, "//button[normalize-space()='Business Search']"),
-            (By.XPATH, "//button[contains(text(), 'Business Search')]"),
-            (By.XPATH, "//button[contains(text(), 'Search')]"),
-            (By.CSS_SELECTOR, "button[type='submit']"),
-            (By.CSS_SELECTOR, "button.mat-mdc-raised-button"),
-        ]
-
-        search_clicked = False
-        for by_type, selector in search_button_selectors:
-            try:
-                buttons = driver.find_elements(by_type, selector)
-                for btn in buttons:
-                    if btn.is_displayed() and btn.is_enabled():
-                        btn_text = btn.text.lower()
-                        if "clear" not in btn_text and "cancel" not in btn_text:
-                            logger.debug(f"Clicking search button: {btn.text}")
-                            btn.click()
-                            search_clicked = True
-                            break
-                if search_clicked:
-                    break
-            except Exception:
-                continue
-
-        if not search_clicked:
+        search_button = find_clickable(
+            driver, _SEARCH_BUTTON_SELECTORS, exclude=("clear", "cancel")
+        )
+        if search_button:
+            logger.debug("Clicking search button")
+            search_button.click()
+            driver.invalidate()
+        else:
             logger.debug("No search button found, pressing Enter")
             search_input.send_keys(Keys.RETURN)
+            driver.invalidate()
 
-        # Wait for results with randomized delay (anti-detection)
-        time.sleep(get_random_delay(min_delay, max_delay))
+        # Return as soon as the search settles (up to max_delay), then a short
+        # randomized pause (anti-detection)
+        outcome = wait_for_search_results(driver, max_delay)
+        time.sleep(get_random_delay(*SEARCH_JITTER))
 
-        # Safety checks: CAPTCHA and rate limit detection
-        if settings and settings.enable_captcha_detection and detect_captcha(driver):
+        # Safety checks: CAPTCHA and rate limit detection, from one page scan
+        page_state = scan_page_state(driver)
+        if settings and settings.enable_captcha_detection and page_state.captcha:
             logger.warning(f"CAPTCHA detected while searching for: {name}")
             if alert_captcha_detected:
                 alert_captcha_detected({"owner_name": name, "url": base_url}, settings)
@@ -1331,7 +3374,7 @@ def search_entities(
         if (
             settings
             and settings.enable_rate_limit_detection
-            and detect_rate_limit(driver)
+            and page_state.rate_limited
         ):
             logger.warning(f"Rate limit detected while searching for: {name}")
             if alert_rate_limited:
@@ -1340,18 +3383,23 @@ def search_entities(
             blank["ECORP_COMMENTS"] = "Rate limited - try again later"
             return [blank]
 
-        # Check for no results modal using fallback selectors
+        # Check for no results modal: the wait already answered this unless it
+        # timed out; otherwise the page source the detectors already fetched
+        # is checked locally before the waited selector chain
         try:
-            no_results = find_element_with_fallback(
-                driver, "no_results", timeout=2, raise_on_failure=False
-            )
+            if outcome == "no_results":
+                no_results = True
+            elif outcome is not None:
+                no_results = page_source_matches(driver.page_source, _SEL_NO_RESULTS)
+            else:
+                no_results = page_source_matches(
+                    driver.page_source, _SEL_NO_RESULTS
+                ) or find_element_with_fallback(
+                    driver, _SEL_NO_RESULTS, timeout=2, raise_on_failure=False
+                )
             if no_results:
                 # Try to dismiss the dialog
-                dismiss_btn = find_element_with_fallback(
-                    driver, "dialog_dismiss", timeout=2, raise_on_failure=False
-                )
-                if dismiss_btn:
-                    dismiss_btn.click()
+                if dismiss_dialog(driver):
                     time.sleep(0.5)
                 return [get_blank_acc_record()]
         except Exception:
@@ -1361,50 +3409,77 @@ def search_entities(
         # New Arizona Business Connect table columns:
         # 0: Business Name (link), 1: Former Name, 2: Business ID, 3: Business Type,
         # 4: Statutory Agent, 5: Physical Address, 6: Status
+        # The whole table is read with one script call; Selenium is only used
+        # again to click Angular router links.
         entities = []
-        rows = find_elements_with_fallback(driver, "results_rows")
+        row_selector, rows = snapshot_results_rows(driver)
         logger.debug(f"Found {len(rows)} result rows")
 
+        # Static routerlink paths are resolved against the results page so
+        # those rows open in a tab (or over HTTP) instead of click + back()
+        results_page_url = driver.current_url
         for row in rows:
-            cols = find_elements_with_fallback(driver, "table_cells", parent=row)
-            if not cols or len(cols) < 3:
-                logger.debug(f"Skipping row with {len(cols) if cols else 0} columns")
+            if row["link"] and not row["link"].startswith("http"):
+                row["link"] = urljoin(results_page_url, row["link"])
+
+        # Rows with a real href are fetched over HTTP in parallel with the
+        # browser's cookies; pages that come back as the login page or the
+        # SPA shell fall back to Chrome below
+        detail_urls = [
+            row["link"]
+            for row in rows
+            if len(row["cells"]) >= 3
+            and row["has_link"]
+            and (row["link"] or "").startswith("http")
+        ]
+        prefetched = (
+            fetch_detail_pages(
+                http_session_from_driver(driver), detail_urls, page_timeout
+            )
+            if detail_urls
+            else {}
+        )
+
+        # Every record of this search shares the searched name's type
+        ecorp_type = classify_name_type(name)
+
+        for row_idx, row in enumerate(rows):
+            cols = row["cells"]
+            if len(cols) < 3:
+                logger.debug(f"Skipping row with {len(cols)} columns")
                 continue
 
             # Extract data from columns (new Arizona Business Connect format)
-            entity_name = cols[0].text.strip() if len(cols) > 0 else ""
-            entity_id = cols[2].text.strip() if len(cols) > 2 else ""
-            business_type = cols[3].text.strip() if len(cols) > 3 else ""
-            _statutory_agent = (
-                cols[4].text.strip() if len(cols) > 4 else ""
-            )  # noqa: F841
-            _physical_address = (
-                cols[5].text.strip() if len(cols) > 5 else ""
-            )  # noqa: F841
-            status = cols[6].text.strip() if len(cols) > 6 else ""
+            # (type, agent, address and status are read from the detail page)
+            entity_name = cols[0]
+            entity_id = cols[2]
 
             logger.debug(f"Found entity: {entity_name} (ID: {entity_id})")
 
-            # Find link in the first column (Business Name)
-            link = find_element_with_fallback(
-                driver, "entity_link", parent=cols[0], timeout=2, raise_on_failure=False
-            )
-            if not link:
-                # Try finding link in the entire row
-                link = find_element_with_fallback(
-                    driver, "entity_link", parent=row, timeout=2, raise_on_failure=False
-                )
-            if not link:
+            if not row["has_link"]:
                 logger.debug(f"No link found for {entity_name}, skipping")
                 continue
 
-            # Arizona Business Connect uses Angular routing - links may not have href
-            # We need to click the link directly instead of opening URL in new tab
-            detail_url = link.get_attribute("href") or link.get_attribute("routerlink")
+            # Arizona Business Connect uses Angular routing - links without an
+            # href or static routerlink are clicked instead of opened in a tab
+            detail_url = row["link"]
+
+            if prefetched.get(detail_url):
+                entities.append(
+                    build_entity_record(
+                        name,
+                        entity_name,
+                        entity_id,
+                        prefetched[detail_url],
+                        detail_url,
+                        ecorp_type,
+                    )
+                )
+                continue
 
             # Store current window handle
             main_window = driver.current_window_handle
-            _original_url = driver.current_url  # noqa: F841 - kept for debugging
+            results_url = driver.current_url
 
             if detail_url and detail_url.startswith("http"):
                 # Traditional link - open in new tab
@@ -1413,281 +3488,35 @@ def search_entities(
                 driver.switch_to.window(driver.window_handles[-1])
             else:
                 # Angular routing - click the link directly
+                link = find_result_link(driver, row_selector, row_idx)
+                if not link:
+                    logger.debug(f"Link for {entity_name} is gone, skipping")
+                    continue
                 logger.debug(f"Clicking link for: {entity_name}")
                 try:
                     link.click()
-                    time.sleep(2)  # Wait for Angular navigation
+                    driver.invalidate()
                 except Exception as click_err:
                     logger.debug(f"Click failed, trying JS click: {click_err}")
                     driver.execute_script("arguments[0].click();", link)
-                    time.sleep(2)
+                # Angular routes without a page load; wait until we have left
+                # the results page so detail_loaded cannot match it
+                wait_until(
+                    lambda: driver.current_url != results_url
+                    or "entity information" in lowered_body_text(driver),
+                    page_timeout,
+                )
             # Wait for entity info to load using fallback selectors
-            find_element_with_fallback(driver, "detail_loaded", timeout=page_timeout)
-            # Parse the page with BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-
-            # Extract fields
-            def get_field(label: str) -> str:
-                el = soup.find(text=lambda t: t and label in t)
-                if el:
-                    # Find the next sibling which holds the value
-                    val = el.find_next()
-                    return val.get_text(strip=True)
-                return ""
-
-            def get_statutory_agent_info():
-                """Extract Statutory Agent information using simple text parsing."""
-                agents = []
-
-                try:
-                    # Get the entire page text
-                    page_text = soup.get_text()
-
-                    # Find "Statutory Agent Information" section in the text
-                    import re
-
-                    # Look for the statutory agent section and extract Name
-                    # Pattern: Find "Name:" then capture the next non-empty line
-                    stat_agent_section = re.search(
-                        r"Statutory Agent Information.*?Name:\s*\n\s*([^\n\r]+?)(?:\s*\n|\s*Appointed)",
-                        page_text,
-                        re.DOTALL | re.IGNORECASE,
-                    )
-
-                    agent_name = ""
-                    agent_addr = ""
-
-                    if stat_agent_section:
-                        agent_name = stat_agent_section.group(1).strip()
-                        # Clean up - remove extra spaces
-                        agent_name = " ".join(agent_name.split())
-                    else:
-                        # Try alternative pattern where name might be on same line
-                        alt_pattern = re.search(
-                            r"Statutory Agent Information.*?Name:\s*([^\n\r]+?)(?:\s+Attention:|Appointed|$)",
-                            page_text,
-                            re.DOTALL | re.IGNORECASE,
-                        )
-                        if alt_pattern:
-                            agent_name = alt_pattern.group(1).strip()
-                            agent_name = " ".join(agent_name.split())
-
-                    # Look for Address in the same section
-                    addr_section = re.search(
-                        r"Statutory Agent Information.*?Address:\s*\n?\s*([^\n\r]+?)(?:\s*\n|\s*Agent Last|E-mail:|County:|Mailing)",
-                        page_text,
-                        re.DOTALL | re.IGNORECASE,
-                    )
-
-                    if addr_section:
-                        agent_addr = addr_section.group(1).strip()
-                        agent_addr = " ".join(agent_addr.split())
-
-                    # If we found name or address, add to agents list
-                    if agent_name or agent_addr:
-                        agents.append(
-                            {
-                                "Name": agent_name,
-                                "Address": agent_addr,
-                                "Phone": "",
-                                "Mail": "",
-                            }
-                        )
-
-                except Exception:
-                    # Silent fail - return empty list
-                    pass
-
-                return agents
-
-            def extract_principal_info():
-                """Extract Principal Information from the table/grid section and categorize by role."""
-                categorized_principals = {
-                    "Manager": [],
-                    "Member": [],
-                    "Manager/Member": [],
-                }
-
-                try:
-                    # Look for the principal information table by id
-                    principal_table = soup.find("table", id="grid_principalList")
-                    if principal_table:
-                        # Find all data rows (skip header)
-                        tbody = principal_table.find("tbody")
-                        if tbody:
-                            rows = tbody.find_all("tr")
-
-                            for row in rows:
-                                cells = row.find_all("td")
-                                if len(cells) >= 4:  # Title, Name, Attention, Address
-                                    title_text = (
-                                        cells[0].get_text(strip=True)
-                                        if cells[0]
-                                        else ""
-                                    )
-                                    name_text = (
-                                        cells[1].get_text(strip=True)
-                                        if cells[1]
-                                        else ""
-                                    )
-                                    # Skip attention field (cells[2])
-                                    addr_text = (
-                                        cells[3].get_text(strip=True)
-                                        if cells[3]
-                                        else ""
-                                    )
-
-                                    # Look for phone/email if present (conservative approach)
-                                    phone_text = ""
-                                    mail_text = ""
-                                    if len(cells) > 4:
-                                        # Check if additional cells might contain phone/email
-                                        for cell in cells[4:]:
-                                            cell_text = cell.get_text(strip=True)
-                                            if "@" in cell_text:
-                                                mail_text = cell_text
-                                            elif (
-                                                any(
-                                                    char.isdigit() for char in cell_text
-                                                )
-                                                and len(cell_text) >= 7
-                                            ):
-                                                phone_text = cell_text
-
-                                    # Categorize based on title
-                                    title_upper = title_text.upper()
-                                    principal_data = {
-                                        "Name": name_text,
-                                        "Address": addr_text,
-                                        "Phone": phone_text,
-                                        "Mail": mail_text,
-                                    }
-
-                                    if (
-                                        "MANAGER" in title_upper
-                                        and "MEMBER" in title_upper
-                                    ):
-                                        if (
-                                            len(
-                                                categorized_principals["Manager/Member"]
-                                            )
-                                            < 5
-                                        ):
-                                            categorized_principals[
-                                                "Manager/Member"
-                                            ].append(principal_data)
-                                    elif "MANAGER" in title_upper:
-                                        if len(categorized_principals["Manager"]) < 5:
-                                            categorized_principals["Manager"].append(
-                                                principal_data
-                                            )
-                                    elif "MEMBER" in title_upper:
-                                        if len(categorized_principals["Member"]) < 5:
-                                            categorized_principals["Member"].append(
-                                                principal_data
-                                            )
-                                    else:
-                                        # Default to Manager if title unclear
-                                        if len(categorized_principals["Manager"]) < 5:
-                                            categorized_principals["Manager"].append(
-                                                principal_data
-                                            )
-
-                except Exception:
-                    pass
-
-                return categorized_principals
-
-            entity_type = get_field("Entity Type:")
-            status = get_field("Entity Status:")
-            formation_date = get_field("Formation Date:")
-            business_type = get_field("Business Type:")
-            domicile_state = get_field("Domicile State:")
-            statutory_agents = get_statutory_agent_info()
-            county = get_field("County:")
-            principal_info = extract_principal_info()
-
-            # Build the record with new structure
-            record = {
-                "ECORP_SEARCH_NAME": name,
-                "ECORP_TYPE": classify_name_type(name),
-                "ECORP_NAME_S": entity_name if entity_name else "",
-                "ECORP_ENTITY_ID_S": entity_id if entity_id else "",
-                "ECORP_ENTITY_TYPE": entity_type if entity_type else "",
-                "ECORP_STATUS": status if status else "",
-                "ECORP_FORMATION_DATE": formation_date if formation_date else "",
-                "ECORP_BUSINESS_TYPE": business_type if business_type else "",
-                "ECORP_STATE": domicile_state if domicile_state else "",
-                "ECORP_COUNTY": county if county else "",
-                "ECORP_COMMENTS": "",
-            }
-
-            # Add statutory agent fields (up to 3)
-            for i in range(1, 4):
-                if i <= len(statutory_agents):
-                    agent = statutory_agents[i - 1]
-                    record[f"StatutoryAgent{i}_Name"] = agent.get("Name", "")
-                    record[f"StatutoryAgent{i}_Address"] = agent.get("Address", "")
-                    record[f"StatutoryAgent{i}_Phone"] = agent.get("Phone", "")
-                    record[f"StatutoryAgent{i}_Mail"] = agent.get("Mail", "")
-                else:
-                    record[f"StatutoryAgent{i}_Name"] = ""
-                    record[f"StatutoryAgent{i}_Address"] = ""
-                    record[f"StatutoryAgent{i}_Phone"] = ""
-                    record[f"StatutoryAgent{i}_Mail"] = ""
-
-            # Add Manager fields (up to 5)
-            managers = principal_info.get("Manager", [])
-            for i in range(1, 6):
-                if i <= len(managers):
-                    mgr = managers[i - 1]
-                    record[f"Manager{i}_Name"] = mgr.get("Name", "")
-                    record[f"Manager{i}_Address"] = mgr.get("Address", "")
-                    record[f"Manager{i}_Phone"] = mgr.get("Phone", "")
-                    record[f"Manager{i}_Mail"] = mgr.get("Mail", "")
-                else:
-                    record[f"Manager{i}_Name"] = ""
-                    record[f"Manager{i}_Address"] = ""
-                    record[f"Manager{i}_Phone"] = ""
-                    record[f"Manager{i}_Mail"] = ""
-
-            # Add Manager/Member fields (up to 5)
-            mgr_members = principal_info.get("Manager/Member", [])
-            for i in range(1, 6):
-                if i <= len(mgr_members):
-                    mm = mgr_members[i - 1]
-                    record[f"Manager/Member{i}_Name"] = mm.get("Name", "")
-                    record[f"Manager/Member{i}_Address"] = mm.get("Address", "")
-                    record[f"Manager/Member{i}_Phone"] = mm.get("Phone", "")
-                    record[f"Manager/Member{i}_Mail"] = mm.get("Mail", "")
-                else:
-                    record[f"Manager/Member{i}_Name"] = ""
-                    record[f"Manager/Member{i}_Address"] = ""
-                    record[f"Manager/Member{i}_Phone"] = ""
-                    record[f"Manager/Member{i}_Mail"] = ""
-
-            # Add Member fields (up to 5)
-            members = principal_info.get("Member", [])
-            for i in range(1, 6):
-                if i <= len(members):
-                    mbr = members[i - 1]
-                    record[f"Member{i}_Name"] = mbr.get("Name", "")
-                    record[f"Member{i}_Address"] = mbr.get("Address", "")
-                    record[f"Member{i}_Phone"] = mbr.get("Phone", "")
-                    record[f"Member{i}_Mail"] = mbr.get("Mail", "")
-                else:
-                    record[f"Member{i}_Name"] = ""
-                    record[f"Member{i}_Address"] = ""
-                    record[f"Member{i}_Phone"] = ""
-                    record[f"Member{i}_Mail"] = ""
-
-            # Add Individual name fields (empty for now - will be populated for INDIVIDUAL types)
-            for i in range(1, 5):
-                record[f"IndividualName{i}"] = ""
-
-            # Add ECORP_URL - use current URL if we navigated via click
-            record["ECORP_URL"] = driver.current_url if not detail_url else detail_url
-
+            find_element_with_fallback(driver, _SEL_DETAIL_LOADED, timeout=page_timeout)
+            # Use the current URL if we navigated via click
+            record = build_entity_record(
+                name,
+                entity_name,
+                entity_id,
+                detail_page_html(driver),
+                driver.current_url if not detail_url else detail_url,
+                ecorp_type,
+            )
             entities.append(record)
 
             # Navigate back to search results
@@ -1696,13 +3525,28 @@ def search_entities(
                 driver.close()
                 driver.switch_to.window(main_window)
             else:
-                # We used Angular routing - navigate back
+                # We used Angular routing - navigate back and wait for the
+                # results rows to render again
                 driver.back()
-                time.sleep(2)  # Wait for search results to reload
+                wait_until(lambda: driver.current_url == results_url, page_timeout)
+                find_element_with_fallback(
+                    driver,
+                    _SEL_RESULTS_ROWS,
+                    timeout=page_timeout,
+                    raise_on_failure=False,
+                )
 
-        # If no entities were found, return a blank record
+        # Only the no-results dialog (handled above) confirms a name is not
+        # registered; an empty scrape after a timeout or an unread page is
+        # flagged so the blank record is not cached as "not found"
         if not entities:
-            return [get_blank_acc_record()]
+            blank = get_blank_acc_record()
+            blank["ECORP_COMMENTS"] = (
+                "Search timed out - no results confirmed"
+                if outcome is None
+                else "No entities read - no results confirmed"
+            )
+            return [blank]
 
         return entities
     except Exception as e:
@@ -1712,14 +3556,47 @@ def search_entities(
         return [blank]
 
 
-def get_blank_acc_record() -> dict:
-    """Return ACC record with all fields as empty strings.
+# Per-person columns for statutory agents and principals
+_PERSON_FIELDS = ("Name", "Address", "Phone", "Mail")
 
-    Returns
-    -------
-    dict
-        Dictionary with all ACC field keys set to empty strings
-    """
+# Person column groups in output order: (prefix, number of slots)
+_PERSON_SCHEMA = (
+    ("StatutoryAgent", 3),
+    ("Manager", 5),
+    ("Manager/Member", 5),
+    ("Member", 5),
+)
+
+# Column names per prefix and slot, built once: {"Manager": (("Manager1_Name",
+# "Manager1_Address", "Manager1_Phone", "Manager1_Mail"), ...)}
+_PERSON_KEYS = {
+    prefix: tuple(
+        tuple(f"{prefix}{i}_{field}" for field in _PERSON_FIELDS)
+        for i in range(1, slots + 1)
+    )
+    for prefix, slots in _PERSON_SCHEMA
+}
+
+
+# Parsed owner names for INDIVIDUAL records
+_INDIVIDUAL_NAME_KEYS = tuple(f"IndividualName{i}" for i in range(1, 5))
+
+# Every column holding a person's name, for extract_individual_names
+_PERSON_NAME_KEYS = (
+    tuple(keys[0] for slots in _PERSON_KEYS.values() for keys in slots)
+    + _INDIVIDUAL_NAME_KEYS
+)
+
+
+def _fill_people(record: dict, prefix: str, people: Sequence[Dict[str, str]]) -> None:
+    """Copy up to the group's slot count of people into ``record``."""
+    for keys, person in zip(_PERSON_KEYS[prefix], people):
+        for key, field in zip(keys, _PERSON_FIELDS):
+            record[key] = person.get(field, "")
+
+
+def _build_blank_acc_record() -> dict:
+    """Build the ACC record template with all fields as empty strings."""
     record = {
         "ECORP_SEARCH_NAME": "",
         "ECORP_TYPE": "",
@@ -1734,37 +3611,13 @@ def get_blank_acc_record() -> dict:
         "ECORP_COMMENTS": "",
     }
 
-    # Add StatutoryAgent fields (3 agents)
-    for i in range(1, 4):
-        record[f"StatutoryAgent{i}_Name"] = ""
-        record[f"StatutoryAgent{i}_Address"] = ""
-        record[f"StatutoryAgent{i}_Phone"] = ""
-        record[f"StatutoryAgent{i}_Mail"] = ""
-
-    # Add Manager fields (5 managers)
-    for i in range(1, 6):
-        record[f"Manager{i}_Name"] = ""
-        record[f"Manager{i}_Address"] = ""
-        record[f"Manager{i}_Phone"] = ""
-        record[f"Manager{i}_Mail"] = ""
-
-    # Add Manager/Member fields (5 entries)
-    for i in range(1, 6):
-        record[f"Manager/Member{i}_Name"] = ""
-        record[f"Manager/Member{i}_Address"] = ""
-        record[f"Manager/Member{i}_Phone"] = ""
-        record[f"Manager/Member{i}_Mail"] = ""
-
-    # Add Member fields (5 members)
-    for i in range(1, 6):
-        record[f"Member{i}_Name"] = ""
-        record[f"Member{i}_Address"] = ""
-        record[f"Member{i}_Phone"] = ""
-        record[f"Member{i}_Mail"] = ""
+    # StatutoryAgent (3), Manager, Manager/Member and Member (5 each) fields
+    for slots in _PERSON_KEYS.values():
+        for keys in slots:
+            record.update(dict.fromkeys(keys, ""))
 
     # Add Individual name fields (4 individuals)
-    for i in range(1, 5):
-        record[f"IndividualName{i}"] = ""
+    record.update(dict.fromkeys(_INDIVIDUAL_NAME_KEYS, ""))
 
     # Add ECORP_URL field
     record["ECORP_URL"] = ""
@@ -1772,15 +3625,44 @@ def get_blank_acc_record() -> dict:
     return record
 
 
+# Built once at import; every blank or partial record starts as a copy
+_BLANK_ACC_RECORD = _build_blank_acc_record()
+
+
+def get_blank_acc_record() -> dict:
+    """Return ACC record with all fields as empty strings.
+
+    Returns
+    -------
+    dict
+        Dictionary with all ACC field keys set to empty strings
+    """
+    return _BLANK_ACC_RECORD.copy()
+
+
+def _checkpoint_cursor_path(path: Path) -> Path:
+    """Sidecar file holding the checkpoint position for ``path``."""
+    return path.with_suffix(".cursor.json")
+
+
+def _json_default(value):
+    """Convert numpy scalars (and anything else) for ``json.dumps``."""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
 def save_checkpoint(
     path: Path, results: list, idx: int, total_records: int = None
 ) -> None:
     """Save progress checkpoint to disk for resume capability.
 
+    Records not yet on disk are appended to a JSON Lines log at ``path``;
+    a small cursor file next to it records the position and is replaced
+    atomically, so each call writes only the new records.
+
     Parameters
     ----------
     path : Path
-        Path to checkpoint file
+        Path to checkpoint log (``.jsonl``)
     results : list
         List of completed records
     idx : int
@@ -1789,8 +3671,69 @@ def save_checkpoint(
         Total number of records in current upload file (for validation)
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "wb") as f:
-        pickle.dump((results, idx, total_records), f)
+    cursor_path = _checkpoint_cursor_path(path)
+    written, offset = 0, 0
+    if cursor_path.exists() and path.exists():
+        cursor = json.loads(cursor_path.read_text())
+        written, offset = cursor["records"], cursor["offset"]
+    if written > len(results):
+        written, offset = 0, 0
+
+    with open(path, "ab") as f:
+        # Drop anything past the cursor (a write cut short by a crash)
+        f.truncate(offset)
+        for record in results[written:]:
+            f.write(json.dumps(record, default=_json_default).encode("utf-8") + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+        offset = f.tell()
+
+    tmp_path = cursor_path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {
+                "idx": idx,
+                "total": total_records,
+                "records": len(results),
+                "offset": offset,
+            }
+        )
+    )
+    os.replace(tmp_path, cursor_path)
+
+
+def load_checkpoint(path: Path) -> Optional[Tuple[list, int, Optional[int]]]:
+    """Load a checkpoint written by :func:`save_checkpoint`.
+
+    Parameters
+    ----------
+    path : Path
+        Path to checkpoint log (``.jsonl``)
+
+    Returns
+    -------
+    Optional[Tuple[list, int, Optional[int]]]
+        ``(results, idx, total_records)``, or None if there is no checkpoint
+    """
+    cursor_path = _checkpoint_cursor_path(path)
+    if not cursor_path.exists() or not path.exists():
+        return None
+    cursor = json.loads(cursor_path.read_text())
+    with open(path, "rb") as f:
+        data = f.read(cursor["offset"])
+    results = [json.loads(line) for line in data.splitlines()]
+    if len(results) != cursor["records"]:
+        raise ValueError(
+            f"checkpoint has {len(results)} records, cursor says {cursor['records']}"
+        )
+    return results, cursor["idx"], cursor["total"]
+
+
+def clear_checkpoint(path: Path) -> None:
+    """Delete the checkpoint log at ``path`` and its cursor file."""
+    for p in (path, _checkpoint_cursor_path(path)):
+        if p.exists():
+            p.unlink()
 
 
 def extract_timestamp_from_path(path: Path) -> str:
@@ -1815,15 +3758,105 @@ def extract_timestamp_from_path(path: Path) -> str:
     return datetime.now().strftime("%m.%d.%I-%M-%S")
 
 
+def _is_cacheable(results: List[Dict[str, str]]) -> bool:
+    """Return True unless a record carries an error comment.
+
+    search_entities fills ECORP_COMMENTS only when the lookup failed (login,
+    CAPTCHA, rate limit, unexpected error) or came back empty without the
+    no-results dialog (search timed out); a confirmed "not found" is cached.
+    """
+    return not any(r.get("ECORP_COMMENTS") for r in results)
+
+
+class AccCache:
+    """SQLite-backed owner name -> ACC results cache that survives restarts.
+
+    Behaves like the dict it replaces (``in``, ``[]``, ``len``). Results are
+    stored as JSON with the time they were saved; rows older than
+    ``ttl_days`` are treated as missing and purged when the cache is opened.
+    Safe to share between AccPool workers.
+
+    Parameters
+    ----------
+    path : Path
+        SQLite database file (created if missing)
+    ttl_days : float
+        Age in days after which a cached lookup is searched again
+    """
+
+    def __init__(self, path: Path, ttl_days: float = 30.0) -> None:
+        self.path = Path(path)
+        self.ttl = ttl_days * 86400
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS acc_cache "
+                "(owner TEXT PRIMARY KEY, json TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "DELETE FROM acc_cache WHERE ts < ?", (self._oldest_valid(),)
+            )
+
+    def _oldest_valid(self) -> float:
+        return time.time() - self.ttl
+
+    def get(self, owner_name: str, default=None):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT json FROM acc_cache WHERE owner = ? AND ts >= ?",
+                (owner_name, self._oldest_valid()),
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def __contains__(self, owner_name: str) -> bool:
+        return self.get(owner_name) is not None
+
+    def __getitem__(self, owner_name: str) -> List[Dict[str, str]]:
+        results = self.get(owner_name)
+        if results is None:
+            raise KeyError(owner_name)
+        return results
+
+    def __setitem__(self, owner_name: str, results: List[Dict[str, str]]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO acc_cache (owner, json, ts) VALUES (?, ?, ?)",
+                (owner_name, json.dumps(results), time.time()),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM acc_cache WHERE ts >= ?",
+                (self._oldest_valid(),),
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
 def get_cached_or_lookup(
-    cache: dict, owner_name: str, driver: webdriver.Chrome, settings=None
+    cache: Union[dict, AccCache],
+    owner_name: str,
+    driver: webdriver.Chrome,
+    settings=None,
 ) -> List[Dict[str, str]]:
     """Check cache before performing ACC lookup to avoid duplicates.
 
+    Failed lookups (records with an ECORP_COMMENTS error) are not cached, so
+    a transient failure is retried next time.
+
     Parameters
     ----------
-    cache : dict
-        In-memory cache mapping owner names to ACC results
+    cache : dict or AccCache
+        Cache mapping owner names to ACC results
     owner_name : str
         Owner name to lookup
     driver : webdriver.Chrome
@@ -1840,10 +3873,256 @@ def get_cached_or_lookup(
         return cache[owner_name]
 
     results = search_entities(driver, owner_name, settings)
-    cache[owner_name] = results
+    if _is_cacheable(results):
+        cache[owner_name] = results
     return results
 
 
+# Seconds every AccPool worker pauses after any worker hits a rate limit
+RATE_LIMIT_BACKOFF = 60.0
+
+# Start offset per worker slot so parallel sessions do not search in lockstep
+WORKER_JITTER = 0.1
+
+# Seconds between progress lines in generate_ecorp_complete
+PROGRESS_INTERVAL = 30.0
+
+
+def _is_rate_limited(results: List[Dict[str, str]]) -> bool:
+    """Return True if search_entities reported a rate limit for this lookup."""
+    return any(r.get("ECORP_COMMENTS", "").startswith("Rate limited") for r in results)
+
+
+class DriverPool:
+    """Warm Chrome drivers handed out to one caller at a time.
+
+    ``with pool.acquire() as driver:`` borrows an idle driver and returns it
+    afterwards, blocking while all of them are busy.
+
+    Parameters
+    ----------
+    drivers : Sequence[webdriver.Chrome]
+        Ready drivers; the slot of each is its position
+    """
+
+    def __init__(self, drivers: Sequence[webdriver.Chrome]) -> None:
+        if not drivers:
+            raise ValueError("DriverPool needs at least one driver")
+        self.drivers = list(drivers)
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        for driver in self.drivers:
+            self._idle.put(driver)
+
+    def __len__(self) -> int:
+        return len(self.drivers)
+
+    @classmethod
+    def start(
+        cls, size: int, headless: bool = True, settings=None, first_slot: int = 0
+    ) -> "DriverPool":
+        """Start ``size`` drivers in parallel and log each one in once.
+
+        With ``profile_dir`` configured, slot N uses ``<profile_dir>/worker-N``
+        so its cookies survive between runs (generate_ecorp_complete gives
+        the shared driver_session driver slot 0). A driver that lands on the login
+        page is logged in when credentials are configured; otherwise
+        search_entities logs in on first use.
+
+        Parameters
+        ----------
+        size : int
+            Number of drivers to start
+        headless : bool
+            Whether to run Chrome in headless mode
+        settings : EcorpSettings, optional
+            Configuration settings (profile_dir, credentials, URLs)
+        first_slot : int
+            Slot number of the first driver, for profile directory names
+
+        Returns
+        -------
+        DriverPool
+            Pool of the started drivers
+        """
+
+        def start_one(slot: int) -> webdriver.Chrome:
+            profile_dir = None
+            if settings is not None and settings.profile_dir is not None:
+                profile_dir = settings.profile_dir / f"worker-{slot}"
+            driver = setup_driver(headless, profile_dir=profile_dir)
+            if settings is not None and settings.email and settings.password:
+                try:
+                    driver.get(settings.base_url)
+                    landed = wait_for_search_page(
+                        driver,
+                        search_input_chain(settings.base_url),
+                        settings.page_load_timeout,
+                    )
+                    if landed == "login":
+                        perform_login(driver, settings)
+                except Exception as e:
+                    logger.debug(f"Pre-login failed for worker {slot}: {e}")
+            return driver
+
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [
+                executor.submit(start_one, slot)
+                for slot in range(first_slot, first_slot + size)
+            ]
+        drivers, errors = [], []
+        for future in futures:
+            try:
+                drivers.append(future.result())
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            cls._quit_all(drivers)
+            raise errors[0]
+        return cls(drivers)
+
+    @contextmanager
+    def acquire(self) -> Iterator[webdriver.Chrome]:
+        """Borrow an idle driver for the duration of the ``with`` block."""
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+
+    def slot(self, driver: webdriver.Chrome) -> int:
+        """Return the position of ``driver`` in the pool."""
+        return next(i for i, d in enumerate(self.drivers) if d is driver)
+
+    @staticmethod
+    def _quit_all(drivers: Sequence[webdriver.Chrome]) -> None:
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Error quitting pooled driver: {e}")
+
+    def quit(self) -> None:
+        """Quit every driver in the pool."""
+        self._quit_all(self.drivers)
+
+
+class AccPool:
+    """Run ACC lookups on several Chrome sessions in parallel.
+
+    Each worker thread borrows one driver from a DriverPool for the duration
+    of a ``search_entities`` call, so a driver is never shared between threads.
+    Successful results are cached by owner name under a lock. Every name's
+    future is also kept for the life of the pool, so a name that is cached,
+    in flight or already looked up in this run (even if the lookup failed)
+    is not searched again. When rate limit detection is
+    enabled, a rate limit seen by any worker pauses all of them for
+    ``backoff`` seconds.
+
+    The pool does not own its drivers: the caller starts them and quits them
+    after ``close``.
+
+    Parameters
+    ----------
+    drivers : Sequence[webdriver.Chrome] or DriverPool
+        Ready drivers, one per worker
+    settings : EcorpSettings, optional
+        Configuration settings passed through to search_entities
+    cache : dict or AccCache, optional
+        Existing owner name -> results cache to share
+    backoff : float
+        Pause for all workers after a rate limit (seconds)
+    """
+
+    def __init__(
+        self,
+        drivers: Union[Sequence[webdriver.Chrome], DriverPool],
+        settings=None,
+        cache: Optional[Union[dict, AccCache]] = None,
+        backoff: float = RATE_LIMIT_BACKOFF,
+    ) -> None:
+        self.drivers = (
+            drivers if isinstance(drivers, DriverPool) else DriverPool(drivers)
+        )
+        self.settings = settings
+        self.cache = cache if cache is not None else {}
+        self.backoff = backoff
+        # Searches actually run (cache misses)
+        self.searched = 0
+        self._lock = threading.Lock()
+        # Every lookup submitted in this run, finished or not; failed results
+        # are not cached, so this is what stops a second search for them
+        self._submitted: Dict[str, Future] = {}
+        # Set while workers may search; cleared during a rate-limit backoff
+        self._clear_to_search = threading.Event()
+        self._clear_to_search.set()
+        self.size = len(self.drivers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.size, thread_name_prefix="acc"
+        )
+
+    def __enter__(self) -> "AccPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def submit(self, owner_name: str) -> Future:
+        """Schedule a lookup for ``owner_name`` and return its future.
+
+        Cached names resolve immediately; a name already submitted to this
+        pool returns its future (pending, or finished with the earlier
+        results, including a failed lookup's error record).
+        """
+        with self._lock:
+            cached = self.cache.get(owner_name)
+            if cached is not None:
+                done: Future = Future()
+                done.set_result(cached)
+                return done
+            future = self._submitted.get(owner_name)
+            if future is None:
+                future = self._executor.submit(self._lookup, owner_name)
+                self._submitted[owner_name] = future
+            return future
+
+    def lookup(self, owner_name: str) -> List[Dict[str, str]]:
+        """Look up ``owner_name`` and wait for the results."""
+        return self.submit(owner_name).result()
+
+    def _lookup(self, owner_name: str) -> List[Dict[str, str]]:
+        with self.drivers.acquire() as driver:
+            self._clear_to_search.wait()
+            slot = self.drivers.slot(driver)
+            if slot:
+                time.sleep(slot * WORKER_JITTER)
+            results = search_entities(driver, owner_name, self.settings)
+
+        if (
+            self.settings is not None
+            and self.settings.enable_rate_limit_detection
+            and _is_rate_limited(results)
+            and self._clear_to_search.is_set()
+        ):
+            logger.warning(
+                f"Rate limited - pausing all {self.size} workers "
+                f"for {self.backoff:.0f}s"
+            )
+            self._clear_to_search.clear()
+            time.sleep(self.backoff)
+            self._clear_to_search.set()
+
+        with self._lock:
+            self.searched += 1
+            if _is_cacheable(results):
+                self.cache[owner_name] = results
+        return results
+
+    def close(self) -> None:
+        """Cancel queued lookups and wait for the running ones to finish."""
+        self._clear_to_search.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
 def extract_individual_names(record: dict) -> set:
     """Extract all individual names from an Ecorp record.
 
@@ -1866,37 +4145,18 @@ def extract_individual_names(record: dict) -> set:
     """
     names = set()
 
-    # Extract Manager names (5)
-    for i in range(1, 6):
-        name = record.get(f"Manager{i}_Name", "")
+    for key in _PERSON_NAME_KEYS:
+        name = record.get(key, "")
         if name and str(name).strip():
             names.add(str(name).strip().upper())
 
-    # Extract Member names (5)
-    for i in range(1, 6):
-        name = record.get(f"Member{i}_Name", "")
-        if name and str(name).strip():
-            names.add(str(name).strip().upper())
-
-    # Extract Manager/Member names (5)
-    for i in range(1, 6):
-        name = record.get(f"Manager/Member{i}_Name", "")
-        if name and str(name).strip():
-            names.add(str(name).strip().upper())
-
-    # Extract Statutory Agent names (3)
-    for i in range(1, 4):
-        name = record.get(f"StatutoryAgent{i}_Name", "")
-        if name and str(name).strip():
-            names.add(str(name).strip().upper())
+    return names
 
-    # Extract Individual names (4)
-    for i in range(1, 5):
-        name = record.get(f"IndividualName{i}", "")
-        if name and str(name).strip():
-            names.add(str(name).strip().upper())
 
-    return names
+@lru_cache(maxsize=131072)
+def _sorted_tokens(name: str) -> str:
+    """Return ``name`` with its words sorted, as token_sort_ratio compares it."""
+    return " ".join(sorted(name.split()))
 
 
 def calculate_person_overlap(
@@ -1926,37 +4186,26 @@ def calculate_person_overlap(
     if not names1 or not names2:
         return 0.0
 
-    from rapidfuzz import fuzz
-
-    # Count matches from names1 -> names2
-    matches_from_1 = 0
-    for name1 in names1:
-        best_match_score = 0
-        for name2 in names2:
-            # Use token_sort_ratio for better handling of name variations
-            similarity = fuzz.token_sort_ratio(name1, name2)
-            best_match_score = max(best_match_score, similarity)
-
-        if best_match_score >= threshold:
-            matches_from_1 += 1
-
-    # Count matches from names2 -> names1
-    matches_from_2 = 0
-    for name2 in names2:
-        best_match_score = 0
-        for name1 in names1:
-            similarity = fuzz.token_sort_ratio(name2, name1)
-            best_match_score = max(best_match_score, similarity)
-
-        if best_match_score >= threshold:
-            matches_from_2 += 1
+    # Score every pair in one call on token-sorted names (token_sort_ratio,
+    # with each name sorted once instead of once per pair). Row maxima give
+    # the best match for each name in names1, column maxima the best match
+    # for each name in names2. Pairs that cannot reach the threshold (their
+    # lengths alone rule it out) are cut short and score 0.
+    scores = process.cdist(
+        [_sorted_tokens(name) for name in names1],
+        [_sorted_tokens(name) for name in names2],
+        scorer=fuzz.ratio,
+        score_cutoff=threshold,
+    )
+    matches_from_1 = (scores.max(axis=1) >= threshold).sum()
+    matches_from_2 = (scores.max(axis=0) >= threshold).sum()
 
     # Calculate bidirectional average
     # Average of: (matches_from_1 / len(names1)) and (matches_from_2 / len(names2))
-    similarity_1 = (matches_from_1 / len(names1)) * 100 if names1 else 0.0
-    similarity_2 = (matches_from_2 / len(names2)) * 100 if names2 else 0.0
+    similarity_1 = (matches_from_1 / len(names1)) * 100
+    similarity_2 = (matches_from_2 / len(names2)) * 100
 
-    return (similarity_1 + similarity_2) / 2.0
+    return float(similarity_1 + similarity_2) / 2.0
 
 
 def assign_grouped_indexes_by_individuals(
@@ -1966,7 +4215,8 @@ def assign_grouped_indexes_by_individuals(
 
     Groups records that share significant overlap in key individuals
     (managers, members, statutory agents). Records with >= threshold
-    person overlap get the same ECORP_INDEX_#.
+    person overlap are linked, and linked records share an ECORP_INDEX_#
+    transitively (union-find), so the groups do not depend on record order.
 
     This identifies corporate families and related entities under common control.
 
@@ -1980,7 +4230,8 @@ def assign_grouped_indexes_by_individuals(
     Returns
     -------
     List[int]
-        List of ECORP_INDEX_# assignments, one per record
+        List of ECORP_INDEX_# assignments, one per record, numbered in order
+        of each group's first record
 
     Examples
     --------
@@ -1991,43 +4242,98 @@ def assign_grouped_indexes_by_individuals(
     Record 3: Managers=["ALICE WILLIAMS"]
     → Gets ECORP_INDEX_# = 2 (new group)
     """
+    # Extract every record's individual names once, hashable for dedup
+    all_names = [frozenset(extract_individual_names(record)) for record in results]
+
+    # Records with the same names always group together, so only distinct
+    # name sets are compared (in order of first appearance)
+    name_sets = list(dict.fromkeys(names for names in all_names if names))
+    set_positions = {names: pos for pos, names in enumerate(name_sets)}
+
+    parent = list(range(len(name_sets)))
+
+    def find(pos: int) -> int:
+        while parent[pos] != pos:
+            parent[pos] = parent[parent[pos]]
+            pos = parent[pos]
+        return pos
+
+    # Token-sorted names of every name set, and the set each one belongs to
+    name_keys: List[str] = []
+    name_owners: List[int] = []
+    for pos, names in enumerate(name_sets):
+        # A set with no name matching one of ours overlaps 0%, so one cdist
+        # call against the names of every earlier set finds the only sets
+        # that can reach the threshold
+        keys = [_sorted_tokens(name) for name in names]
+        if name_keys:
+            name_hits = (
+                process.cdist(
+                    keys, name_keys, scorer=fuzz.ratio, score_cutoff=threshold
+                ).max(axis=0)
+                >= threshold
+            )
+            for other in sorted({name_owners[j] for j in name_hits.nonzero()[0]}):
+                # Already linked through another record - nothing to score
+                if find(other) == find(pos):
+                    continue
+                similarity = calculate_person_overlap(
+                    names, name_sets[other], threshold=threshold
+                )
+                if similarity >= threshold:
+                    parent[find(pos)] = find(other)
+        name_keys.extend(keys)
+        name_owners.extend([pos] * len(keys))
+
     index_assignments = []
-    groups = []  # List of (representative_name_set, group_index) tuples
+    group_indexes: Dict[int, int] = {}  # union-find root -> ECORP_INDEX_#
     next_group_index = 1
 
-    for record in results:
-        # Extract all individual names from this record
-        individual_names = extract_individual_names(record)
-
+    for names in all_names:
         # If no names found, assign unique index
-        if not individual_names:
+        if not names:
             index_assignments.append(next_group_index)
             next_group_index += 1
             continue
 
-        # Check if this set of individuals matches any existing group
-        matched_group_idx = None
-        best_similarity = 0
+        root = find(set_positions[names])
+        if root not in group_indexes:
+            group_indexes[root] = next_group_index
+            next_group_index += 1
+        index_assignments.append(group_indexes[root])
 
-        for group_names, group_idx in groups:
-            similarity = calculate_person_overlap(
-                individual_names, group_names, threshold=threshold
-            )
+    return index_assignments
 
-            if similarity >= threshold and similarity > best_similarity:
-                matched_group_idx = group_idx
-                best_similarity = similarity
 
-        if matched_group_idx is not None:
-            # Assign to existing group
-            index_assignments.append(matched_group_idx)
-        else:
-            # Create new group with this set as representative
-            index_assignments.append(next_group_index)
-            groups.append((individual_names, next_group_index))
-            next_group_index += 1
+def write_excel_rows(df: pd.DataFrame, path: Path) -> None:
+    """Write ``df`` like ``df.to_excel(path, index=False)``, streaming rows.
 
-    return index_assignments
+    pandas hands cells to xlsxwriter column by column, so the whole sheet is
+    held in memory until the workbook closes. Writing row by row lets
+    xlsxwriter's ``constant_memory`` mode flush each row to disk as it goes.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data to write; missing values become empty cells
+    path : Path
+        Output ``.xlsx`` path
+    """
+    workbook = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+    try:
+        worksheet = workbook.add_worksheet("Sheet1")
+        # Same header style pandas uses
+        header_format = workbook.add_format(
+            {"bold": True, "border": 1, "align": "center", "valign": "top"}
+        )
+        worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+        values = df.astype(object).where(df.notna(), None)
+        for row_idx, row in enumerate(
+            values.itertuples(index=False, name=None), start=1
+        ):
+            worksheet.write_row(row_idx, 0, row)
+    finally:
+        workbook.close()
 
 
 def generate_ecorp_upload(month_code: str, mcao_complete_path: Path) -> Optional[Path]:
@@ -2054,22 +4360,21 @@ def generate_ecorp_upload(month_code: str, mcao_complete_path: Path) -> Optional
     try:
         # Read MCAO_Complete file
         print(f"📋 Reading MCAO_Complete: {mcao_complete_path.name}")
-        df = pd.read_excel(mcao_complete_path)
-
-        # Validate columns exist
-        if len(df.columns) < 5:
-            print(
-                f"❌ MCAO_Complete must have at least 5 columns, found {len(df.columns)}"
-            )
+        # Only columns A, B and E are parsed; the rest of the sheet is skipped
+        try:
+            df = pd.read_excel(mcao_complete_path, usecols=[0, 1, 4])
+        except pd.errors.ParserError as e:
+            # usecols beyond the last column (fewer than 5 columns)
+            print(f"❌ MCAO_Complete must have at least 5 columns: {e}")
             return None
 
-        # Extract columns (0-indexed)
+        # Extract columns (0-indexed within the three that were read)
         upload_df = pd.DataFrame(
             {
                 "FULL_ADDRESS": df.iloc[:, 0],  # Column A
                 "COUNTY": df.iloc[:, 1],  # Column B
-                "Owner_Ownership": df.iloc[:, 4],  # Column E (0-indexed = 4)
-                "OWNER_TYPE": df.iloc[:, 4].apply(classify_owner_type),  # Classify
+                "Owner_Ownership": df.iloc[:, 2],  # Column E
+                "OWNER_TYPE": classify_owner_type_series(df.iloc[:, 2]),  # Classify
             }
         )
 
@@ -2124,7 +4429,8 @@ def generate_ecorp_complete(
 
     Features:
     - Progress checkpointing every 50 records
-    - In-memory caching to avoid duplicate lookups
+    - Lookup cache persisted in SQLite (ADHS_ECORP_CACHE_PATH) across runs
+    - Parallel lookups across ADHS_ECORP_MAX_WORKERS Chrome sessions
     - Ctrl+C interrupt handling with save
     - Graceful handling of blank Owner_Ownership
     - Sequential record indexing (ECORP_INDEX_#)
@@ -2158,191 +4464,247 @@ def generate_ecorp_complete(
         total_records = len(df_upload)
 
         # Setup
-        checkpoint_file = Path(f"Ecorp/.checkpoint_{month_code}.pkl")
+        checkpoint_file = Path(f"Ecorp/.checkpoint_{month_code}.jsonl")
         results = []
         start_idx = 0
-        cache = {}  # In-memory cache
+        cache = {}  # In-memory cache (standalone runs without settings)
 
         # Initialize Ecorp settings
         settings = None
         if get_ecorp_settings is not None:
             settings = get_ecorp_settings(headless=headless)
+            # Lookups from earlier runs are reused until they expire
+            cache = AccCache(settings.cache_path, settings.cache_ttl_days)
             print(f"🔧 Using base URL: {settings.base_url}")
+            print(f"   ACC cache: {settings.cache_path} ({len(cache)} owners)")
             print(
-                f"   Delays: {settings.min_delay}-{settings.max_delay}s | "
+                f"   Results wait: up to {settings.max_delay}s | "
                 f"CAPTCHA detection: {settings.enable_captcha_detection} | "
                 f"Rate limit detection: {settings.enable_rate_limit_detection}"
             )
 
         # Load checkpoint if exists and validate it
-        if checkpoint_file.exists():
-            try:
-                with open(checkpoint_file, "rb") as f:
-                    checkpoint_data = pickle.load(f)
-
-                # Handle old format (results, idx) or new format (results, idx, total)
-                if len(checkpoint_data) == 3:
-                    results, start_idx, checkpoint_total = checkpoint_data
-
-                    # Validate checkpoint matches current upload file
-                    if checkpoint_total != total_records:
-                        print(
-                            f"⚠️  Checkpoint mismatch: checkpoint has {checkpoint_total} records, "
-                            f"but upload has {total_records} records"
-                        )
-                        print("   Deleting stale checkpoint and starting fresh...")
-                        checkpoint_file.unlink()
-                        results = []
-                        start_idx = 0
-                    else:
-                        print(
-                            f"📂 Resuming from checkpoint: record {start_idx + 1}/{total_records}"
-                        )
-                else:
-                    # Old format checkpoint - assume it's stale, start fresh
-                    results, start_idx = checkpoint_data
-                    print(
-                        "⚠️  Old checkpoint format detected (no record count validation)"
-                    )
-                    print("   Deleting old checkpoint and starting fresh...")
-                    checkpoint_file.unlink()
-                    results = []
-                    start_idx = 0
-
-            except Exception as e:
-                print(f"⚠️  Error loading checkpoint: {e}")
-                print("   Deleting corrupted checkpoint and starting fresh...")
-                checkpoint_file.unlink()
+        try:
+            checkpoint_data = load_checkpoint(checkpoint_file)
+        except Exception as e:
+            print(f"⚠️  Error loading checkpoint: {e}")
+            print("   Deleting corrupted checkpoint and starting fresh...")
+            clear_checkpoint(checkpoint_file)
+            checkpoint_data = None
+
+        if checkpoint_data is not None:
+            results, start_idx, checkpoint_total = checkpoint_data
+
+            # Validate checkpoint matches current upload file
+            if checkpoint_total != total_records:
+                print(
+                    f"⚠️  Checkpoint mismatch: checkpoint has {checkpoint_total} records, "
+                    f"but upload has {total_records} records"
+                )
+                print("   Deleting stale checkpoint and starting fresh...")
+                clear_checkpoint(checkpoint_file)
                 results = []
                 start_idx = 0
+            else:
+                print(
+                    f"📂 Resuming from checkpoint: record {start_idx + 1}/{total_records}"
+                )
 
-        # Initialize driver
-        print("🌐 Initializing Chrome WebDriver...")
-        driver = setup_driver(headless)
-
-        try:
-            start_time = time.time()
-
-            for idx, row in df_upload.iloc[start_idx:].iterrows():
-                # Progress indicator
-                if idx > 0 and idx % 10 == 0:
-                    elapsed = time.time() - start_time
-                    rate = idx / elapsed if elapsed > 0 else 0
-                    remaining = (total_records - idx) / rate if rate > 0 else 0
-                    print(
-                        f"   Progress: {idx}/{total_records} ({idx*100//total_records}%) | "
-                        f"Rate: {rate:.1f} rec/sec | ETA: {remaining/60:.1f} min",
-                        flush=True,
-                    )
+        # Upload columns as plain lists; rows are read by position
+        addresses = df_upload["FULL_ADDRESS"].tolist()
+        counties = df_upload["COUNTY"].tolist()
+        owners = df_upload["Owner_Ownership"].tolist()
+        owner_types = df_upload["OWNER_TYPE"].tolist()
+
+        # Distinct business owners still to look up, in row order
+        business_names = dict.fromkeys(
+            str(owner_name)
+            for owner_name, owner_type in zip(
+                owners[start_idx:], owner_types[start_idx:]
+            )
+            if owner_type != "INDIVIDUAL"
+            and not (pd.isna(owner_name) or str(owner_name).strip() == "")
+        )
 
-                # Get Upload data
-                owner_name = row["Owner_Ownership"]
-                owner_type = row["OWNER_TYPE"]
-
-                # ACC lookup (columns F-CO)
-                if pd.isna(owner_name) or str(owner_name).strip() == "":
-                    # Blank owner - use empty ACC record
-                    acc_data = get_blank_acc_record()
-                elif owner_type == "INDIVIDUAL":
-                    # For INDIVIDUAL type, skip ACC lookup and parse names instead
-                    acc_data = get_blank_acc_record()
-                    # Parse individual names
-                    parsed_names = parse_individual_names(owner_name)
-                    # Populate IndividualName fields
-                    for i, parsed_name in enumerate(parsed_names[:4], 1):
-                        acc_data[f"IndividualName{i}"] = parsed_name
-                else:
-                    # BUSINESS type - do ACC lookup with caching
-                    acc_results = get_cached_or_lookup(
-                        cache, str(owner_name), driver, settings
+        # Chrome is only started if some business owner is not cached yet;
+        # all-INDIVIDUAL (or fully cached) uploads never open a browser
+        needs_search = any(name not in cache for name in business_names)
+        if needs_search:
+            # Reuse the process-wide Chrome session (started on first use).
+            # With ADHS_ECORP_PROFILE_DIR it is worker slot 0 and keeps its
+            # cookies, so the login survives into the next run
+            print("🌐 Initializing Chrome WebDriver...")
+            profile_dir = (
+                settings.profile_dir / "worker-0"
+                if settings and settings.profile_dir is not None
+                else None
+            )
+            session = driver_session(
+                headless, reset=profile_dir is None, profile_dir=profile_dir
+            )
+        else:
+            print("   No ACC searches needed - Chrome not started")
+            session = nullcontext(None)
+
+        with session as driver:
+            # Extra Chrome sessions for parallel lookups (ADHS_ECORP_MAX_WORKERS)
+            workers = settings.max_workers if settings and needs_search else 1
+            # Started together, each logged in once (ADHS_ECORP_PROFILE_DIR
+            # keeps their logins between runs)
+            extra = (
+                DriverPool.start(workers - 1, headless, settings, first_slot=1)
+                if workers > 1
+                else None
+            )
+            pool = AccPool([driver, *(extra.drivers if extra else ())], settings, cache)
+            try:
+                start_time = time.time()
+                last_progress = start_time
+                if workers > 1:
+                    print(f"   Parallel lookups: {workers} Chrome sessions")
+
+                # Queue each distinct business name once, up front; the loop
+                # below takes the results in row order while the workers
+                # search ahead (repeat rows reuse the name's queued search,
+                # even when it failed)
+                for owner_name in business_names:
+                    pool.submit(owner_name)
+
+                # Parse every INDIVIDUAL owner up front, once per distinct name
+                parsed_individuals = parse_individual_names_series(
+                    df_upload["Owner_Ownership"].where(
+                        df_upload["OWNER_TYPE"] == "INDIVIDUAL"
                     )
-                    acc_data = acc_results[0] if acc_results else get_blank_acc_record()
-
-                # Build complete record in correct column order (93 columns: A-CO)
-                # A-C: Upload columns, D: Index, E: Owner Type, F-CO: ACC fields
-                complete_record = {
-                    "FULL_ADDRESS": row["FULL_ADDRESS"],  # A
-                    "COUNTY": row["COUNTY"],  # B
-                    "Owner_Ownership": row["Owner_Ownership"],  # C
-                    "ECORP_INDEX_#": idx + 1,  # D (sequential number)
-                    "OWNER_TYPE": row["OWNER_TYPE"],  # E
-                    **acc_data,  # F-CO (ACC fields including ECORP_URL)
-                }
-                results.append(complete_record)
+                ).tolist()
+
+                for idx in range(start_idx, total_records):
+                    # Progress indicator, at most every PROGRESS_INTERVAL seconds
+                    now = time.time()
+                    if now - last_progress >= PROGRESS_INTERVAL:
+                        last_progress = now
+                        elapsed = now - start_time
+                        # Rate over the records done in this run (not resumed ones)
+                        rate = (idx - start_idx) / elapsed if elapsed > 0 else 0
+                        remaining = (total_records - idx) / rate if rate > 0 else 0
+                        print(
+                            f"   Progress: {idx}/{total_records} ({idx*100//total_records}%) | "
+                            f"Rate: {rate:.1f} rec/sec | ETA: {remaining/60:.1f} min",
+                            flush=True,
+                        )
 
-                # Checkpoint every 50 records
-                if (idx + 1) % 50 == 0:
-                    save_checkpoint(checkpoint_file, results, idx + 1, total_records)
-                    print(f"   💾 Checkpoint saved at {idx + 1} records")
+                    # Get Upload data
+                    owner_name = owners[idx]
+                    owner_type = owner_types[idx]
+
+                    # ACC lookup (columns F-CO)
+                    if pd.isna(owner_name) or str(owner_name).strip() == "":
+                        # Blank owner - use empty ACC record
+                        acc_data = get_blank_acc_record()
+                    elif owner_type == "INDIVIDUAL":
+                        # For INDIVIDUAL type, skip ACC lookup and parse names instead
+                        acc_data = get_blank_acc_record()
+                        # Parse individual names
+                        parsed_names = parsed_individuals[idx]
+                        # Populate IndividualName fields
+                        acc_data.update(zip(_INDIVIDUAL_NAME_KEYS, parsed_names))
+                    else:
+                        # BUSINESS type - ACC lookup (cached, queued above)
+                        acc_results = pool.lookup(str(owner_name))
+                        acc_data = (
+                            acc_results[0] if acc_results else get_blank_acc_record()
+                        )
 
-            # Group records by individual overlap and reassign ECORP_INDEX_#
-            print("\n🔍 Grouping records by individual overlap (threshold: 85%)...")
-            index_assignments = assign_grouped_indexes_by_individuals(
-                results, threshold=85.0
-            )
+                    # Build complete record in correct column order (93 columns: A-CO)
+                    # A-C: Upload columns, D: Index, E: Owner Type, F-CO: ACC fields
+                    complete_record = {
+                        "FULL_ADDRESS": addresses[idx],  # A
+                        "COUNTY": counties[idx],  # B
+                        "Owner_Ownership": owner_name,  # C
+                        "ECORP_INDEX_#": idx + 1,  # D (sequential number)
+                        "OWNER_TYPE": owner_type,  # E
+                        **acc_data,  # F-CO (ACC fields including ECORP_URL)
+                    }
+                    results.append(complete_record)
+
+                    # Checkpoint every 50 records
+                    if (idx + 1) % 50 == 0:
+                        save_checkpoint(
+                            checkpoint_file, results, idx + 1, total_records
+                        )
+                        print(f"   💾 Checkpoint saved at {idx + 1} records")
 
-            # Update ECORP_INDEX_# in all records
-            for idx, record in enumerate(results):
-                record["ECORP_INDEX_#"] = index_assignments[idx]
+                # Group records by individual overlap and reassign ECORP_INDEX_#
+                print("\n🔍 Grouping records by individual overlap (threshold: 85%)...")
+                index_assignments = assign_grouped_indexes_by_individuals(
+                    results, threshold=85.0
+                )
 
-            unique_groups = len(set(index_assignments))
-            print(
-                f"   ✅ Grouped {len(results)} records into {unique_groups} unique groups"
-            )
-            print(
-                f"   📊 Average group size: {len(results)/unique_groups:.1f} records per group"
-            )
+                # Update ECORP_INDEX_# in all records
+                for idx, record in enumerate(results):
+                    record["ECORP_INDEX_#"] = index_assignments[idx]
 
-            # Save final Complete file with new naming
-            # Extract timestamp from Upload file (or use current if not found)
-            timestamp = extract_timestamp_from_filename(upload_path.name)
-            if not timestamp:
-                timestamp = get_standard_timestamp()
+                unique_groups = len(set(index_assignments))
+                print(
+                    f"   ✅ Grouped {len(results)} records into {unique_groups} unique groups"
+                )
+                print(
+                    f"   📊 Average group size: {len(results)/unique_groups:.1f} records per group"
+                )
 
-            # Generate new format filename
-            new_filename = format_output_filename(
-                month_code, "Ecorp_Complete", timestamp
-            )
+                # Save final Complete file with new naming
+                # Extract timestamp from Upload file (or use current if not found)
+                timestamp = extract_timestamp_from_filename(upload_path.name)
+                if not timestamp:
+                    timestamp = get_standard_timestamp()
 
-            # Generate legacy format filename
-            legacy_filename = get_legacy_filename(
-                month_code, "Ecorp_Complete", timestamp
-            )
+                # Generate new format filename
+                new_filename = format_output_filename(
+                    month_code, "Ecorp_Complete", timestamp
+                )
 
-            output_dir = Path("Ecorp/Complete")
-            output_dir.mkdir(parents=True, exist_ok=True)
+                # Generate legacy format filename
+                legacy_filename = get_legacy_filename(
+                    month_code, "Ecorp_Complete", timestamp
+                )
 
-            new_path = output_dir / new_filename
-            legacy_path = output_dir / legacy_filename
+                output_dir = Path("Ecorp/Complete")
+                output_dir.mkdir(parents=True, exist_ok=True)
 
-            df_complete = pd.DataFrame(results)
-            df_complete.to_excel(new_path, index=False, engine="xlsxwriter")
+                new_path = output_dir / new_filename
+                legacy_path = output_dir / legacy_filename
 
-            # Create legacy copy for backward compatibility
-            save_excel_with_legacy_copy(new_path, legacy_path)
+                df_complete = pd.DataFrame(results)
+                write_excel_rows(df_complete, new_path)
 
-            elapsed_total = time.time() - start_time
-            print(f"\n✅ Created Ecorp Complete: {new_path}")
-            print(f"✅ Created legacy copy: {legacy_path}")
-            print(f"   Total time: {elapsed_total/60:.1f} minutes")
-            print(f"   Cache hits: {total_records - len(cache)} lookups saved")
+                # Create legacy copy for backward compatibility (a file copy)
+                save_excel_with_legacy_copy(new_path, legacy_path)
 
-            # Clean up checkpoint
-            if checkpoint_file.exists():
-                checkpoint_file.unlink()
+                elapsed_total = time.time() - start_time
+                print(f"\n✅ Created Ecorp Complete: {new_path}")
+                print(f"✅ Created legacy copy: {legacy_path}")
+                print(f"   Total time: {elapsed_total/60:.1f} minutes")
+                print(
+                    f"   ACC searches: {pool.searched} (the rest came from the cache)"
+                )
 
-            return True
+                # Clean up checkpoint
+                clear_checkpoint(checkpoint_file)
 
-        except KeyboardInterrupt:
-            print("\n⚠️  Interrupted by user - saving progress...")
-            save_checkpoint(checkpoint_file, results, idx, total_records)
-            print(
-                f"💾 Progress saved to checkpoint. Run again to resume from record {idx + 1}"
-            )
-            return False
+                return True
 
-        finally:
-            driver.quit()
+            except KeyboardInterrupt:
+                print("\n⚠️  Interrupted by user - saving progress...")
+                save_checkpoint(checkpoint_file, results, idx, total_records)
+                print(
+                    f"💾 Progress saved to checkpoint. Run again to resume from record {idx + 1}"
+                )
+                return False
+            finally:
+                pool.close()
+                if isinstance(cache, AccCache):
+                    cache.close()
+                if extra is not None:
+                    extra.quit()
 
     except Exception as e:
         print(f"❌ Error processing Ecorp Complete: {e}")
@@ -21,14 +21,26 @@ Output Files:
   * ECORP_URL - ACC entity detail page URL from ecorp.azcc.gov
 """
 
+import re
 import time
-import pickle
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from urllib.parse import urljoin
+from typing import List, Dict, Optional, Tuple
 
 import pandas as pd
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+
+try:
+    # Optional: Arrow-backed strings run the bulk classifier's upper/contains
+    # in C++ kernels instead of a Python loop over object values
+    import pyarrow  # noqa: F401
+
+    ARROW_STRINGS = True
+except ImportError:
+    ARROW_STRINGS = False
 
 # Import timestamp utilities for standardized naming
 try:
@@ -39,6 +51,13 @@ try:
         save_excel_with_legacy_copy,
         extract_timestamp_from_filename,
     )
+    from .ecorp import (
+        clear_checkpoint,
+        fetch_detail_pages,
+        http_session_from_driver,
+        load_checkpoint,
+        save_checkpoint,
+    )
 except ImportError:
     # For standalone script execution
     import sys
@@ -52,7 +71,15 @@ except ImportError:
         save_excel_with_legacy_copy,
         extract_timestamp_from_filename,
     )
+    from ecorp import (
+        clear_checkpoint,
+        fetch_detail_pages,
+        http_session_from_driver,
+        load_checkpoint,
+        save_checkpoint,
+    )
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
@@ -61,7 +88,114 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
-
+# Detail page labels, precompiled so BeautifulSoup's string search runs a
+# regex per text node instead of calling back into a Python lambda
+_LABEL_RES = {
+    label: re.compile(re.escape(label))
+    for label in (
+        "Entity Type:",
+        "Entity Status:",
+        "Formation Date:",
+        "Business Type:",
+        "Domicile State:",
+        "County:",
+    )
+}
+
+
+# Entity keywords; a name containing any of them is an Entity
+ENTITY_KEYWORDS = (
+    "LLC",
+    "CORP",
+    "INC",
+    "SCHOOL",
+    "DISTRICT",
+    "TRUST",
+    "FOUNDATION",
+    "COMPANY",
+    "CO.",
+    "ASSOCIATION",
+    "CHURCH",
+    "PROPERTIES",
+    "LP",
+    "LTD",
+    "PARTNERSHIP",
+    "FUND",
+    "HOLDINGS",
+    "INVESTMENTS",
+    "VENTURES",
+    "GROUP",
+    "ENTERPRISE",
+    "BORROWER",
+    "ACADEMY",
+    "COLLEGE",
+    "UNIVERSITY",
+    "MEDICAL",
+    "HEALTH",
+    "CARE",
+    "SOBER",
+    "LEARNING",
+    "PRESCHOOL",
+    # Additional business/organization keywords
+    "CENTERS",
+    "CENTER",
+    "HOSPICE",
+    "HOSPITAL",
+    "CLINIC",
+    "STATE OF",
+    "CITY OF",
+    "COUNTY OF",
+    "TOWN OF",
+    "UNITED STATES",
+    "GOVERNMENT",
+    "FEDERAL",
+    "MUNICIPAL",
+    "ARMY",
+    "NAVY",
+    "AIR FORCE",
+    "MILITARY",
+    "SALVATION",
+    "ARC",
+    "HOUSE",
+    "HOME",
+    "HOMES",
+    "LIVING",
+    "SENIOR",
+    "FACILITY",
+    "FACILITIES",
+    "SERVICES",
+    "SERVICE",
+    "UNITED",
+    "METHODIST",
+    "LUTHERAN",
+    "EVANGELICAL",
+    "BAPTIST",
+    "CATHOLIC",
+    "CHRISTIAN",
+    "CONGREGATION",
+    "PRESBYTERY",
+    "ASSEMBLY",
+    "LEAGUE",
+    "ASSOCIATES",
+    "JOINT VENTURE",
+    "DST",
+    "LIMITED",
+    "PARTNERS",
+    "SETTLEMENT",
+    "HABILITATION",
+)
+ENTITY_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in ENTITY_KEYWORDS))
+
+# Words that keep a 2-4 word name from being read as a person's name
+_PROPERTY_WORDS = frozenset({"PROPERTY", "REAL", "ESTATE", "DEVELOPMENT", "RENTAL"})
+
+# Whole-word property test for the Arrow classifier (RE2 syntax)
+_PROPERTY_WORD_PATTERN = (
+    r"(?:^|\s)(?:" + "|".join(sorted(_PROPERTY_WORDS)) + r")(?:\s|$)"
+)
+
+
+@lru_cache(maxsize=131072)
 def classify_name_type(name: str) -> str:
     """Classify a name as Entity or Individual(s) based on keywords and patterns.
 
@@ -80,102 +214,16 @@ def classify_name_type(name: str) -> str:
 
     name_upper = str(name).upper()
 
-    # Entity keywords
-    entity_keywords = [
-        "LLC",
-        "CORP",
-        "INC",
-        "SCHOOL",
-        "DISTRICT",
-        "TRUST",
-        "FOUNDATION",
-        "COMPANY",
-        "CO.",
-        "ASSOCIATION",
-        "CHURCH",
-        "PROPERTIES",
-        "LP",
-        "LTD",
-        "PARTNERSHIP",
-        "FUND",
-        "HOLDINGS",
-        "INVESTMENTS",
-        "VENTURES",
-        "GROUP",
-        "ENTERPRISE",
-        "BORROWER",
-        "ACADEMY",
-        "COLLEGE",
-        "UNIVERSITY",
-        "MEDICAL",
-        "HEALTH",
-        "CARE",
-        "SOBER",
-        "LEARNING",
-        "PRESCHOOL",
-        # Additional business/organization keywords
-        "CENTERS",
-        "CENTER",
-        "HOSPICE",
-        "HOSPITAL",
-        "CLINIC",
-        "STATE OF",
-        "CITY OF",
-        "COUNTY OF",
-        "TOWN OF",
-        "UNITED STATES",
-        "GOVERNMENT",
-        "FEDERAL",
-        "MUNICIPAL",
-        "ARMY",
-        "NAVY",
-        "AIR FORCE",
-        "MILITARY",
-        "SALVATION",
-        "ARC",
-        "HOUSE",
-        "HOME",
-        "HOMES",
-        "LIVING",
-        "SENIOR",
-        "FACILITY",
-        "FACILITIES",
-        "SERVICES",
-        "SERVICE",
-        "UNITED",
-        "METHODIST",
-        "LUTHERAN",
-        "EVANGELICAL",
-        "BAPTIST",
-        "CATHOLIC",
-        "CHRISTIAN",
-        "CONGREGATION",
-        "PRESBYTERY",
-        "ASSEMBLY",
-        "LEAGUE",
-        "ASSOCIATES",
-        "JOINT VENTURE",
-        "DST",
-        "LIMITED",
-        "PARTNERS",
-        "SETTLEMENT",
-        "HABILITATION",
-    ]
-
     # Check for entity keywords
-    for keyword in entity_keywords:
-        if keyword in name_upper:
-            return "Entity"
+    if ENTITY_KEYWORD_RE.search(name_upper):
+        return "Entity"
 
     # Check for individual patterns
     # Simple name patterns (2-4 words, likely person names)
     words = name.strip().split()
     if len(words) >= 2 and len(words) <= 4:
         # Additional check: if it doesn't contain entity-like words
-        if not any(
-            word.upper() in ["PROPERTY", "REAL", "ESTATE", "DEVELOPMENT", "RENTAL"]
-            for word in words
-        ):
+        if not any(word.upper() in _PROPERTY_WORDS for word in words):
             return "Individual(s)"
 
     # Default to Entity for unclear cases
@@ -202,6 +250,61 @@ def classify_owner_type(name: str) -> str:
     return "BUSINESS" if result == "Entity" else "INDIVIDUAL"
 
 
+def _classify_owner_type_arrow(names: pd.Series) -> pd.Series:
+    """classify_owner_type_series on ``string[pyarrow]``; same rules and output."""
+    text = names.astype("string[pyarrow]").str.strip()
+    upper = text.str.upper()
+    person = (
+        upper.str.count(r"\S+").between(2, 4)
+        & ~upper.str.contains(_PROPERTY_WORD_PATTERN, regex=True)
+        & ~upper.str.contains(ENTITY_KEYWORD_RE.pattern, regex=True)
+    ).fillna(False)
+
+    owner_types = pd.Series("BUSINESS", index=names.index, dtype=object)
+    owner_types[person.to_numpy(dtype=bool)] = "INDIVIDUAL"
+    owner_types[text.fillna("").eq("").to_numpy(dtype=bool)] = ""
+    return owner_types
+
+
+def classify_owner_type_series(names: pd.Series) -> pd.Series:
+    """Classify a whole owner column; bulk equivalent of classify_owner_type.
+
+    Same structure as ``adhs_etl.ecorp.classify_owner_type_series``: one
+    fused pass over the column values, or Arrow string kernels when pyarrow
+    is installed.
+
+    Parameters
+    ----------
+    names : pd.Series
+        Owner names
+
+    Returns
+    -------
+    pd.Series
+        "BUSINESS", "INDIVIDUAL", or "" for blank names, on the same index
+    """
+    if ARROW_STRINGS:
+        return _classify_owner_type_arrow(names)
+
+    keyword_search = ENTITY_KEYWORD_RE.search
+    owner_types = []
+    for name, missing in zip(names.tolist(), names.isna().tolist()):
+        text = "" if missing else str(name).strip()
+        if not text:
+            owner_types.append("")
+            continue
+        upper = text.upper()
+        words = upper.split()
+        owner_types.append(
+            "INDIVIDUAL"
+            if 2 <= len(words) <= 4
+            and _PROPERTY_WORDS.isdisjoint(words)
+            and not keyword_search(upper)
+            else "BUSINESS"
+        )
+    return pd.Series(owner_types, index=names.index, dtype=object)
+
+
 def parse_individual_names(name_str: str) -> List[str]:
     """Parse concatenated individual names into separate formatted names.
 
@@ -223,9 +326,18 @@ def parse_individual_names(name_str: str) -> List[str]:
     """
     if pd.isna(name_str) or str(name_str).strip() == "":
         return []
+    return list(_parse_individual_names(str(name_str).strip()))
+
 
+@lru_cache(maxsize=131072)
+def _parse_individual_names(name_str: str) -> Tuple[str, ...]:
+    """Cached worker for parse_individual_names.
+
+    Owner names repeat across parcels, so each distinct stripped name is
+    parsed once. Returns a tuple so the cached value cannot be mutated by
+    callers.
+    """
     names = []
-    name_str = str(name_str).strip()
 
     # Remove common suffixes that aren't part of the name
     suffixes_to_remove = [
@@ -320,7 +432,25 @@ def parse_individual_names(name_str: str) -> List[str]:
         # Keep uppercase as provided (these are typically already uppercase)
         cleaned_names.append(name)
 
-    return cleaned_names
+    return tuple(cleaned_names)
+
+
+# Subresources the scraper never reads, blocked through the DevTools protocol
+BLOCKED_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*.woff2",
+    "*.woff",
+    "*.ttf",
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.ico",
+    "*.mp4",
+)
 
 
 def setup_driver(headless: bool = True) -> webdriver.Chrome:
@@ -346,11 +476,186 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument("--disable-features=VizDisplayCompositor")
     chrome_options.add_argument("--disable-backgrounding-occluded-windows")
     chrome_options.add_argument("--window-size=1920,1080")
+    # Never fetch or decode images
+    chrome_options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
     service = Service(ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=chrome_options)
+    # Only the HTML is parsed, so fonts, media and analytics are not
+    # downloaded (stylesheets still load; the modal check needs visibility)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)}
+        )
+    except Exception:
+        pass
     return driver
 
 
+def _get_field(soup: BeautifulSoup, label: str) -> str:
+    """Return the text of the element after the first string containing ``label``."""
+    el = soup.find(string=_LABEL_RES[label])
+    if el:
+        # Find the next sibling which holds the value
+        val = el.find_next()
+        return val.get_text(strip=True)
+    return ""
+
+
+# Statutory Agent section of the detail page text, matched from its heading
+_STAT_AGENT_HEADING_RE = re.compile(r"Statutory Agent Information", re.IGNORECASE)
+_STAT_AGENT_NAME_RE = re.compile(
+    r"Statutory Agent Information.*?Name:\s*\n\s*([^\n\r]+?)(?:\s*\n|\s*Appointed)",
+    re.DOTALL | re.IGNORECASE,
+)
+_STAT_AGENT_NAME_ALT_RE = re.compile(
+    r"Statutory Agent Information.*?Name:\s*([^\n\r]+?)(?:\s+Attention:|Appointed|$)",
+    re.DOTALL | re.IGNORECASE,
+)
+_STAT_AGENT_ADDR_RE = re.compile(
+    r"Statutory Agent Information.*?Address:\s*\n?\s*([^\n\r]+?)"
+    r"(?:\s*\n|\s*Agent Last|E-mail:|County:|Mailing)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _get_statutory_agent_info(page_text: str) -> List[Dict[str, str]]:
+    """Extract Statutory Agent information using simple text parsing."""
+    agents = []
+
+    # Patterns are matched at the section heading rather than searched for
+    # from every position of the page
+    heading = _STAT_AGENT_HEADING_RE.search(page_text)
+    if heading is None:
+        return agents
+    start = heading.start()
+
+    try:
+        # Look for the statutory agent section and extract Name
+        # Pattern: Find "Name:" then capture the next non-empty line
+        stat_agent_section = _STAT_AGENT_NAME_RE.match(page_text, start)
+
+        agent_name = ""
+        agent_addr = ""
+
+        if stat_agent_section:
+            # Clean up - remove extra spaces
+            agent_name = " ".join(stat_agent_section.group(1).split())
+        else:
+            # Try alternative pattern where name might be on same line
+            alt_pattern = _STAT_AGENT_NAME_ALT_RE.match(page_text, start)
+            if alt_pattern:
+                agent_name = " ".join(alt_pattern.group(1).split())
+
+        # Look for Address in the same section
+        addr_section = _STAT_AGENT_ADDR_RE.match(page_text, start)
+
+        if addr_section:
+            agent_addr = " ".join(addr_section.group(1).split())
+
+        # If we found name or address, add to agents list
+        if agent_name or agent_addr:
+            agents.append(
+                {
+                    "Name": agent_name,
+                    "Address": agent_addr,
+                    "Phone": "",
+                    "Mail": "",
+                }
+            )
+
+    except Exception:
+        # Silent fail - return empty list
+        pass
+
+    return agents
+
+
+def _extract_principal_info(soup: BeautifulSoup) -> Dict[str, List[Dict[str, str]]]:
+    """Extract Principal Information from the table/grid section and categorize by role."""
+    categorized_principals = {
+        "Manager": [],
+        "Member": [],
+        "Manager/Member": [],
+    }
+
+    try:
+        # Look for the principal information table by id
+        principal_table = soup.find("table", id="grid_principalList")
+        if principal_table:
+            # Find all data rows (skip header)
+            tbody = principal_table.find("tbody")
+            if tbody:
+                rows = tbody.find_all("tr")
+
+                for row in rows:
+                    cells = row.find_all("td")
+                    if len(cells) >= 4:  # Title, Name, Attention, Address
+                        title_text = cells[0].get_text(strip=True) if cells[0] else ""
+                        name_text = cells[1].get_text(strip=True) if cells[1] else ""
+                        # Skip attention field (cells[2])
+                        addr_text = cells[3].get_text(strip=True) if cells[3] else ""
+
+                        # Look for phone/email if present (conservative approach)
+                        phone_text = ""
+                        mail_text = ""
+                        if len(cells) > 4:
+                            # Check if additional cells might contain phone/email
+                            for cell in cells[4:]:
+                                cell_text = cell.get_text(strip=True)
+                                if "@" in cell_text:
+                                    mail_text = cell_text
+                                elif (
+                                    any(char.isdigit() for char in cell_text)
+                                    and len(cell_text) >= 7
+                                ):
+                                    phone_text = cell_text
+
+                        # Categorize based on title
+                        title_upper = title_text.upper()
+                        principal_data = {
+                            "Name": name_text,
+                            "Address": addr_text,
+                            "Phone": phone_text,
+                            "Mail": mail_text,
+                        }
+
+                        if "MANAGER" in title_upper and "MEMBER" in title_upper:
+                            if len(categorized_principals["Manager/Member"]) < 5:
+                                categorized_principals["Manager/Member"].append(
+                                    principal_data
+                                )
+                        elif "MANAGER" in title_upper:
+                            if len(categorized_principals["Manager"]) < 5:
+                                categorized_principals["Manager"].append(principal_data)
+                        elif "MEMBER" in title_upper:
+                            if len(categorized_principals["Member"]) < 5:
+                                categorized_principals["Member"].append(principal_data)
+                        else:
+                            # Default to Manager if title unclear
+                            if len(categorized_principals["Manager"]) < 5:
+                                categorized_principals["Manager"].append(principal_data)
+
+    except Exception:
+        pass
+
+    return categorized_principals
+
+
+# "No search results" modal shown by the legacy search page
+_NO_RESULTS_XPATH = "//div[contains(text(), 'No search results were found')]"
+
+# Seconds to wait for a page to load or a detail page fetch to answer
+PAGE_TIMEOUT = 10
+
+
+def _is_detail_page(text: str) -> bool:
+    """Return True if ``text`` is a rendered legacy entity detail page."""
+    return "Entity Information" in text
+
+
 def search_entities(driver: webdriver.Chrome, name: str) -> List[Dict[str, str]]:
     """Search the ACC site for a company name and return entity details.
 
@@ -378,7 +683,7 @@ def search_entities(driver: webdriver.Chrome, name: str) -> List[Dict[str, str]]
 
     try:
         # Wait for search bar
-        search_input = WebDriverWait(driver, 10).until(
+        search_input = WebDriverWait(driver, PAGE_TIMEOUT).until(
             EC.presence_of_element_located(
                 (By.CSS_SELECTOR, "input[placeholder*='Search for an Entity Name']")
             )
@@ -388,313 +693,125 @@ def search_entities(driver: webdriver.Chrome, name: str) -> List[Dict[str, str]]
         search_input.send_keys(name)
         search_input.send_keys(Keys.RETURN)
 
-        # Wait for results table or no results message
-        time.sleep(1.5)  # short wait for results to load
-
-        # Check for no results modal
+        # Wait for results table or no results message, whichever comes first
         try:
-            _no_results_modal = driver.find_element(
-                By.XPATH, "//div[contains(text(), 'No search results were found')]"
-            )  # noqa: F841
-            # Click OK button to close modal
-            ok_button = driver.find_element(
-                By.XPATH, "//button[normalize-space()='OK']"
+            WebDriverWait(driver, PAGE_TIMEOUT).until(
+                EC.any_of(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")),
+                    EC.visibility_of_element_located((By.XPATH, _NO_RESULTS_XPATH)),
+                )
             )
-            ok_button.click()
-            return [get_blank_acc_record()]
-        except Exception:
+        except TimeoutException:
             pass
 
-        # Parse results table rows
+        # Check for no results modal
+        if driver.find_elements(By.XPATH, _NO_RESULTS_XPATH):
+            try:
+                # Click OK button to close modal
+                ok_button = driver.find_element(
+                    By.XPATH, "//button[normalize-space()='OK']"
+                )
+                ok_button.click()
+            except Exception:
+                pass
+            return [get_blank_acc_record()]
+
+        # Parse results table rows from one page_source snapshot instead of
+        # a WebDriver round-trip per cell
         entities = []
-        rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-        for row in rows:
-            cols = row.find_elements(By.TAG_NAME, "td")
+        results_url = driver.current_url
+        tree = lxml_html.fromstring(driver.page_source)
+        result_rows = []
+        for row in tree.xpath("//table//tbody//tr"):
+            cols = row.xpath(".//td")
             if not cols or len(cols) < 2:
                 continue
-            entity_id = cols[0].text.strip()
-            entity_name = cols[1].text.strip()
-            # Open detail page in new tab
-            link = cols[1].find_element(By.TAG_NAME, "a")
-            detail_url = link.get_attribute("href")
-            # Open in same driver (new tab)
-            driver.execute_script("window.open(arguments[0]);", detail_url)
-            driver.switch_to.window(driver.window_handles[-1])
-            # Wait for entity info to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//h2[contains(text(),'Entity Information')]")
+            links = cols[1].xpath(".//a[@href]")
+            if not links:
+                continue
+            result_rows.append(
+                (
+                    " ".join(cols[0].text_content().split()),
+                    " ".join(cols[1].text_content().split()),
+                    urljoin(results_url, links[0].get("href")),
                 )
             )
-            # Parse the page with BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-
-            # Extract fields
-            def get_field(label: str) -> str:
-                el = soup.find(text=lambda t: t and label in t)
-                if el:
-                    # Find the next sibling which holds the value
-                    val = el.find_next()
-                    return val.get_text(strip=True)
-                return ""
-
-            def get_statutory_agent_info():
-                """Extract Statutory Agent information using simple text parsing."""
-                agents = []
-
-                try:
-                    # Get the entire page text
-                    page_text = soup.get_text()
-
-                    # Find "Statutory Agent Information" section in the text
-                    import re
-
-                    # Look for the statutory agent section and extract Name
-                    # Pattern: Find "Name:" then capture the next non-empty line
-                    stat_agent_section = re.search(
-                        r"Statutory Agent Information.*?Name:\s*\n\s*([^\n\r]+?)(?:\s*\n|\s*Appointed)",
-                        page_text,
-                        re.DOTALL | re.IGNORECASE,
-                    )
 
-                    agent_name = ""
-                    agent_addr = ""
+        # The detail pages are server-rendered, so they are fetched over
+        # HTTP all at once; any that fail are opened in Chrome below
+        detail_urls = [detail_url for _, _, detail_url in result_rows]
+        prefetched = (
+            fetch_detail_pages(
+                http_session_from_driver(driver),
+                detail_urls,
+                PAGE_TIMEOUT,
+                is_detail_page=_is_detail_page,
+            )
+            if detail_urls
+            else {}
+        )
 
-                    if stat_agent_section:
-                        agent_name = stat_agent_section.group(1).strip()
-                        # Clean up - remove extra spaces
-                        agent_name = " ".join(agent_name.split())
-                    else:
-                        # Try alternative pattern where name might be on same line
-                        alt_pattern = re.search(
-                            r"Statutory Agent Information.*?Name:\s*([^\n\r]+?)(?:\s+Attention:|Appointed|$)",
-                            page_text,
-                            re.DOTALL | re.IGNORECASE,
-                        )
-                        if alt_pattern:
-                            agent_name = alt_pattern.group(1).strip()
-                            agent_name = " ".join(agent_name.split())
-
-                    # Look for Address in the same section
-                    addr_section = re.search(
-                        r"Statutory Agent Information.*?Address:\s*\n?\s*([^\n\r]+?)(?:\s*\n|\s*Agent Last|E-mail:|County:|Mailing)",
-                        page_text,
-                        re.DOTALL | re.IGNORECASE,
+        for entity_id, entity_name, detail_url in result_rows:
+            page_source = prefetched.get(detail_url)
+            if page_source is None:
+                # Open detail page in new tab
+                # Open in same driver (new tab)
+                driver.execute_script("window.open(arguments[0]);", detail_url)
+                driver.switch_to.window(driver.window_handles[-1])
+                # Wait for entity info to load
+                WebDriverWait(driver, PAGE_TIMEOUT).until(
+                    EC.presence_of_element_located(
+                        (By.XPATH, "//h2[contains(text(),'Entity Information')]")
                     )
-
-                    if addr_section:
-                        agent_addr = addr_section.group(1).strip()
-                        agent_addr = " ".join(agent_addr.split())
-
-                    # If we found name or address, add to agents list
-                    if agent_name or agent_addr:
-                        agents.append(
-                            {
-                                "Name": agent_name,
-                                "Address": agent_addr,
-                                "Phone": "",
-                                "Mail": "",
-                            }
-                        )
-
-                except Exception:
-                    # Silent fail - return empty list
-                    pass
-
-                return agents
-
-            def extract_principal_info():
-                """Extract Principal Information from the table/grid section and categorize by role."""
-                categorized_principals = {
-                    "Manager": [],
-                    "Member": [],
-                    "Manager/Member": [],
+                )
+                page_source = driver.page_source
+                # Close tab and switch back
+                driver.close()
+                driver.switch_to.window(driver.window_handles[0])
+            # Parse the page with BeautifulSoup
+            soup = BeautifulSoup(page_source, "lxml")
+
+            entity_type = _get_field(soup, "Entity Type:")
+            status = _get_field(soup, "Entity Status:")
+            formation_date = _get_field(soup, "Formation Date:")
+            business_type = _get_field(soup, "Business Type:")
+            domicile_state = _get_field(soup, "Domicile State:")
+            statutory_agents = _get_statutory_agent_info(soup.get_text())
+            county = _get_field(soup, "County:")
+            principal_info = _extract_principal_info(soup)
+
+            # Start from the blank template and fill only what was found
+            record = _BLANK_ACC_RECORD.copy()
+            record.update(
+                {
+                    "ECORP_SEARCH_NAME": name,
+                    "ECORP_TYPE": classify_name_type(name),
+                    "ECORP_NAME_S": entity_name if entity_name else "",
+                    "ECORP_ENTITY_ID_S": entity_id if entity_id else "",
+                    "ECORP_ENTITY_TYPE": entity_type if entity_type else "",
+                    "ECORP_STATUS": status if status else "",
+                    "ECORP_FORMATION_DATE": formation_date if formation_date else "",
+                    "ECORP_BUSINESS_TYPE": business_type if business_type else "",
+                    "ECORP_STATE": domicile_state if domicile_state else "",
+                    "ECORP_COUNTY": county if county else "",
                 }
+            )
 
-                try:
-                    # Look for the principal information table by id
-                    principal_table = soup.find("table", id="grid_principalList")
-                    if principal_table:
-                        # Find all data rows (skip header)
-                        tbody = principal_table.find("tbody")
-                        if tbody:
-                            rows = tbody.find_all("tr")
-
-                            for row in rows:
-                                cells = row.find_all("td")
-                                if len(cells) >= 4:  # Title, Name, Attention, Address
-                                    title_text = (
-                                        cells[0].get_text(strip=True)
-                                        if cells[0]
-                                        else ""
-                                    )
-                                    name_text = (
-                                        cells[1].get_text(strip=True)
-                                        if cells[1]
-                                        else ""
-                                    )
-                                    # Skip attention field (cells[2])
-                                    addr_text = (
-                                        cells[3].get_text(strip=True)
-                                        if cells[3]
-                                        else ""
-                                    )
-
-                                    # Look for phone/email if present (conservative approach)
-                                    phone_text = ""
-                                    mail_text = ""
-                                    if len(cells) > 4:
-                                        # Check if additional cells might contain phone/email
-                                        for cell in cells[4:]:
-                                            cell_text = cell.get_text(strip=True)
-                                            if "@" in cell_text:
-                                                mail_text = cell_text
-                                            elif (
-                                                any(
-                                                    char.isdigit() for char in cell_text
-                                                )
-                                                and len(cell_text) >= 7
-                                            ):
-                                                phone_text = cell_text
-
-                                    # Categorize based on title
-                                    title_upper = title_text.upper()
-                                    principal_data = {
-                                        "Name": name_text,
-                                        "Address": addr_text,
-                                        "Phone": phone_text,
-                                        "Mail": mail_text,
-                                    }
-
-                                    if (
-                                        "MANAGER" in title_upper
-                                        and "MEMBER" in title_upper
-                                    ):
-                                        if (
-                                            len(
-                                                categorized_principals["Manager/Member"]
-                                            )
-                                            < 5
-                                        ):
-                                            categorized_principals[
-                                                "Manager/Member"
-                                            ].append(principal_data)
-                                    elif "MANAGER" in title_upper:
-                                        if len(categorized_principals["Manager"]) < 5:
-                                            categorized_principals["Manager"].append(
-                                                principal_data
-                                            )
-                                    elif "MEMBER" in title_upper:
-                                        if len(categorized_principals["Member"]) < 5:
-                                            categorized_principals["Member"].append(
-                                                principal_data
-                                            )
-                                    else:
-                                        # Default to Manager if title unclear
-                                        if len(categorized_principals["Manager"]) < 5:
-                                            categorized_principals["Manager"].append(
-                                                principal_data
-                                            )
-
-                except Exception:
-                    pass
-
-                return categorized_principals
-
-            entity_type = get_field("Entity Type:")
-            status = get_field("Entity Status:")
-            formation_date = get_field("Formation Date:")
-            business_type = get_field("Business Type:")
-            domicile_state = get_field("Domicile State:")
-            statutory_agents = get_statutory_agent_info()
-            county = get_field("County:")
-            principal_info = extract_principal_info()
-
-            # Build the record with new structure
-            record = {
-                "ECORP_SEARCH_NAME": name,
-                "ECORP_TYPE": classify_name_type(name),
-                "ECORP_NAME_S": entity_name if entity_name else "",
-                "ECORP_ENTITY_ID_S": entity_id if entity_id else "",
-                "ECORP_ENTITY_TYPE": entity_type if entity_type else "",
-                "ECORP_STATUS": status if status else "",
-                "ECORP_FORMATION_DATE": formation_date if formation_date else "",
-                "ECORP_BUSINESS_TYPE": business_type if business_type else "",
-                "ECORP_STATE": domicile_state if domicile_state else "",
-                "ECORP_COUNTY": county if county else "",
-                "ECORP_COMMENTS": "",
-            }
-
-            # Add statutory agent fields (up to 3)
-            for i in range(1, 4):
-                if i <= len(statutory_agents):
-                    agent = statutory_agents[i - 1]
-                    record[f"StatutoryAgent{i}_Name"] = agent.get("Name", "")
-                    record[f"StatutoryAgent{i}_Address"] = agent.get("Address", "")
-                    record[f"StatutoryAgent{i}_Phone"] = agent.get("Phone", "")
-                    record[f"StatutoryAgent{i}_Mail"] = agent.get("Mail", "")
-                else:
-                    record[f"StatutoryAgent{i}_Name"] = ""
-                    record[f"StatutoryAgent{i}_Address"] = ""
-                    record[f"StatutoryAgent{i}_Phone"] = ""
-                    record[f"StatutoryAgent{i}_Mail"] = ""
-
-            # Add Manager fields (up to 5)
-            managers = principal_info.get("Manager", [])
-            for i in range(1, 6):
-                if i <= len(managers):
-                    mgr = managers[i - 1]
-                    record[f"Manager{i}_Name"] = mgr.get("Name", "")
-                    record[f"Manager{i}_Address"] = mgr.get("Address", "")
-                    record[f"Manager{i}_Phone"] = mgr.get("Phone", "")
-                    record[f"Manager{i}_Mail"] = mgr.get("Mail", "")
-                else:
-                    record[f"Manager{i}_Name"] = ""
-                    record[f"Manager{i}_Address"] = ""
-                    record[f"Manager{i}_Phone"] = ""
-                    record[f"Manager{i}_Mail"] = ""
-
-            # Add Manager/Member fields (up to 5)
-            mgr_members = principal_info.get("Manager/Member", [])
-            for i in range(1, 6):
-                if i <= len(mgr_members):
-                    mm = mgr_members[i - 1]
-                    record[f"Manager/Member{i}_Name"] = mm.get("Name", "")
-                    record[f"Manager/Member{i}_Address"] = mm.get("Address", "")
-                    record[f"Manager/Member{i}_Phone"] = mm.get("Phone", "")
-                    record[f"Manager/Member{i}_Mail"] = mm.get("Mail", "")
-                else:
-                    record[f"Manager/Member{i}_Name"] = ""
-                    record[f"Manager/Member{i}_Address"] = ""
-                    record[f"Manager/Member{i}_Phone"] = ""
-                    record[f"Manager/Member{i}_Mail"] = ""
-
-            # Add Member fields (up to 5)
-            members = principal_info.get("Member", [])
-            for i in range(1, 6):
-                if i <= len(members):
-                    mbr = members[i - 1]
-                    record[f"Member{i}_Name"] = mbr.get("Name", "")
-                    record[f"Member{i}_Address"] = mbr.get("Address", "")
-                    record[f"Member{i}_Phone"] = mbr.get("Phone", "")
-                    record[f"Member{i}_Mail"] = mbr.get("Mail", "")
-                else:
-                    record[f"Member{i}_Name"] = ""
-                    record[f"Member{i}_Address"] = ""
-                    record[f"Member{i}_Phone"] = ""
-                    record[f"Member{i}_Mail"] = ""
-
-            # Add Individual name fields (empty for now - will be populated for INDIVIDUAL types)
-            for i in range(1, 5):
-                record[f"IndividualName{i}"] = ""
+            # Statutory agents (up to 3), then principals by role (up to 5
+            # each); slots without a person keep the template's ""
+            people = [("StatutoryAgent", statutory_agents[:3])] + [
+                (role, principal_info.get(role, [])[:5])
+                for role in ("Manager", "Manager/Member", "Member")
+            ]
+            for prefix, persons in people:
+                for i, person in enumerate(persons, start=1):
+                    for field in ("Name", "Address", "Phone", "Mail"):
+                        record[f"{prefix}{i}_{field}"] = person.get(field, "")
 
             # Add ECORP_URL
             record["ECORP_URL"] = detail_url if detail_url else ""
 
             entities.append(record)
-            # Close tab and switch back
-            driver.close()
-            driver.switch_to.window(driver.window_handles[0])
 
         # If no entities were found, return a blank record
         if not entities:
@@ -708,14 +825,8 @@ def search_entities(driver: webdriver.Chrome, name: str) -> List[Dict[str, str]]
         return [blank]
 
 
-def get_blank_acc_record() -> dict:
-    """Return ACC record with all fields as empty strings.
-
-    Returns
-    -------
-    dict
-        Dictionary with all ACC field keys set to empty strings
-    """
+def _build_blank_acc_record() -> dict:
+    """Build the blank ACC record template (run once at import)."""
     record = {
         "ECORP_SEARCH_NAME": "",
         "ECORP_TYPE": "",
@@ -768,25 +879,19 @@ def get_blank_acc_record() -> dict:
     return record
 
 
-def save_checkpoint(
-    path: Path, results: list, idx: int, total_records: int = None
-) -> None:
-    """Save progress checkpoint to disk for resume capability.
+# Every ACC column in output order, all empty
+_BLANK_ACC_RECORD = _build_blank_acc_record()
 
-    Parameters
-    ----------
-    path : Path
-        Path to checkpoint file
-    results : list
-        List of completed records
-    idx : int
-        Current index in processing
-    total_records : int, optional
-        Total number of records in current upload file (for validation)
+
+def get_blank_acc_record() -> dict:
+    """Return ACC record with all fields as empty strings.
+
+    Returns
+    -------
+    dict
+        Dictionary with all ACC field keys set to empty strings
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "wb") as f:
-        pickle.dump((results, idx, total_records), f)
+    return _BLANK_ACC_RECORD.copy()
 
 
 def extract_timestamp_from_path(path: Path) -> str:
@@ -1048,22 +1153,21 @@ def generate_ecorp_upload(month_code: str, mcao_complete_path: Path) -> Optional
     try:
         # Read MCAO_Complete file
         print(f"📋 Reading MCAO_Complete: {mcao_complete_path.name}")
-        df = pd.read_excel(mcao_complete_path)
-
-        # Validate columns exist
-        if len(df.columns) < 5:
-            print(
-                f"❌ MCAO_Complete must have at least 5 columns, found {len(df.columns)}"
-            )
+        # Only columns A, B and E are parsed; the rest of the sheet is skipped
+        try:
+            df = pd.read_excel(mcao_complete_path, usecols=[0, 1, 4])
+        except pd.errors.ParserError as e:
+            # usecols beyond the last column (fewer than 5 columns)
+            print(f"❌ MCAO_Complete must have at least 5 columns: {e}")
             return None
 
-        # Extract columns (0-indexed)
+        # Extract columns (0-indexed within the three that were read)
         upload_df = pd.DataFrame(
             {
                 "FULL_ADDRESS": df.iloc[:, 0],  # Column A
                 "COUNTY": df.iloc[:, 1],  # Column B
-                "Owner_Ownership": df.iloc[:, 4],  # Column E (0-indexed = 4)
-                "OWNER_TYPE": df.iloc[:, 4].apply(classify_owner_type),  # Classify
+                "Owner_Ownership": df.iloc[:, 2],  # Column E
+                "OWNER_TYPE": classify_owner_type_series(df.iloc[:, 2]),  # Classify
             }
         )
 
@@ -1152,52 +1256,37 @@ def generate_ecorp_complete(
         total_records = len(df_upload)
 
         # Setup
-        checkpoint_file = Path(f"Ecorp/.checkpoint_{month_code}.pkl")
+        checkpoint_file = Path(f"Ecorp/.checkpoint_{month_code}.jsonl")
         results = []
         start_idx = 0
         cache = {}  # In-memory cache
 
         # Load checkpoint if exists and validate it
-        if checkpoint_file.exists():
-            try:
-                with open(checkpoint_file, "rb") as f:
-                    checkpoint_data = pickle.load(f)
-
-                # Handle old format (results, idx) or new format (results, idx, total)
-                if len(checkpoint_data) == 3:
-                    results, start_idx, checkpoint_total = checkpoint_data
-
-                    # Validate checkpoint matches current upload file
-                    if checkpoint_total != total_records:
-                        print(
-                            f"⚠️  Checkpoint mismatch: checkpoint has {checkpoint_total} records, "
-                            f"but upload has {total_records} records"
-                        )
-                        print("   Deleting stale checkpoint and starting fresh...")
-                        checkpoint_file.unlink()
-                        results = []
-                        start_idx = 0
-                    else:
-                        print(
-                            f"📂 Resuming from checkpoint: record {start_idx + 1}/{total_records}"
-                        )
-                else:
-                    # Old format checkpoint - assume it's stale, start fresh
-                    results, start_idx = checkpoint_data
-                    print(
-                        "⚠️  Old checkpoint format detected (no record count validation)"
-                    )
-                    print("   Deleting old checkpoint and starting fresh...")
-                    checkpoint_file.unlink()
-                    results = []
-                    start_idx = 0
-
-            except Exception as e:
-                print(f"⚠️  Error loading checkpoint: {e}")
-                print("   Deleting corrupted checkpoint and starting fresh...")
-                checkpoint_file.unlink()
+        try:
+            checkpoint_data = load_checkpoint(checkpoint_file)
+        except Exception as e:
+            print(f"⚠️  Error loading checkpoint: {e}")
+            print("   Deleting corrupted checkpoint and starting fresh...")
+            clear_checkpoint(checkpoint_file)
+            checkpoint_data = None
+
+        if checkpoint_data is not None:
+            results, start_idx, checkpoint_total = checkpoint_data
+
+            # Validate checkpoint matches current upload file
+            if checkpoint_total != total_records:
+                print(
+                    f"⚠️  Checkpoint mismatch: checkpoint has {checkpoint_total} records, "
+                    f"but upload has {total_records} records"
+                )
+                print("   Deleting stale checkpoint and starting fresh...")
+                clear_checkpoint(checkpoint_file)
                 results = []
                 start_idx = 0
+            else:
+                print(
+                    f"📂 Resuming from checkpoint: record {start_idx + 1}/{total_records}"
+                )
 
         # Initialize driver
         print("🌐 Initializing Chrome WebDriver...")
@@ -1309,8 +1398,7 @@ def generate_ecorp_complete(
             print(f"   Cache hits: {total_records - len(cache)} lookups saved")
 
             # Clean up checkpoint
-            if checkpoint_file.exists():
-                checkpoint_file.unlink()
+            clear_checkpoint(checkpoint_file)
 
             return True
 
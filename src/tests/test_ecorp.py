@@ -0,0 +1,2101 @@
+"""Tests for the ecorp module."""
+
+import json
+import re
+import threading
+import time
+from concurrent.futures import Future
+
+import pandas as pd
+import pytest
+from lxml import html as lxml_html
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from adhs_etl import ecorp, ecorp_legacy
+from adhs_etl.ecorp import (
+    BODY_TEXT_JS,
+    CAPTCHA_INDICATORS,
+    CAPTCHA_RE,
+    CLICKABLE_JS,
+    DISMISS_JS,
+    ENTITY_KEYWORD_RE,
+    FIND_JS,
+    ENTITY_KEYWORDS,
+    RATE_LIMIT_INDICATORS,
+    RATE_LIMIT_RE,
+    PAGE_STATE_JS,
+    SCRAPE_JS,
+    VISIBLE_JS,
+    SELECTOR_POLL_INTERVAL,
+    SELECTORS,
+    CachedDriver,
+    PageState,
+    _CSS_UNIONS,
+    _SEL_NO_RESULTS,
+    _SEL_RESULTS_ROWS,
+    _XPATH_CACHE,
+    classify_name_type,
+    classify_owner_type,
+    classify_owner_type_series,
+    detect_2fa_page,
+    detect_captcha,
+    detect_login_page,
+    detect_rate_limit,
+    dismiss_dialog,
+    find_element_with_fallback,
+    find_clickable,
+    find_elements_with_fallback,
+    find_statutory_agent_section,
+    find_visible,
+    get_blank_acc_record,
+    get_detail_field,
+    get_statutory_agent_info,
+    extract_principal_info,
+    lowered_body_text,
+    page_source_matches,
+    parse_individual_names,
+    parse_individual_names_series,
+    SelectorStats,
+    scan_page_state,
+    search_input_chain,
+    selector_resolver,
+    snapshot_results_rows,
+    selector_stats,
+    wait_for_search_page,
+    wait_until,
+)
+
+
+class FakeElement:
+    """Minimal stand-in for a Selenium WebElement."""
+
+    def __init__(self, name: str, text: str = ""):
+        self.name = name
+        self.text = text
+        self.clicked = False
+
+    def click(self):
+        self.clicked = True
+
+
+class FakeDriver:
+    """Driver double that answers lookups from a ``{(by, selector): [...]}`` map."""
+
+    def __init__(self, matches=None, page_source="", title="", body_text=""):
+        self.matches = dict(matches or {})
+        self.matches.setdefault((By.TAG_NAME, "body"), [FakeElement("body", body_text)])
+        self.page_source = page_source
+        self.title = title
+        self.calls = []
+        self.script_result = None
+        self.scripts = []
+
+    def find_elements(self, by, selector):
+        self.calls.append((by, selector))
+        if by == By.CSS_SELECTOR and ", " in selector:
+            return [
+                element
+                for part in selector.split(", ")
+                for element in self.matches.get((by, part), [])
+            ]
+        return list(self.matches.get((by, selector), []))
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        return self.script_result
+
+    def find_element(self, by, selector):
+        elements = self.find_elements(by, selector)
+        if not elements:
+            raise NoSuchElementException(selector)
+        return elements[0]
+
+
+class ScriptedDriver(FakeDriver):
+    """FakeDriver that answers FIND_JS the way the browser would."""
+
+    KINDS = {"css": By.CSS_SELECTOR, "xpath": By.XPATH, "id": By.ID}
+
+    def __init__(self, matches=None, **kwargs):
+        super().__init__(matches, **kwargs)
+        self.roots = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if script != FIND_JS:
+            return self.script_result
+        spec, root, find_all = args
+        self.roots.append(root)
+        source = root.matches if root is not None else self.matches
+        for pos, (kind, selector) in enumerate(spec):
+            by = self.KINDS[kind]
+            if kind == "css" and (By.TAG_NAME, selector) in source:
+                by = By.TAG_NAME
+            found = source.get((by, selector), [])
+            if found:
+                return [pos, found if find_all else found[:1]]
+        return [-1, []]
+
+
+@pytest.fixture(autouse=True)
+def reset_selector_resolver(tmp_path, monkeypatch):
+    """Keep learned selector indexes and hit counts from leaking out of tests."""
+    monkeypatch.setattr(selector_stats, "path", tmp_path / "selector_stats.json")
+    selector_resolver.reset()
+    selector_stats.reset()
+    yield
+    selector_resolver.reset()
+    selector_stats.reset()
+
+
+class TestSelectorFallback:
+    """Test selector fallback chains."""
+
+    def test_find_elements_uses_first_matching_selector(self):
+        """Test that the first selector with results wins."""
+        row = FakeElement("row")
+        driver = FakeDriver({(By.CSS_SELECTOR, "mat-row"): [row]})
+
+        assert find_elements_with_fallback(driver, "results_rows") == [row]
+
+    def test_find_elements_returns_empty_list_on_miss(self):
+        """Test that a full miss returns an empty list."""
+        driver = FakeDriver()
+
+        assert find_elements_with_fallback(driver, "results_rows") == []
+
+    def test_css_union_collapses_misses_to_one_call(self):
+        """Test that an all-CSS chain misses with a single union lookup."""
+        driver = FakeDriver()
+
+        find_elements_with_fallback(driver, "results_rows")
+
+        assert len(SELECTORS["results_rows"]) > 1
+        assert driver.calls == [(By.CSS_SELECTOR, _CSS_UNIONS["results_rows"])]
+
+    def test_css_union_miss_still_tries_non_css_selectors(self):
+        """Test that XPath fallbacks run after the CSS union misses."""
+        button = FakeElement("ok")
+        xpath = "//button[normalize-space()='OK']"
+        driver = FakeDriver({(By.XPATH, xpath): [button]})
+
+        assert find_elements_with_fallback(driver, "dialog_dismiss") == [button]
+        assert not any(
+            by == By.CSS_SELECTOR and ", " not in selector
+            for by, selector in driver.calls
+        )
+
+    def test_last_good_selector_is_tried_first(self):
+        """Test that a learned selector index short-circuits later lookups."""
+        row = FakeElement("row")
+        driver = FakeDriver({(By.CSS_SELECTOR, "mat-row"): [row]})
+
+        find_elements_with_fallback(driver, "results_rows")
+        driver.calls.clear()
+        find_elements_with_fallback(driver, "results_rows")
+
+        assert driver.calls == [(By.CSS_SELECTOR, "mat-row")]
+
+    def test_frozen_chain_shares_learning_with_key(self):
+        """Test that frozen chains and string keys resolve to the same chain."""
+        row = FakeElement("row")
+        driver = FakeDriver({(By.CSS_SELECTOR, ".mat-mdc-row"): [row]})
+
+        assert find_elements_with_fallback(driver, _SEL_RESULTS_ROWS) == [row]
+        driver.calls.clear()
+        find_elements_with_fallback(driver, "results_rows")
+
+        assert driver.calls == [(By.CSS_SELECTOR, ".mat-mdc-row")]
+
+    def test_find_element_from_parent(self):
+        """Test parent-scoped lookups skip the driver entirely."""
+        link = FakeElement("link")
+        parent = FakeDriver({(By.CSS_SELECTOR, "a[routerlink]"): [link]})
+
+        found = find_element_with_fallback(
+            None, "entity_link", parent=parent, raise_on_failure=False
+        )
+
+        assert found is link
+
+    def test_find_element_polls_whole_chain_in_one_wait(self):
+        """Test that a driver-level lookup checks every selector per poll."""
+        field = FakeElement("input")
+        driver = FakeDriver({(By.CSS_SELECTOR, "input.mat-mdc-input-element"): [field]})
+
+        found = find_element_with_fallback(driver, "search_input", timeout=0)
+
+        assert found is field
+
+    def test_find_element_miss_returns_none(self):
+        """Test that a miss returns None when raise_on_failure is False."""
+        driver = FakeDriver()
+
+        found = find_element_with_fallback(
+            driver, "search_input", timeout=0, raise_on_failure=False
+        )
+
+        assert found is None
+
+    def test_find_element_polls_until_element_appears(self, monkeypatch):
+        """Test the chain is re-polled until an element shows up."""
+        field = FakeElement("input")
+        driver = FakeDriver()
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                driver.matches[(By.CSS_SELECTOR, "input.mat-mdc-input-element")] = [
+                    field
+                ]
+
+        monkeypatch.setattr("adhs_etl.ecorp.time.sleep", fake_sleep)
+
+        assert find_element_with_fallback(driver, "search_input", timeout=5) is field
+        assert len(sleeps) == 2
+
+    def test_find_element_never_sleeps_past_deadline(self):
+        """Test a miss returns within the timeout instead of a poll later."""
+        driver = FakeDriver()
+
+        start = time.monotonic()
+        find_element_with_fallback(
+            driver, "search_input", timeout=0.3, raise_on_failure=False
+        )
+
+        assert time.monotonic() - start < 0.3 + SELECTOR_POLL_INTERVAL / 2
+
+    def test_statutory_agent_panel_matched_by_title_text(self):
+        """Test the Statutory Agent panel is found by its title text."""
+        principal = FakeElement("principal", "Principal Information")
+        statutory = FakeElement("statutory", " Statutory Agent Information ")
+        driver = FakeDriver(
+            {
+                (By.CSS_SELECTOR, "mat-expansion-panel mat-panel-title"): [
+                    principal,
+                    statutory,
+                ]
+            }
+        )
+
+        assert find_statutory_agent_section(driver, timeout=0) is statutory
+
+    @pytest.mark.parametrize(
+        "url, legacy_expected",
+        [
+            ("https://arizonabusinesscenter.azcc.gov/businesssearch", False),
+            ("https://ecorp.azcc.gov/EntitySearch/Index", True),
+        ],
+    )
+    def test_search_input_chain_specialized_by_host(self, url, legacy_expected):
+        """Test each host only probes its own platform's search inputs."""
+        legacy = (By.CSS_SELECTOR, "input[placeholder*='Entity']")
+        modern = (By.CSS_SELECTOR, "input[placeholder='Enter Business Name']")
+        chain = search_input_chain(url)
+
+        assert (legacy in chain) is legacy_expected
+        assert (modern in chain) is not legacy_expected
+
+    def test_search_input_chain_unknown_host_uses_full_chain(self):
+        """Test unrecognized hosts keep every fallback."""
+        chain = search_input_chain("http://localhost:8000/search")
+
+        assert list(chain) == SELECTORS["search_input"]
+
+    def test_find_element_raises_on_unknown_key(self):
+        """Test that unknown selector keys are rejected."""
+        with pytest.raises(ValueError):
+            find_element_with_fallback(FakeDriver(), "not_a_key")
+
+
+class TestDismissDialog:
+    """Test the one-shot dialog dismiss."""
+
+    def test_script_result_is_clicked_without_selector_probes(self):
+        """Test the JS lookup avoids the fallback chain entirely."""
+        button = FakeElement("ok", "OK")
+        driver = FakeDriver()
+        driver.script_result = button
+
+        assert dismiss_dialog(driver) is True
+        assert button.clicked
+        assert driver.scripts == [DISMISS_JS]
+        assert driver.calls == []
+
+    def test_falls_back_to_selector_chain(self):
+        """Test the selector chain is used when the script finds nothing."""
+        button = FakeElement("close", "Close")
+        driver = FakeDriver(
+            {(By.CSS_SELECTOR, ".mat-mdc-dialog-actions button"): [button]}
+        )
+
+        assert dismiss_dialog(driver, timeout=0) is True
+        assert button.clicked
+
+    def test_no_button_returns_false(self):
+        """Test nothing is clicked when no dismiss button exists."""
+        assert dismiss_dialog(FakeDriver(), timeout=0) is False
+
+
+class TestResultsSnapshot:
+    """Test the one-call results table snapshot."""
+
+    def test_snapshot_from_script(self):
+        """Test rows come from a single script call."""
+        driver = FakeDriver()
+        driver.script_result = json.dumps(
+            {
+                "selector": "mat-row",
+                "rows": [
+                    {
+                        "cells": ["ACME LLC", "", "L123"],
+                        "link": "/entity/1",
+                        "has_link": True,
+                    }
+                ],
+            }
+        )
+
+        row_selector, rows = snapshot_results_rows(driver)
+
+        assert row_selector == "mat-row"
+        assert rows[0]["cells"] == ["ACME LLC", "", "L123"]
+        assert driver.scripts == [SCRAPE_JS]
+        assert driver.calls == []
+
+    def test_snapshot_falls_back_to_selectors(self):
+        """Test the Selenium helpers are used when the script fails."""
+        row = FakeDriver(
+            {
+                (By.TAG_NAME, "td"): [
+                    FakeElement("c0", " ACME LLC "),
+                    FakeElement("c1", ""),
+                    FakeElement("c2", "L123"),
+                ]
+            }
+        )
+        driver = FakeDriver({(By.CSS_SELECTOR, "mat-row"): [row]})
+
+        row_selector, rows = snapshot_results_rows(driver)
+
+        assert row_selector == "mat-row"
+        assert rows == [
+            {"cells": ["ACME LLC", "", "L123"], "link": None, "has_link": False}
+        ]
+
+
+class TestPageSourceMatches:
+    """Test XPath checks against serialized page HTML."""
+
+    def test_no_results_text_matches(self):
+        """Test the no-results XPath fallbacks match locally."""
+        page = "<html><body><div>No search results were found</div></body></html>"
+
+        assert page_source_matches(page, "no_results") is True
+
+    def test_results_page_does_not_match(self):
+        """Test a results table is not mistaken for no results."""
+        page = "<html><body><table><tr><td>ACME LLC</td></tr></table></body></html>"
+
+        assert page_source_matches(page, _SEL_NO_RESULTS) is False
+
+    def test_empty_source(self):
+        """Test an empty page source never matches."""
+        assert page_source_matches("", "no_results") is False
+
+    def test_chain_xpaths_are_precompiled(self):
+        """Test every XPath selector is compiled at import."""
+        xpaths = {
+            sel for chain in SELECTORS.values() for by, sel in chain if by == By.XPATH
+        }
+
+        assert xpaths <= set(_XPATH_CACHE)
+
+
+class TestSelectorStats:
+    """Test persisted selector hit counts."""
+
+    def test_hits_round_trip_and_reorder(self, tmp_path):
+        """Test saved counts move the winning selector to the front."""
+        path = tmp_path / "stats.json"
+        chain = [(By.CSS_SELECTOR, "table tbody tr"), (By.CSS_SELECTOR, "mat-row")]
+        stats = SelectorStats(path)
+        stats.record("results_rows", chain[1])
+        stats.flush()
+
+        reloaded = SelectorStats(path)
+        reloaded.load()
+        selectors = {"results_rows": list(chain)}
+        reloaded.reorder(selectors)
+
+        assert selectors["results_rows"] == [chain[1], chain[0]]
+
+    def test_flushes_every_n_hits(self, tmp_path):
+        """Test counts are written once flush_every hits accumulate."""
+        path = tmp_path / "stats.json"
+        stats = SelectorStats(path, flush_every=2)
+
+        stats.record("search_input", (By.CSS_SELECTOR, "input"))
+        assert not path.exists()
+        stats.record("search_input", (By.CSS_SELECTOR, "input"))
+
+        assert json.loads(path.read_text()) == {
+            "search_input": {"css selector::input": 2}
+        }
+
+    def test_unreadable_file_keeps_default_order(self, tmp_path):
+        """Test a corrupt stats file is ignored."""
+        path = tmp_path / "stats.json"
+        path.write_text("not json")
+        chain = [(By.ID, "a"), (By.ID, "b")]
+        selectors = {"principal_table": list(chain)}
+
+        stats = SelectorStats(path)
+        stats.load()
+        stats.reorder(selectors)
+
+        assert selectors["principal_table"] == chain
+
+    def test_lookups_record_hits(self):
+        """Test the fallback helpers count successful selectors."""
+        row = FakeElement("row")
+        driver = FakeDriver({(By.CSS_SELECTOR, "mat-row"): [row]})
+
+        find_elements_with_fallback(driver, "results_rows")
+        selector_stats.flush()
+
+        saved = json.loads(selector_stats.path.read_text())
+        assert saved == {"results_rows": {"css selector::mat-row": 1}}
+
+
+class TestFindScript:
+    """Test whole-chain lookups through FIND_JS."""
+
+    def test_chain_resolved_in_one_script_call(self):
+        """Test a lookup makes one script call and no WebDriver finds."""
+        row = FakeElement("row")
+        driver = ScriptedDriver({(By.CSS_SELECTOR, ".mat-mdc-row"): [row]})
+
+        assert find_elements_with_fallback(driver, "results_rows") == [row]
+        assert driver.scripts == [FIND_JS]
+        assert driver.calls == []
+
+    def test_script_index_maps_back_to_chain_order(self):
+        """Test the learned selector is recorded by its chain index."""
+        row = FakeElement("row")
+        driver = ScriptedDriver({(By.CSS_SELECTOR, ".mat-mdc-row"): [row]})
+
+        find_elements_with_fallback(driver, "results_rows")
+
+        expected = SELECTORS["results_rows"].index((By.CSS_SELECTOR, ".mat-mdc-row"))
+        assert selector_resolver.learned("results_rows") == expected
+
+    def test_find_element_waits_on_script(self):
+        """Test the driver-level wait polls the script, not each selector."""
+        table = FakeElement("table")
+        driver = ScriptedDriver({(By.ID, "grid_principalList"): [table]})
+
+        found = find_element_with_fallback(driver, "principal_table", timeout=0)
+
+        assert found is table
+        assert driver.calls == []
+
+    def test_parent_passed_as_script_root(self):
+        """Test parent-scoped lookups run the script against the parent."""
+        link = FakeElement("link")
+        parent = FakeDriver({(By.CSS_SELECTOR, "a"): [link]})
+        driver = ScriptedDriver()
+
+        found = find_element_with_fallback(
+            driver, "entity_link", parent=parent, raise_on_failure=False
+        )
+
+        assert found is link
+        assert driver.roots == [parent]
+
+    def test_script_miss_returns_empty(self):
+        """Test a browser-side miss does not fall back to WebDriver probes."""
+        driver = ScriptedDriver()
+
+        assert find_elements_with_fallback(driver, "results_rows") == []
+        assert driver.calls == []
+
+
+class WidgetElement(FakeElement):
+    """FakeElement with the visibility and state queries buttons need."""
+
+    def __init__(self, name, text="", shown=True, enabled=True, type_="text"):
+        super().__init__(name, text)
+        self.shown = shown
+        self.enabled = enabled
+        self.type = type_
+
+    def is_displayed(self):
+        return self.shown
+
+    def is_enabled(self):
+        return self.enabled
+
+    def get_attribute(self, name):
+        return getattr(self, name)
+
+
+class BrokenScriptDriver(FakeDriver):
+    """FakeDriver whose script calls fail, forcing WebDriver probing."""
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        raise RuntimeError("javascript disabled")
+
+
+class TestVisibilityScripts:
+    """Test batched visible/enabled checks."""
+
+    def test_clickable_chain_checked_in_one_call(self):
+        """Test the button chain is evaluated by a single script call."""
+        button = FakeElement("next")
+        driver = FakeDriver()
+        driver.script_result = button
+        selectors = (
+            (By.XPATH, "//button[normalize-space()='Next']"),
+            (By.CSS_SELECTOR, "button[type='submit']"),
+        )
+
+        found = find_clickable(driver, selectors, exclude=("cancel",))
+
+        assert found is button
+        assert driver.scripts == [CLICKABLE_JS]
+        assert driver.calls == []
+
+    def test_clickable_falls_back_to_webdriver(self):
+        """Test hidden, disabled and excluded buttons are skipped without JS."""
+        hidden = WidgetElement("hidden", "Search", shown=False)
+        disabled = WidgetElement("disabled", "Search", enabled=False)
+        clear = WidgetElement("clear", "Clear")
+        search = WidgetElement("search", "Business Search")
+        driver = BrokenScriptDriver(
+            {(By.CSS_SELECTOR, "button"): [hidden, disabled, clear, search]}
+        )
+
+        found = find_clickable(
+            driver, ((By.CSS_SELECTOR, "button"),), exclude=("clear", "cancel")
+        )
+
+        assert found is search
+
+    def test_visible_inputs_in_one_call(self):
+        """Test visible inputs come back from a single script call."""
+        boxes = [FakeElement(f"otp{i}") for i in range(6)]
+        driver = FakeDriver()
+        driver.script_result = boxes
+
+        assert find_visible(driver, "input", ("text", "tel")) == boxes
+        assert driver.scripts == [VISIBLE_JS]
+        assert driver.calls == []
+
+    def test_visible_inputs_fall_back_to_webdriver(self):
+        """Test the fallback filters on visibility and input type."""
+        shown = WidgetElement("shown")
+        hidden = WidgetElement("hidden", shown=False)
+        password = WidgetElement("password", type_="password")
+        driver = BrokenScriptDriver(
+            {(By.CSS_SELECTOR, "input"): [shown, hidden, password]}
+        )
+
+        assert find_visible(driver, "input", ("text",)) == [shown]
+
+
+class TestSafetyDetection:
+    """Test CAPTCHA and rate limit detection."""
+
+    def test_detect_captcha_is_case_insensitive(self):
+        """Test CAPTCHA phrases match regardless of case."""
+        driver = FakeDriver(page_source="<div>Please VERIFY YOU'RE HUMAN</div>")
+
+        assert detect_captcha(driver) is True
+
+    def test_detect_captcha_clean_page(self):
+        """Test a normal page is not flagged."""
+        driver = FakeDriver(page_source="<div>Entity Information</div>")
+
+        assert detect_captcha(driver) is False
+
+    @pytest.mark.parametrize("phrase", CAPTCHA_INDICATORS)
+    def test_every_captcha_indicator_matches(self, phrase):
+        """Test the prefix-factored pattern still matches every phrase."""
+        assert CAPTCHA_RE.search(f"<p>{phrase.upper()}</p>")
+
+    @pytest.mark.parametrize("phrase", RATE_LIMIT_INDICATORS)
+    def test_every_rate_limit_indicator_matches(self, phrase):
+        """Test the prefix-factored pattern still matches every phrase."""
+        assert RATE_LIMIT_RE.search(f"<p>{phrase.title()}</p>")
+
+    @pytest.mark.parametrize(
+        "indicators, pattern",
+        [
+            (ecorp.LOGIN_INDICATORS, ecorp.LOGIN_RE),
+            (ecorp.SEARCH_PAGE_INDICATORS, ecorp.SEARCH_PAGE_RE),
+            (ecorp.TFA_INDICATORS, ecorp.TFA_RE),
+            (ecorp._ERROR_TITLE_WORDS, ecorp.ERROR_TITLE_RE),
+        ],
+    )
+    def test_every_page_indicator_matches(self, indicators, pattern):
+        """Test each page-detector union still matches all of its phrases."""
+        for phrase in indicators:
+            assert pattern.search(f"Page - {phrase.upper()}"), phrase
+
+    def test_detect_rate_limit_from_body_text(self):
+        """Test rate limit phrases in visible text are detected."""
+        driver = FakeDriver(body_text="Too Many Requests - slow down")
+
+        assert detect_rate_limit(driver) is True
+
+    def test_detect_rate_limit_from_title(self):
+        """Test error titles are treated as blocks."""
+        driver = FakeDriver(title="Access Denied")
+
+        assert detect_rate_limit(driver) is True
+
+    def test_detectors_read_observer_flags(self):
+        """Test installed observer flags answer without a page_source read."""
+        driver = SourceCountingDriver("<div class='g-recaptcha'></div>")
+        driver.script_result = {"captcha": False, "rateLimited": True}
+
+        assert detect_captcha(driver) is False
+        assert driver.source_reads == 0
+
+        driver.script_result = {"captcha": True, "rateLimited": False}
+        assert detect_captcha(driver) is True
+
+    def test_rate_limit_observer_flag_after_status_check(self, monkeypatch):
+        """Test the body text is not fetched when the observer flag exists."""
+        monkeypatch.setattr(ecorp, "_response_summary", lambda d: (200, "Search"))
+        driver = FakeDriver(body_text="Too Many Requests")
+        driver.script_result = {"captcha": False, "rateLimited": False}
+
+        assert detect_rate_limit(driver) is False
+        assert driver.scripts == [ecorp.SAFETY_FLAGS_JS]
+
+    def test_detect_rate_limit_from_status(self):
+        """Test a blocking HTTP status answers without reading the page text."""
+        driver = FakeDriver(title="Business Search")
+        driver.script_result = [429, "Business Search"]
+
+        assert detect_rate_limit(driver) is True
+        assert driver.scripts == [ecorp.RESPONSE_JS]
+        assert driver.calls == []
+
+    def test_detect_rate_limit_ok_status_checks_text(self):
+        """Test a 200 status still falls through to the body text scan."""
+        driver = FakeDriver(body_text="Too Many Requests")
+        driver.script_result = [200, "Business Search"]
+
+        assert detect_rate_limit(driver) is True
+
+    def test_detect_rate_limit_clean_page(self):
+        """Test a normal results page is not flagged."""
+        driver = FakeDriver(title="Business Search", body_text="3 results")
+
+        assert detect_rate_limit(driver) is False
+
+
+class SourceCountingDriver(FakeDriver):
+    """FakeDriver that counts page_source serializations."""
+
+    def __init__(self, page_source=""):
+        super().__init__()
+        self._source = page_source
+        self.source_reads = 0
+        self.visited = []
+
+    @property
+    def page_source(self):
+        self.source_reads += 1
+        return self._source
+
+    @page_source.setter
+    def page_source(self, value):
+        self._source = value
+
+    def get(self, url):
+        self.visited.append(url)
+
+
+class TestCachedDriver:
+    """Test page_source memoization."""
+
+    def test_page_source_serialized_once_per_page(self):
+        """Test repeated reads reuse one serialization."""
+        inner = SourceCountingDriver("<p>results</p>")
+        driver = CachedDriver(inner)
+
+        assert driver.page_source == driver.page_source == "<p>results</p>"
+        assert detect_captcha(driver) is False
+        assert inner.source_reads == 1
+
+    def test_navigation_invalidates_cache(self):
+        """Test get() forces a fresh page source."""
+        inner = SourceCountingDriver("<p>old</p>")
+        driver = CachedDriver(inner)
+        driver.page_source
+
+        inner.page_source = "<p>new</p>"
+        driver.get("https://example.test/next")
+
+        assert driver.page_source == "<p>new</p>"
+        assert inner.visited == ["https://example.test/next"]
+
+    def test_explicit_invalidate_after_click(self):
+        """Test invalidate() drops the cached copy."""
+        inner = SourceCountingDriver("<p>old</p>")
+        driver = CachedDriver(inner)
+        driver.page_source
+
+        inner.page_source = "<p>new</p>"
+        driver.invalidate()
+
+        assert driver.page_source == "<p>new</p>"
+        assert inner.source_reads == 2
+
+    def test_other_attributes_are_forwarded(self):
+        """Test lookups pass straight through to the wrapped driver."""
+        row = FakeElement("row")
+        driver = CachedDriver(FakeDriver({(By.CSS_SELECTOR, "mat-row"): [row]}))
+
+        assert find_elements_with_fallback(driver, "results_rows") == [row]
+
+
+class TestNameClassification:
+    """Test entity/individual classification."""
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("ACME HOLDINGS LLC", "Entity"),
+            ("first baptist church", "Entity"),
+            ("SUNRISE CO. OF ARIZONA", "Entity"),
+            ("MCCORMICK TIMOTHY/ROBIN", "Individual(s)"),
+            ("GREEN JEROME V", "Individual(s)"),
+            ("SMITH REAL ESTATE", "Entity"),
+            ("MADONNA", "Entity"),
+            ("", ""),
+        ],
+    )
+    def test_classify_name_type(self, name, expected):
+        """Test representative names classify as before."""
+        assert classify_name_type(name) == expected
+
+    @pytest.mark.parametrize("keyword", ENTITY_KEYWORDS)
+    def test_every_keyword_marks_entity(self, keyword):
+        """Test each keyword still matches as a substring in any case."""
+        assert ENTITY_KEYWORD_RE.search(f"SMITH{keyword}JONES")
+        assert classify_name_type(f"john x{keyword.lower()}x smith") == "Entity"
+
+    def test_keyword_pattern_has_no_uppercased_escapes(self):
+        """Test the keyword pattern is built from uppercase keywords.
+
+        Uppercasing the compiled pattern text would turn escapes such as
+        ``\\s`` or ``\\b`` into ``\\S`` or ``\\B`` and flags into ``(?I)``.
+        """
+        assert not re.search(r"\\[A-Z]|\(\?[A-Z]", ENTITY_KEYWORD_RE.pattern)
+
+    @pytest.mark.parametrize(
+        "name", ["MADONNA", "ONE TWO THREE FOUR FIVE", "SMITH REAL ESTATE"]
+    )
+    def test_non_person_shape_skips_keyword_scan(self, name, monkeypatch):
+        """Test names that cannot be persons are Entities without a scan."""
+        classify_name_type.cache_clear()
+        monkeypatch.setattr(ecorp, "ENTITY_KEYWORD_RE", None)
+
+        assert classify_name_type(name) == "Entity"
+
+    def test_repeated_names_hit_cache(self):
+        """Test a repeated owner name is classified once."""
+        classify_name_type.cache_clear()
+
+        for _ in range(3):
+            assert classify_owner_type("SMITH FAMILY TRUST") == "BUSINESS"
+
+        info = classify_name_type.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_series_matches_scalar_classifier(self):
+        """Test the bulk classifier agrees with classify_owner_type row by row."""
+        names = pd.Series(
+            [
+                "ACME HOLDINGS LLC",
+                "MCCORMICK TIMOTHY/ROBIN",
+                "smith real estate",
+                "GREEN JEROME V",
+                "MADONNA",
+                "ONE TWO THREE FOUR FIVE",
+                "  ",
+                None,
+                float("nan"),
+            ],
+            index=range(10, 19),
+        )
+
+        result = classify_owner_type_series(names)
+
+        assert result.index.equals(names.index)
+        assert result.tolist() == [classify_owner_type(n) for n in names]
+
+    def test_legacy_series_matches_scalar_classifier(self, monkeypatch):
+        """Test the legacy bulk classifier agrees with its scalar classifier."""
+        monkeypatch.setattr(ecorp_legacy, "ARROW_STRINGS", False)
+        names = pd.Series(
+            [
+                "ACME HOLDINGS LLC",
+                "MCCORMICK TIMOTHY/ROBIN",
+                "smith real estate",
+                "GREEN JEROME V",
+                "first baptist church",
+                "SUNRISE CO. OF ARIZONA",
+                "MADONNA",
+                "ONE TWO THREE FOUR FIVE",
+                "  ",
+                None,
+                float("nan"),
+            ],
+            index=range(10, 21),
+        )
+
+        result = ecorp_legacy.classify_owner_type_series(names)
+
+        assert result.index.equals(names.index)
+        assert result.tolist() == [ecorp_legacy.classify_owner_type(n) for n in names]
+
+    def test_legacy_arrow_path_matches_object_path(self, monkeypatch):
+        """Test the legacy Arrow-string classifier agrees with the fused loop."""
+        pytest.importorskip("pyarrow")
+        names = pd.Series(
+            [
+                "ACME HOLDINGS LLC",
+                "MCCORMICK TIMOTHY/ROBIN",
+                "smith real estate",
+                "GREEN  JEROME\tV",
+                "MADONNA",
+                "  ",
+                None,
+                12345,
+            ]
+        )
+
+        monkeypatch.setattr(ecorp_legacy, "ARROW_STRINGS", True)
+        arrow = ecorp_legacy.classify_owner_type_series(names)
+        monkeypatch.setattr(ecorp_legacy, "ARROW_STRINGS", False)
+
+        assert arrow.equals(ecorp_legacy.classify_owner_type_series(names))
+
+    def test_arrow_path_matches_object_path(self, monkeypatch):
+        """Test the Arrow-string classifier agrees with the fused loop."""
+        pytest.importorskip("pyarrow")
+        names = pd.Series(
+            [
+                "ACME HOLDINGS LLC",
+                "MCCORMICK TIMOTHY/ROBIN",
+                "smith real estate",
+                "GREEN  JEROME\tV",
+                "MADONNA",
+                "ONE TWO THREE FOUR FIVE",
+                "  ",
+                None,
+                float("nan"),
+                12345,
+            ],
+            index=range(10, 20),
+        )
+
+        arrow = classify_owner_type_series(names)
+        monkeypatch.setattr(ecorp, "ARROW_STRINGS", False)
+
+        assert arrow.equals(classify_owner_type_series(names))
+
+
+class TestIndividualNameParsing:
+    """Test individual owner name parsing."""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("MCCORMICK TIMOTHY/ROBIN", ["TIMOTHY MCCORMICK", "ROBIN MCCORMICK"]),
+            ("GREEN JEROME V", ["JEROME V GREEN"]),
+            ("BARATTI JAMES J/DEBORAH F TR", ["JAMES J BARATTI", "DEBORAH F BARATTI"]),
+            ("GREEN JEROME JT TEN", ["JEROME GREEN"]),
+            ("GREEN JEROME TR EST", ["JEROME GREEN"]),
+            ("", []),
+        ],
+    )
+    def test_parse_individual_names(self, raw, expected):
+        """Test the documented name patterns."""
+        assert parse_individual_names(raw) == expected
+
+    def test_series_parses_each_distinct_name_once(self):
+        """Test the bulk parser matches the scalar parser and shares results."""
+        names = pd.Series(
+            ["GREEN JEROME V", None, "GREEN JEROME V", "MCCORMICK TIMOTHY/ROBIN"],
+            index=[5, 6, 7, 8],
+        )
+
+        result = parse_individual_names_series(names)
+
+        assert result.index.equals(names.index)
+        assert result.tolist() == [
+            ["JEROME V GREEN"],
+            [],
+            ["JEROME V GREEN"],
+            ["TIMOTHY MCCORMICK", "ROBIN MCCORMICK"],
+        ]
+        assert result[5] is result[7]
+
+
+class TestPageDetection:
+    """Test login and 2FA page detection."""
+
+    def test_login_page(self):
+        """Test login prompts are detected from body text."""
+        driver = FakeDriver(body_text="Online Services Login\nEmail Address")
+
+        assert detect_login_page(driver) is True
+
+    def test_search_page_is_not_login(self):
+        """Test a search page without login prompts is not flagged."""
+        driver = FakeDriver(body_text="Business Search\nEntity Name")
+
+        assert detect_login_page(driver) is False
+
+    def test_2fa_page(self):
+        """Test 2FA prompts are detected regardless of case."""
+        driver = FakeDriver(body_text="Enter the Verification Code we sent")
+
+        assert detect_2fa_page(driver) is True
+        assert detect_2fa_page(FakeDriver(body_text="Business Search")) is False
+
+    def test_scan_page_state_uses_one_round_trip(self):
+        """Test all detectors run from a single script call."""
+        inner = SourceCountingDriver()
+        inner.script_result = [
+            "Access Denied",
+            "Online Services Login",
+            "<div class='g-recaptcha'></div>",
+            200,
+        ]
+        driver = CachedDriver(inner)
+
+        state = scan_page_state(driver)
+
+        assert state == PageState(
+            captcha=True, rate_limited=True, login=True, tfa=False
+        )
+        assert inner.scripts == [PAGE_STATE_JS]
+        assert inner.calls == []
+        assert driver.page_source == "<div class='g-recaptcha'></div>"
+        assert inner.source_reads == 0
+
+    def test_scan_page_state_clean_page(self):
+        """Test a normal search page trips no detector."""
+        driver = FakeDriver()
+        driver.script_result = [
+            "Business Search",
+            "business search",
+            "<p>ok</p>",
+            200,
+        ]
+
+        assert scan_page_state(driver) == PageState(False, False, False, False)
+
+    def test_scan_page_state_blocking_status(self):
+        """Test a 429 main-document status counts as rate limited."""
+        driver = FakeDriver()
+        driver.script_result = ["Business Search", "", "<p></p>", 429]
+
+        assert scan_page_state(driver).rate_limited is True
+
+    def test_body_text_shared_across_detectors(self):
+        """Test back-to-back detectors reuse one lowered body text fetch."""
+        driver = FakeDriver()
+        driver.script_result = "business search\nentity name"
+
+        assert detect_login_page(driver) is False
+        assert detect_2fa_page(driver) is False
+        assert detect_rate_limit(driver) is False
+        assert driver.scripts.count(BODY_TEXT_JS) == 1
+        assert driver.calls == []
+
+    def test_body_text_expires_after_ttl(self, monkeypatch):
+        """Test the lowered body text is refetched once the TTL passes."""
+        clock = [100.0]
+        monkeypatch.setattr("adhs_etl.ecorp.time.monotonic", lambda: clock[0])
+        driver = FakeDriver()
+        driver.script_result = "business search"
+
+        lowered_body_text(driver)
+        clock[0] += ecorp.BODY_TEXT_TTL
+        lowered_body_text(driver)
+
+        assert driver.scripts == [BODY_TEXT_JS, BODY_TEXT_JS]
+
+    def test_body_text_dropped_on_invalidate(self):
+        """Test a CachedDriver forgets the body text when the page changes."""
+        inner = SourceCountingDriver()
+        inner.script_result = "online services login"
+        driver = CachedDriver(inner)
+
+        assert detect_login_page(driver) is True
+        inner.script_result = "business search"
+        driver.get("https://example.test/businesssearch")
+
+        assert detect_login_page(driver) is False
+        assert inner.scripts == [BODY_TEXT_JS, BODY_TEXT_JS]
+
+    def test_body_text_falls_back_to_body_element(self):
+        """Test the body element text is lowered when scripts are unavailable."""
+        driver = BrokenScriptDriver(body_text="Online Services LOGIN")
+
+        assert lowered_body_text(driver) == "online services login"
+
+    def test_wait_until_returns_first_truthy_result(self, monkeypatch):
+        """Test polling stops as soon as the condition holds."""
+        results = iter([None, "", "ready", "late"])
+        sleeps = []
+        monkeypatch.setattr("adhs_etl.ecorp.time.sleep", sleeps.append)
+
+        assert wait_until(lambda: next(results), timeout=5) == "ready"
+        assert sleeps == [SELECTOR_POLL_INTERVAL, SELECTOR_POLL_INTERVAL]
+
+    def test_wait_until_times_out_with_none(self):
+        """Test a condition that never holds yields None within the timeout."""
+        start = time.monotonic()
+
+        assert wait_until(lambda: False, timeout=0.3) is None
+        assert time.monotonic() - start < 0.3 + SELECTOR_POLL_INTERVAL / 2
+
+    def test_wait_for_search_page_sees_login(self, monkeypatch):
+        """Test a rendered login form ends the wait without a fixed sleep."""
+        monkeypatch.setattr("adhs_etl.ecorp.time.sleep", pytest.fail)
+        driver = FakeDriver(body_text="Online Services Login\nEmail Address")
+
+        assert wait_for_search_page(driver, "search_input", timeout=10) == "login"
+
+    def test_wait_for_search_page_polls_for_search_input(self, monkeypatch):
+        """Test the wait returns once Angular renders the search input."""
+        driver = FakeDriver()
+
+        def render(seconds):
+            driver.matches[(By.CSS_SELECTOR, "input.mat-mdc-input-element")] = [
+                FakeElement("input")
+            ]
+
+        monkeypatch.setattr("adhs_etl.ecorp.time.sleep", render)
+
+        assert wait_for_search_page(driver, "search_input", timeout=10) == "search"
+
+    def test_wait_for_search_results_sees_rows(self, monkeypatch):
+        """Test rendered result rows end the wait at once."""
+        monkeypatch.setattr("adhs_etl.ecorp.time.sleep", pytest.fail)
+        driver = ScriptedDriver({(By.CSS_SELECTOR, "table tbody tr"): ["row"]})
+
+        assert ecorp.wait_for_search_results(driver, timeout=5) == "results"
+
+    def test_wait_for_search_results_sees_block(self, monkeypatch):
+        """Test observer flags end the wait when the search was blocked."""
+        monkeypatch.setattr("adhs_etl.ecorp.time.sleep", pytest.fail)
+        driver = ScriptedDriver()
+        driver.script_result = {"captcha": False, "rateLimited": True}
+
+        assert ecorp.wait_for_search_results(driver, timeout=5) == "blocked"
+
+    @pytest.mark.parametrize(
+        "state, expected",
+        [
+            ([True, False, None, None], "results"),
+            ([True, True, None, None], "no_results"),
+            ([False, False, False, True], "blocked"),
+            ([False, False, None, None], None),
+        ],
+    )
+    def test_search_outcome_from_one_script(self, state, expected):
+        """Test rows, dialog and safety flags come back in one round-trip."""
+        driver = FakeDriver()
+        driver.script_result = state
+
+        assert ecorp._search_outcome(driver) == expected
+        assert driver.scripts == [ecorp.SEARCH_STATE_JS]
+        assert driver.calls == []
+
+    def test_wait_for_search_results_times_out(self):
+        """Test a page that never settles yields None."""
+        assert ecorp.wait_for_search_results(ScriptedDriver(), timeout=0) is None
+
+
+class TestChromedriverPath:
+    """Test chromedriver path resolution."""
+
+    def test_install_runs_once(self, monkeypatch):
+        """Test webdriver-manager is only consulted on the first call."""
+        installs = []
+
+        class FakeManager:
+            def install(self):
+                installs.append(1)
+                return "/tmp/chromedriver"
+
+        monkeypatch.setattr(ecorp, "_CHROMEDRIVER_PATH", None)
+        monkeypatch.setattr(ecorp, "ChromeDriverManager", FakeManager)
+        monkeypatch.delenv("ADHS_ECORP_CHROMEDRIVER_PATH", raising=False)
+
+        assert ecorp._get_chromedriver_path() == "/tmp/chromedriver"
+        assert ecorp._get_chromedriver_path() == "/tmp/chromedriver"
+        assert len(installs) == 1
+
+    def test_env_override_skips_webdriver_manager(self, monkeypatch):
+        """Test a configured path is used without calling install()."""
+
+        class FailingManager:
+            def install(self):
+                raise AssertionError("webdriver-manager should not run")
+
+        monkeypatch.setattr(ecorp, "_CHROMEDRIVER_PATH", None)
+        monkeypatch.setattr(ecorp, "ChromeDriverManager", FailingManager)
+        monkeypatch.setenv("ADHS_ECORP_CHROMEDRIVER_PATH", "/opt/chromedriver")
+
+        assert ecorp._get_chromedriver_path() == "/opt/chromedriver"
+
+
+class FakeChrome:
+    """Records the options and CDP commands setup_driver issues."""
+
+    def __init__(self, service=None, options=None):
+        self.options = options
+        self.cdp = []
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+
+
+class TestSetupDriver:
+    """Test Chrome driver configuration."""
+
+    @pytest.fixture(autouse=True)
+    def fake_chrome(self, monkeypatch):
+        """Build FakeChrome instances instead of launching a browser."""
+        monkeypatch.setattr(ecorp, "_CHROMEDRIVER_PATH", "/tmp/chromedriver")
+        monkeypatch.setattr(ecorp, "Service", lambda path: path)
+        monkeypatch.setattr(ecorp.webdriver, "Chrome", FakeChrome)
+
+    def test_subresources_blocked_by_default(self, monkeypatch):
+        """Test images are disabled and fonts/analytics URLs blocked via CDP."""
+        monkeypatch.delenv("ADHS_ECORP_BLOCK_RESOURCES", raising=False)
+
+        driver = ecorp.setup_driver()
+
+        prefs = driver.options.experimental_options["prefs"]
+        assert prefs["profile.managed_default_content_settings.images"] == 2
+        assert (
+            "Network.setBlockedURLs",
+            {"urls": list(ecorp.BLOCKED_URL_PATTERNS)},
+        ) in driver.cdp
+        assert driver.implicit_wait == 0
+
+    def test_safety_observer_installed(self):
+        """Test the CAPTCHA/rate-limit observer runs on every new document."""
+        driver = ecorp.setup_driver()
+
+        assert (
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": ecorp.SAFETY_OBSERVER_JS},
+        ) in driver.cdp
+
+    def test_page_load_strategy_is_eager(self):
+        """Test navigation returns at DOMContentLoaded, before subresources."""
+        driver = ecorp.setup_driver()
+
+        assert driver.options.page_load_strategy == "eager"
+
+    def test_blocking_can_be_disabled(self, monkeypatch):
+        """Test the setting turns resource blocking off (e.g. for CAPTCHAs)."""
+        monkeypatch.setenv("ADHS_ECORP_BLOCK_RESOURCES", "false")
+
+        driver = ecorp.setup_driver()
+
+        assert "prefs" not in driver.options.experimental_options
+        assert all(cmd != "Network.setBlockedURLs" for cmd, _ in driver.cdp)
+
+
+class SessionChrome:
+    """Driver double for driver_session bookkeeping."""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_calls = 0
+        self.cookie_resets = 0
+        self.scripts = []
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return "about:blank"
+
+    def delete_all_cookies(self):
+        self.cookie_resets += 1
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class TestDriverSession:
+    """Test the shared Chrome session."""
+
+    @pytest.fixture(autouse=True)
+    def fake_setup(self, monkeypatch):
+        """Count setup_driver calls and start every test without a session."""
+        self.started = []
+
+        def fake_setup_driver(headless=True, profile_dir=None):
+            driver = SessionChrome()
+            self.started.append((driver, headless))
+            self.profiles.append(profile_dir)
+            return driver
+
+        self.profiles = []
+        monkeypatch.setattr(ecorp, "setup_driver", fake_setup_driver)
+        monkeypatch.setattr(ecorp, "_DRIVER", None)
+        monkeypatch.setattr(ecorp, "_DRIVER_HEADLESS", None)
+        monkeypatch.setattr(ecorp, "_DRIVER_PROFILE", None)
+
+    def test_chrome_started_once(self):
+        """Test consecutive sessions reuse one browser and reset it between."""
+        with ecorp.driver_session() as first:
+            pass
+        with ecorp.driver_session() as second:
+            pass
+
+        assert first is second
+        assert len(self.started) == 1
+        assert first.cookie_resets == 2
+        assert first.scripts == [ecorp.CLEAR_STORAGE_JS] * 2
+        assert first.quit_calls == 0
+
+    def test_reset_can_be_skipped(self):
+        """Test reset=False keeps cookies for the next session."""
+        with ecorp.driver_session(reset=False) as driver:
+            pass
+
+        assert driver.cookie_resets == 0
+
+    def test_dead_or_mismatched_browser_replaced(self):
+        """Test a crashed browser or a headless change starts a new one."""
+        with ecorp.driver_session() as first:
+            first.alive = False
+        with ecorp.driver_session() as second:
+            pass
+        with ecorp.driver_session(headless=False) as third:
+            pass
+
+        assert len({id(first), id(second), id(third)}) == 3
+        assert first.quit_calls == 1
+        assert second.quit_calls == 1
+        assert self.started[-1][1] is False
+
+    def test_profile_dir_starts_persistent_browser(self, tmp_path):
+        """Test a profile directory is passed on and a new one restarts Chrome."""
+        with ecorp.driver_session(profile_dir=tmp_path / "worker-0") as first:
+            pass
+        with ecorp.driver_session(profile_dir=tmp_path / "worker-0") as second:
+            pass
+        with ecorp.driver_session() as third:
+            pass
+
+        assert first is second
+        assert third is not first
+        assert self.profiles == [tmp_path / "worker-0", None]
+
+
+DETAIL_PAGE = """<html><head><script>var label = "Entity Type: script";</script></head>
+<body><mat-card>
+<div><span>Entity Type:</span><span> Domestic <b>LLC</b> </span></div>
+<div>Entity Status: <strong>Active</strong></div>
+<p>Formation Date:</p><!-- note --><p>01/02/2003</p>
+<h3>Statutory Agent Information</h3>
+<div>Name:
+   JOHN   AGENT
+ Appointed 2020</div>
+<div>Address:
+ 123 MAIN ST, PHOENIX AZ
+ County: Maricopa</div>
+<table id="grid_principalList"><thead><tr><th>Title</th></tr></thead><tbody>
+<tr><td>Manager</td><td> Jane <b>Doe</b></td><td></td><td>1 A St</td>
+<td>jane@example.com</td><td>(602) 555-1212</td></tr>
+<tr><td>Member</td><td>Bob</td><td></td><td>2 B St</td></tr>
+<tr><td>Manager/Member</td><td>Al</td><td></td><td>3 C St</td></tr>
+<tr><td>Director</td><td>Cy</td><td></td><td>4 D St</td></tr>
+<tr><td>incomplete</td></tr>
+</tbody></table>
+</mat-card></body></html>"""
+
+
+class TestDetailParsing:
+    """Test entity detail page parsing on the lxml tree."""
+
+    @pytest.fixture
+    def tree(self):
+        """Parsed DETAIL_PAGE."""
+        return lxml_html.fromstring(DETAIL_PAGE)
+
+    @pytest.mark.parametrize(
+        "label, expected",
+        [
+            ("Entity Type:", "DomesticLLC"),
+            ("Entity Status:", "Active"),
+            ("Formation Date:", "01/02/2003"),
+            ("Business Type:", ""),
+        ],
+    )
+    def test_field_value_follows_label(self, tree, label, expected):
+        """Test the element after a label holds its value, scripts ignored."""
+        assert get_detail_field(ecorp._VISIBLE_TEXT(tree), label) == expected
+
+    def test_all_fields_from_one_pass(self, tree):
+        """Test the one-pass index matches the per-label lookups."""
+        text_nodes = ecorp._VISIBLE_TEXT(tree)
+
+        fields = ecorp.get_detail_fields(text_nodes, ecorp.DETAIL_LABELS)
+
+        assert list(fields) == list(ecorp.DETAIL_LABELS)
+        assert fields == {
+            label: get_detail_field(text_nodes, label) for label in ecorp.DETAIL_LABELS
+        }
+        assert fields["Business Type:"] == ""
+
+    def test_statutory_agent_from_page_text(self, tree):
+        """Test the agent name and address are read from the visible text."""
+        page_text = "".join(ecorp._VISIBLE_TEXT(tree))
+
+        assert get_statutory_agent_info(page_text) == [
+            {
+                "Name": "JOHN AGENT",
+                "Address": "123 MAIN ST, PHOENIX AZ",
+                "Phone": "",
+                "Mail": "",
+            }
+        ]
+
+    def test_principals_categorized_by_title(self, tree):
+        """Test principal rows are split into Manager/Member buckets."""
+        principals = extract_principal_info(tree)
+
+        assert principals["Manager"] == [
+            {
+                "Name": "JaneDoe",
+                "Address": "1 A St",
+                "Phone": "(602) 555-1212",
+                "Mail": "jane@example.com",
+            },
+            {"Name": "Cy", "Address": "4 D St", "Phone": "", "Mail": ""},
+        ]
+        assert [p["Name"] for p in principals["Member"]] == ["Bob"]
+        assert [p["Name"] for p in principals["Manager/Member"]] == ["Al"]
+
+    def test_missing_principal_table(self):
+        """Test a page without the grid yields empty buckets."""
+        tree = lxml_html.fromstring("<html><body><p>none</p></body></html>")
+
+        assert extract_principal_info(tree) == {
+            "Manager": [],
+            "Member": [],
+            "Manager/Member": [],
+        }
+
+    def test_entity_record_from_page(self):
+        """Test a detail page fills the record's entity and people columns."""
+        record = ecorp.build_entity_record(
+            "ACME LLC", "ACME LLC", "L123", DETAIL_PAGE, "https://x/detail/1"
+        )
+
+        assert list(record) == list(get_blank_acc_record())
+        assert record["ECORP_TYPE"] == "Entity"
+        assert record["ECORP_ENTITY_ID_S"] == "L123"
+        assert record["ECORP_STATUS"] == "Active"
+        assert record["StatutoryAgent1_Name"] == "JOHN AGENT"
+        assert record["Manager1_Name"] == "JaneDoe"
+        assert record["Manager/Member1_Name"] == "Al"
+        assert record["ECORP_URL"] == "https://x/detail/1"
+
+    def test_entity_record_from_container_fragment(self):
+        """Test a detail container's outerHTML parses like the whole page."""
+        fragment = DETAIL_PAGE[
+            DETAIL_PAGE.index("<mat-card>") : DETAIL_PAGE.index("</body>")
+        ]
+        record = ecorp.build_entity_record("ACME LLC", "ACME LLC", "L123", fragment, "")
+
+        assert record == ecorp.build_entity_record(
+            "ACME LLC", "ACME LLC", "L123", DETAIL_PAGE, ""
+        )
+
+    def test_detail_html_from_container(self):
+        """Test the container HTML comes from one script call."""
+        driver = FakeDriver(page_source="<html>full</html>")
+        driver.script_result = "<main>detail</main>"
+
+        assert ecorp.detail_page_html(driver) == "<main>detail</main>"
+        assert driver.scripts == [ecorp.DETAIL_HTML_JS]
+
+    def test_detail_html_falls_back_to_page_source(self):
+        """Test a failed script still returns the whole page."""
+        driver = BrokenScriptDriver(page_source="<html>full</html>")
+
+        assert ecorp.detail_page_html(driver) == "<html>full</html>"
+
+
+class FakeResponse:
+    """requests.Response stand-in."""
+
+    def __init__(self, url, text, status_code=200):
+        self.url = url
+        self.text = text
+        self.status_code = status_code
+
+
+class FakeSession:
+    """requests.Session stand-in serving canned responses by URL."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestDetailFetch:
+    """Test fetching detail pages over HTTP."""
+
+    def test_only_rendered_detail_pages_kept(self):
+        """Test login redirects, SPA shells and errors fall back to Chrome."""
+        session = FakeSession(
+            {
+                "https://x/d/1": FakeResponse("https://x/d/1", DETAIL_PAGE),
+                "https://x/d/2": FakeResponse("https://x/login", "<form>"),
+                "https://x/d/3": FakeResponse("https://x/d/3", "<app-root>"),
+                "https://x/d/4": FakeResponse("https://x/d/4", DETAIL_PAGE, 503),
+                "https://x/d/5": ecorp.requests.ConnectionError("down"),
+            }
+        )
+        urls = [f"https://x/d/{i}" for i in range(1, 6)]
+
+        pages = ecorp.fetch_detail_pages(session, urls + ["https://x/d/1"], 5)
+
+        assert pages == {
+            "https://x/d/1": DETAIL_PAGE,
+            "https://x/d/2": None,
+            "https://x/d/3": None,
+            "https://x/d/4": None,
+            "https://x/d/5": None,
+        }
+        assert sorted(session.requested) == urls
+
+    def test_session_carries_browser_cookies(self):
+        """Test the HTTP session reuses the browser's cookies and user agent."""
+
+        class CookieDriver:
+            def get_cookies(self):
+                return [{"name": "sid", "value": "abc", "domain": "x", "path": "/"}]
+
+            def execute_script(self, script):
+                return "TestAgent/1.0"
+
+        session = ecorp.http_session_from_driver(CookieDriver())
+
+        assert session.cookies.get("sid") == "abc"
+        assert session.headers["User-Agent"] == "TestAgent/1.0"
+
+
+LEGACY_BASE = "https://ecorp.azcc.gov"
+
+
+def legacy_detail_page(status):
+    """Legacy entity detail page whose Entity Status reads ``status``."""
+    return (
+        "<html><body><h2>Entity Information</h2>"
+        f"<div><span>Entity Status:</span><span>{status}</span></div>"
+        "</body></html>"
+    )
+
+
+class FakeSearchInput(FakeElement):
+    """Search box that accepts keystrokes."""
+
+    def clear(self):
+        pass
+
+    def send_keys(self, keys):
+        pass
+
+
+class LegacySearchDriver(FakeDriver):
+    """Driver double for the legacy search: a results table plus detail tabs."""
+
+    def __init__(self, entity_ids, tab_pages):
+        rows = "".join(
+            f'<tr><td>{i}</td><td><a href="/Details/{i}">ENTITY {i}</a></td></tr>'
+            for i in entity_ids
+        )
+        super().__init__(
+            {
+                (
+                    By.CSS_SELECTOR,
+                    "input[placeholder*='Search for an Entity Name']",
+                ): [FakeSearchInput("search")],
+                (By.CSS_SELECTOR, "table tbody tr"): [FakeElement("tr")],
+            }
+        )
+        self.results_source = f"<html><table><tbody>{rows}</tbody></table></html>"
+        self.current_url = f"{LEGACY_BASE}/EntitySearch/Index"
+        self.tab_pages = tab_pages
+        self.window_handles = ["results"]
+        self.current_window = "results"
+        self.opened = []
+        self.switch_to = self
+
+    def get(self, url):
+        self.current_url = url
+
+    @property
+    def page_source(self):
+        if self.current_window == "results":
+            return self.results_source
+        return self.tab_pages[self.current_window]
+
+    @page_source.setter
+    def page_source(self, value):
+        pass
+
+    def execute_script(self, script, *args):
+        if script.startswith("window.open"):
+            self.opened.append(args[0])
+            self.window_handles.append(args[0])
+            return None
+        return super().execute_script(script, *args)
+
+    def window(self, handle):
+        self.current_window = handle
+
+    def find_elements(self, by, selector):
+        if self.current_window != "results" and "Entity Information" in selector:
+            return [FakeElement("h2")]
+        return super().find_elements(by, selector)
+
+    def close(self):
+        self.window_handles.remove(self.current_window)
+
+
+class TestLegacyDetailFetch:
+    """Test the legacy search prefetches detail pages with the shared helpers."""
+
+    def test_bad_responses_fall_back_to_tab(self, monkeypatch):
+        """Test a non-200 response or a page without the heading opens a tab."""
+        urls = [f"{LEGACY_BASE}/Details/{i}" for i in (1, 2, 3)]
+        session = FakeSession(
+            {
+                urls[0]: FakeResponse(urls[0], legacy_detail_page("Fetched")),
+                urls[1]: FakeResponse(urls[1], legacy_detail_page("Fetched"), 500),
+                urls[2]: FakeResponse(urls[2], "<html>Please wait</html>"),
+            }
+        )
+        monkeypatch.setattr(
+            ecorp_legacy, "http_session_from_driver", lambda driver: session
+        )
+        driver = LegacySearchDriver(
+            [1, 2, 3], {url: legacy_detail_page("Rendered") for url in urls}
+        )
+
+        records = ecorp_legacy.search_entities(driver, "ENTITY")
+
+        assert driver.opened == urls[1:]
+        assert driver.window_handles == ["results"]
+        assert [r["ECORP_URL"] for r in records] == urls
+        assert [r["ECORP_STATUS"] for r in records] == [
+            "Fetched",
+            "Rendered",
+            "Rendered",
+        ]
+        assert not any(r["ECORP_COMMENTS"] for r in records)
+
+
+class TestBlankRecord:
+    """Test the blank ACC record template."""
+
+    def test_copies_are_independent(self):
+        """Test callers can fill a blank record without touching the template."""
+        first = get_blank_acc_record()
+        first["ECORP_COMMENTS"] = "Rate limited"
+
+        assert get_blank_acc_record()["ECORP_COMMENTS"] == ""
+
+    def test_people_capped_at_slot_count(self):
+        """Test extra agents are dropped and missing fields stay empty."""
+        record = get_blank_acc_record()
+        agents = [{"Name": f"AGENT {i}"} for i in range(1, 6)]
+
+        ecorp._fill_people(record, "StatutoryAgent", agents)
+
+        assert [record[f"StatutoryAgent{i}_Name"] for i in (1, 2, 3)] == [
+            "AGENT 1",
+            "AGENT 2",
+            "AGENT 3",
+        ]
+        assert record["StatutoryAgent1_Phone"] == ""
+        assert list(record) == list(get_blank_acc_record())
+
+    def test_individual_names_from_every_person_column(self):
+        """Test names are collected from agents, principals and parsed owners."""
+        record = get_blank_acc_record()
+        record.update(
+            {
+                "StatutoryAgent3_Name": " john agent ",
+                "Manager/Member5_Name": "Jane Doe",
+                "IndividualName4": "BOB SMITH",
+                "Member1_Address": "not a name",
+            }
+        )
+
+        assert ecorp.extract_individual_names(record) == {
+            "JOHN AGENT",
+            "JANE DOE",
+            "BOB SMITH",
+        }
+
+    def test_field_layout(self):
+        """Test every column is present, empty, and in output order."""
+        record = get_blank_acc_record()
+        keys = list(record)
+
+        assert len(keys) == 88
+        assert set(record.values()) == {""}
+        assert keys[0] == "ECORP_SEARCH_NAME"
+        assert keys[11:15] == [
+            "StatutoryAgent1_Name",
+            "StatutoryAgent1_Address",
+            "StatutoryAgent1_Phone",
+            "StatutoryAgent1_Mail",
+        ]
+        assert keys[-5:] == [
+            "IndividualName1",
+            "IndividualName2",
+            "IndividualName3",
+            "IndividualName4",
+            "ECORP_URL",
+        ]
+
+
+class TestPersonOverlap:
+    """Test fuzzy overlap scoring between sets of individual names."""
+
+    def test_identical_and_reordered_names(self):
+        """Test token order does not matter and identical sets score 100."""
+        names = {"JOHN SMITH", "JANE DOE"}
+
+        assert ecorp.calculate_person_overlap(names, names) == 100.0
+        assert ecorp.calculate_person_overlap(names, {"SMITH JOHN", "DOE JANE"}) == (
+            100.0
+        )
+
+    def test_partial_overlap_is_bidirectional(self):
+        """Test the score averages the match rate in both directions."""
+        score = ecorp.calculate_person_overlap(
+            {"JOHN SMITH"}, {"JOHN SMITH", "ALICE WILLIAMS"}
+        )
+
+        # 1/1 names matched one way, 1/2 the other
+        assert score == 75.0
+        assert isinstance(score, float)
+
+    def test_empty_sets_score_zero(self):
+        """Test an empty name set never overlaps."""
+        assert ecorp.calculate_person_overlap(set(), {"JOHN SMITH"}) == 0.0
+        assert ecorp.calculate_person_overlap({"JOHN SMITH"}, set()) == 0.0
+
+    def test_grouping_scores_candidate_pairs_once(self, monkeypatch):
+        """Test only distinct name sets sharing a matching name are scored."""
+        calls = []
+        overlap = ecorp.calculate_person_overlap
+
+        def counting_overlap(names1, names2, threshold=85.0):
+            calls.append((names1, names2))
+            return overlap(names1, names2, threshold)
+
+        monkeypatch.setattr(ecorp, "calculate_person_overlap", counting_overlap)
+        smith = {"Manager1_Name": "JOHN SMITH", "Member1_Name": "JANE DOE"}
+        smithe = {"Manager1_Name": "JOHN SMITHE", "Member1_Name": "JANE DOE"}
+        williams = {"Manager1_Name": "ALICE WILLIAMS"}
+        results = [smith, williams, {}, williams, smithe, dict(smith)]
+
+        assert ecorp.assign_grouped_indexes_by_individuals(results) == [
+            1,
+            2,
+            3,
+            2,
+            1,
+            1,
+        ]
+        # Repeated sets are not compared again, and williams shares no
+        # matching name with either smith set
+        assert calls == [(frozenset(smithe.values()), frozenset(smith.values()))]
+
+    def test_grouping_is_transitive(self):
+        """Test records linked through a third record share one index."""
+        smith = {"Manager1_Name": "JOHN SMITH"}
+        smithson = {"Manager1_Name": "JOHN SMITHSON"}
+        smithsonian = {"Manager1_Name": "JOHN SMITHSONIAN"}
+
+        # SMITH and SMITHSONIAN are too far apart to match directly
+        direct = ecorp.calculate_person_overlap({"JOHN SMITH"}, {"JOHN SMITHSONIAN"})
+        assert direct == 0.0
+        for results in (
+            [smith, smithsonian, smithson],
+            [smithson, smith, smithsonian],
+        ):
+            assert ecorp.assign_grouped_indexes_by_individuals(results) == [1, 1, 1]
+
+
+class TestAccPool:
+    """Test parallel ACC lookups."""
+
+    @pytest.fixture(autouse=True)
+    def fake_search(self, monkeypatch):
+        """Record which driver served each search instead of opening pages."""
+        self.searches = []
+        self.release = None
+        self.comment = ""
+
+        def fake_search_entities(driver, name, settings=None):
+            self.searches.append((driver, name))
+            if self.release is not None:
+                self.release.wait(2)
+            record = get_blank_acc_record()
+            record["ECORP_SEARCH_NAME"] = name
+            record["ECORP_COMMENTS"] = self.comment
+            return [record]
+
+        monkeypatch.setattr(ecorp, "search_entities", fake_search_entities)
+        monkeypatch.setattr("adhs_etl.ecorp.time.sleep", lambda s: None)
+
+    def test_results_cached_by_name(self):
+        """Test a repeated name is searched once and served from the cache."""
+        with ecorp.AccPool(["d1"]) as pool:
+            first = pool.lookup("ACME LLC")
+            second = pool.lookup("ACME LLC")
+
+        assert first is second
+        assert self.searches == [("d1", "ACME LLC")]
+        assert pool.cache == {"ACME LLC": first}
+
+    def test_in_flight_name_not_searched_twice(self):
+        """Test submitting a name that is still running returns its future."""
+        self.release = threading.Event()
+        with ecorp.AccPool(["d1", "d2"]) as pool:
+            first = pool.submit("ACME LLC")
+            second = pool.submit("ACME LLC")
+            self.release.set()
+
+        assert first is second
+        assert len(self.searches) == 1
+
+    def test_failed_lookup_not_searched_again(self):
+        """Test a name whose queued search failed reuses that result."""
+        self.comment = "Login required - set ADHS_ECORP_EMAIL"
+        with ecorp.AccPool(["d1"]) as pool:
+            queued = pool.submit("ACME LLC")
+            failed = queued.result()
+
+            results = pool.lookup("ACME LLC")
+
+        assert results is failed
+        assert self.searches == [("d1", "ACME LLC")]
+        assert pool.searched == 1
+        assert pool.cache == {}
+
+    def test_each_worker_uses_its_own_driver(self):
+        """Test concurrent lookups never share a driver."""
+        self.release = threading.Event()
+        with ecorp.AccPool(["d1", "d2"]) as pool:
+            futures = [pool.submit("A"), pool.submit("B")]
+            deadline = time.monotonic() + 2
+            while len(self.searches) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.release.set()
+            results = [f.result()[0]["ECORP_SEARCH_NAME"] for f in futures]
+
+        assert results == ["A", "B"]
+        assert sorted(d for d, _ in self.searches) == ["d1", "d2"]
+
+    def test_rate_limit_pauses_workers(self, monkeypatch):
+        """Test a rate limit seen by one worker triggers the shared backoff."""
+        pauses = []
+        monkeypatch.setattr("adhs_etl.ecorp.time.sleep", pauses.append)
+        self.comment = "Rate limited - try again later"
+        settings = ecorp.get_ecorp_settings()
+
+        with ecorp.AccPool(["d1"], settings, backoff=30) as pool:
+            pool.lookup("ACME LLC")
+
+        assert pauses == [30]
+        assert pool._clear_to_search.is_set()
+
+    def test_requires_a_driver(self):
+        """Test an empty driver list is rejected."""
+        with pytest.raises(ValueError):
+            ecorp.AccPool([])
+
+
+class TestAccCache:
+    """Test the SQLite-backed lookup cache."""
+
+    def test_results_survive_reopen(self, tmp_path):
+        """Test a saved lookup is served by a new cache on the same file."""
+        results = [{"ECORP_NAME_S": "ACME LLC", "ECORP_COMMENTS": ""}]
+        cache = ecorp.AccCache(tmp_path / "acc.sqlite")
+        cache["ACME LLC"] = results
+        cache.close()
+
+        reopened = ecorp.AccCache(tmp_path / "acc.sqlite")
+
+        assert "ACME LLC" in reopened
+        assert reopened["ACME LLC"] == results
+        assert "OTHER LLC" not in reopened
+        assert len(reopened) == 1
+        with pytest.raises(KeyError):
+            reopened["OTHER LLC"]
+
+    def test_expired_rows_ignored_and_purged(self, tmp_path, monkeypatch):
+        """Test rows older than the TTL are misses and dropped on open."""
+        clock = [1_000_000.0]
+        monkeypatch.setattr("adhs_etl.ecorp.time.time", lambda: clock[0])
+        cache = ecorp.AccCache(tmp_path / "acc.sqlite", ttl_days=1)
+        cache["ACME LLC"] = [{}]
+
+        clock[0] += 2 * 86400
+
+        assert "ACME LLC" not in cache
+        cache.close()
+        ecorp.AccCache(tmp_path / "acc.sqlite", ttl_days=1).close()
+        longer_ttl = ecorp.AccCache(tmp_path / "acc.sqlite", ttl_days=1000)
+        assert "ACME LLC" not in longer_ttl
+
+    def test_failed_lookups_not_cached(self, monkeypatch):
+        """Test error records are returned but retried on the next call."""
+        comments = iter(["Rate limited - try again later", ""])
+
+        def fake_search_entities(driver, name, settings=None):
+            record = get_blank_acc_record()
+            record["ECORP_COMMENTS"] = next(comments)
+            return [record]
+
+        monkeypatch.setattr(ecorp, "search_entities", fake_search_entities)
+        cache = {}
+
+        first = ecorp.get_cached_or_lookup(cache, "ACME LLC", None)
+        assert first[0]["ECORP_COMMENTS"].startswith("Rate limited")
+        assert cache == {}
+
+        second = ecorp.get_cached_or_lookup(cache, "ACME LLC", None)
+        assert cache == {"ACME LLC": second}
+
+
+class TestEmptySearchCaching:
+    """Test which empty searches may be cached as "not found"."""
+
+    @pytest.fixture(autouse=True)
+    def fake_page(self, monkeypatch):
+        """Submit a search against stubbed page helpers that find no rows."""
+
+        class SearchDriver(FakeDriver):
+            current_url = "https://x/businesssearch"
+
+            def get(self, url):
+                pass
+
+        def fake_find(driver, chain, timeout=None, raise_on_failure=True):
+            if chain is ecorp._SEL_NO_RESULTS:
+                return None
+            return FakeSearchInput("search")
+
+        self.driver = SearchDriver()
+        monkeypatch.setattr(ecorp, "wait_for_search_page", lambda *a: "search")
+        monkeypatch.setattr(ecorp, "find_element_with_fallback", fake_find)
+        monkeypatch.setattr(ecorp, "find_clickable", lambda *a, **k: None)
+        monkeypatch.setattr(
+            ecorp, "scan_page_state", lambda d: ecorp.PageState(*[False] * 4)
+        )
+        monkeypatch.setattr(ecorp, "page_source_matches", lambda *a: False)
+        monkeypatch.setattr(ecorp, "dismiss_dialog", lambda d: False)
+        monkeypatch.setattr(ecorp, "snapshot_results_rows", lambda d: (None, []))
+        monkeypatch.setattr("adhs_etl.ecorp.time.sleep", lambda s: None)
+
+    def test_timed_out_search_not_cached(self, monkeypatch):
+        """Test an empty page after the wait timed out is not cached."""
+        monkeypatch.setattr(ecorp, "wait_for_search_results", lambda d, t: None)
+        cache = {}
+
+        results = ecorp.get_cached_or_lookup(cache, "ACME LLC", self.driver)
+
+        assert results[0]["ECORP_COMMENTS"].startswith("Search timed out")
+        assert cache == {}
+
+    def test_confirmed_no_results_cached(self, monkeypatch):
+        """Test a search that showed the no-results dialog is cached."""
+        monkeypatch.setattr(ecorp, "wait_for_search_results", lambda d, t: "no_results")
+        cache = {}
+
+        results = ecorp.get_cached_or_lookup(cache, "ACME LLC", self.driver)
+
+        assert results == [get_blank_acc_record()]
+        assert cache == {"ACME LLC": results}
+
+
+class TestCheckpoint:
+    """Test the append-only checkpoint log."""
+
+    def test_round_trip_appends_only_new_records(self, tmp_path):
+        """Test each save appends only records not yet written."""
+        path = tmp_path / ".checkpoint_1.25.jsonl"
+        results = [{"Owner_Ownership": "ACME LLC", "ECORP_INDEX_#": 1}]
+        ecorp.save_checkpoint(path, results, 1, 3)
+        size = path.stat().st_size
+        results.append({"Owner_Ownership": "BETA INC", "ECORP_INDEX_#": 2})
+        ecorp.save_checkpoint(path, results, 2, 3)
+
+        assert path.read_bytes().count(b"\n") == 2
+        assert path.stat().st_size > size
+        assert ecorp.load_checkpoint(path) == (results, 2, 3)
+
+    def test_partial_write_dropped(self, tmp_path):
+        """Test bytes past the cursor are ignored and then overwritten."""
+        path = tmp_path / ".checkpoint_1.25.jsonl"
+        results = [{"Owner_Ownership": "ACME LLC"}]
+        ecorp.save_checkpoint(path, results, 1, 2)
+        with open(path, "ab") as f:
+            f.write(b'{"Owner_Own')
+
+        assert ecorp.load_checkpoint(path) == (results, 1, 2)
+
+        results.append({"Owner_Ownership": "BETA INC"})
+        ecorp.save_checkpoint(path, results, 2, 2)
+        assert ecorp.load_checkpoint(path) == (results, 2, 2)
+
+    def test_missing_and_cleared(self, tmp_path):
+        """Test no checkpoint loads as None, including after clearing."""
+        path = tmp_path / ".checkpoint_1.25.jsonl"
+        assert ecorp.load_checkpoint(path) is None
+
+        ecorp.save_checkpoint(path, [{"COUNTY": "MARICOPA"}], 1, 1)
+        ecorp.clear_checkpoint(path)
+
+        assert ecorp.load_checkpoint(path) is None
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestExcelOutput:
+    """Test the row-streaming Excel writer."""
+
+    def test_matches_pandas_to_excel(self, tmp_path):
+        """Test the written sheet reads back the same as DataFrame.to_excel."""
+        df = pd.DataFrame(
+            {
+                "FULL_ADDRESS": ["1 MAIN ST", "2 OAK AVE"],
+                "COUNTY": ["MARICOPA", None],
+                "ECORP_INDEX_#": [1, 2],
+                "ECORP_NAME_S": ["ACME LLC", ""],
+            }
+        )
+        df.to_excel(tmp_path / "pandas.xlsx", index=False, engine="xlsxwriter")
+
+        ecorp.write_excel_rows(df, tmp_path / "rows.xlsx")
+
+        pd.testing.assert_frame_equal(
+            pd.read_excel(tmp_path / "rows.xlsx"),
+            pd.read_excel(tmp_path / "pandas.xlsx"),
+        )
+
+
+class TestDriverPool:
+    """Test the warm driver pool."""
+
+    def test_start_assigns_profiles_per_slot(self, monkeypatch, tmp_path):
+        """Test each started driver gets its own persistent profile."""
+        started = []
+
+        def fake_setup_driver(headless=True, profile_dir=None):
+            driver = SessionChrome()
+            started.append(profile_dir)
+            return driver
+
+        monkeypatch.setattr(ecorp, "setup_driver", fake_setup_driver)
+        settings = ecorp.get_ecorp_settings(profile_dir=tmp_path)
+
+        pool = ecorp.DriverPool.start(2, settings=settings, first_slot=1)
+
+        assert len(pool) == 2
+        assert sorted(started) == [tmp_path / "worker-1", tmp_path / "worker-2"]
+
+    def test_failed_start_quits_the_others(self, monkeypatch):
+        """Test a driver that fails to start does not leak the rest."""
+        started = []
+
+        def fake_setup_driver(headless=True, profile_dir=None):
+            if started:
+                raise RuntimeError("chrome crashed")
+            started.append(SessionChrome())
+            return started[0]
+
+        monkeypatch.setattr(ecorp, "setup_driver", fake_setup_driver)
+        monkeypatch.setattr(
+            ecorp, "ThreadPoolExecutor", lambda max_workers: FakeExecutor()
+        )
+
+        with pytest.raises(RuntimeError):
+            ecorp.DriverPool.start(2)
+        assert started[0].quit_calls == 1
+
+    def test_acquire_returns_driver(self):
+        """Test a borrowed driver goes back to the pool."""
+        pool = ecorp.DriverPool(["d1"])
+
+        with pool.acquire() as driver:
+            assert driver == "d1"
+            assert pool._idle.empty()
+
+        assert pool._idle.get_nowait() == "d1"
+        assert pool.slot(driver) == 0
+
+
+class FakeExecutor:
+    """ThreadPoolExecutor stand-in that runs submissions in order."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future